@@ -0,0 +1,270 @@
+"""
+app.py 헤드리스 부하 테스트 (streamlit.testing.v1.AppTest).
+
+여러 프로세스에서 가상 학생 세션을 동시에 실행하여 다음 흐름을 반복합니다.
+세션마다 서로 다른 학생 계정(bench-N@example.com)을 만들어 사용하므로, 리포트 목록/요약/캐시가 한 사용자에게 몰리지 않습니다.
+  1. 로그인 페이지 → 이메일/비밀번호 로그인 폼 (perform_login)
+  2. 리포트 기록 페이지 진입 후 리포트 저장
+  3. 나의 기록 보기 페이지 → 홈으로 돌아가기
+  4. 프로그램 목록 페이지
+
+리포트 입력 폼은 iframe(선언형 컴포넌트)이라 AppTest로 입력할 수 없으므로, 폼이 '저장'을 눌렀을 때 돌려주는 값
+({'reportData', 'submitted', 'submissionId'})을 대신 돌려주도록 컴포넌트만 바꿉니다. 저장은 실제 페이지의
+제출 처리(save_report_to_firestore → prepare_report 검사 → 쓰기 대기열 → 공유 저장소)를 그대로 거칩니다.
+
+결과: 초당 rerun 수, 단계별 p50/p99 지연 시간(ms), 세션당 RSS 증가량(KB).
+기준값(baseline JSON)과 비교하여 회귀를 찾을 수 있습니다.
+
+실행 예:
+  python benchmarks/bench_app.py --processes 8 --sessions 500
+  python benchmarks/bench_app.py --sessions 100 --update-baseline     # 기준값 저장
+  python benchmarks/bench_app.py --sessions 100 --compare             # 기준값과 비교 (회귀 시 종료 코드 1)
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+from multiprocessing import Pool
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BENCH_DIR, '..', 'jobstraveling', 'app.py')
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baseline_app.json')
+REGRESSION_TOLERANCE = 1.25  # p99가 기준값보다 25% 이상 느려지면 회귀로 판단
+BENCH_PASSWORD = 'bench-password'
+
+
+def _percentile(values, quantile):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(quantile * (len(values) - 1))))]
+
+
+def _rss_kb():
+    # Linux에서 ru_maxrss 단위는 KB입니다.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+# 가짜 리포트 폼이 다음 렌더링에서 돌려줄 제출 값 (워커 프로세스 안에서 세션을 순서대로 실행하므로 하나면 충분)
+_pending_submission = None
+
+
+def _fake_report_form(**kwargs):
+    return _pending_submission if _pending_submission is not None else kwargs.get('default')
+
+
+def _install_fake_report_form():
+    """리포트 입력 폼 컴포넌트를 제출 값을 돌려주는 함수로 바꿉니다. (나머지 저장 경로는 앱 그대로)"""
+    from views import add_report
+    add_report.get_report_form_component = lambda: _fake_report_form
+
+
+_password_hash = None
+
+
+def _register_student(session_number):
+    """세션마다 다른 학생 계정을 공유 계정 저장소에 등록하고 이메일을 반환합니다."""
+    global _password_hash
+    import runtime
+    from auth import hash_password
+
+    if _password_hash is None:
+        _password_hash = hash_password(BENCH_PASSWORD)
+    email = f"bench-{session_number}@example.com"
+    runtime.get_user_registry().ensure({
+        'email': email,
+        'passwordHash': _password_hash,
+        'schoolName': f"부하 테스트 학교 {session_number % 10}",
+        'classNumber': str(session_number % 30 + 1),
+        'studentName': f"학생{session_number}",
+        'birthDate': '2008-01-01',
+        'isAdmin': False,
+    })
+    return email
+
+
+class SessionRunner:
+    """AppTest 세션 하나의 단계별 rerun 시간을 기록합니다."""
+
+    def __init__(self, timings):
+        from streamlit.testing.v1 import AppTest
+
+        self.timings = timings
+        self.reruns = 0
+        self.app = AppTest.from_file(APP_PATH, default_timeout=60)
+
+    def step(self, name, action):
+        started = time.perf_counter()
+        action()
+        self.timings.setdefault(name, []).append((time.perf_counter() - started) * 1000)
+        self.reruns += 1
+        if self.app.exception:
+            raise RuntimeError(f"{name} 단계에서 예외 발생: {self.app.exception}")
+
+    def click(self, key):
+        return lambda: self.app.button(key=key).click().run()
+
+    def login(self, email):
+        self.app.text_input(key='login_email').input(email)
+        self.app.text_input(key='login_password').input(BENCH_PASSWORD)
+        next(button for button in self.app.button if button.label == "로그인").click().run()
+        if self.app.session_state['current_page'] != 'home':
+            raise RuntimeError(f"{email} 로그인 실패")
+
+    def save_report(self, session_number):
+        # 폼 제출 값을 넘겨 add_report 페이지가 저장을 처리하게 합니다. (저장 후 st.rerun으로 성공 화면까지 렌더링)
+        global _pending_submission
+        _pending_submission = {
+            'reportData': {
+                'programName': f'부하 테스트 프로그램 {session_number % 20}',
+                'experienceDate': '2025-01-10',
+                'jobField': 'IT/소프트웨어',
+                'rating': session_number % 6,
+                'reportContent': '부하 테스트로 작성된 리포트입니다. ' * 10,
+            },
+            'submitted': True,
+            'submissionId': f"bench-{session_number}",
+        }
+        try:
+            self.app.run()
+        finally:
+            _pending_submission = None
+        if self.app.session_state['saved_report_submission_id'] != f"bench-{session_number}":
+            raise RuntimeError(f"리포트 저장 실패: {[element.value for element in self.app.error]}")
+
+    def run(self, session_number):
+        email = _register_student(session_number)
+        self.step('login_page', self.app.run)
+        self.step('login', lambda: self.login(email))
+        self.step('add_report_page', self.click('navigate_to_report_from_home'))
+        self.step('save_report', lambda: self.save_report(session_number))
+        self.app.session_state['current_page'] = 'view_reports'
+        self.step('view_reports', self.app.run)
+        self.step('back_home', self.click('back_to_home_from_view_reports'))
+        self.step('program_list', self.click('navigate_to_program_list_from_home'))
+
+
+def run_worker(args):
+    """한 프로세스에서 sessions개의 세션을 순서대로 실행합니다."""
+    worker_number, sessions = args
+    sys.path.insert(0, os.path.dirname(APP_PATH))
+    _install_fake_report_form()
+    timings = {}
+    reruns = 0
+    errors = []
+    rss_before = _rss_kb()
+    started = time.perf_counter()
+    for i in range(sessions):
+        runner = SessionRunner(timings)
+        try:
+            runner.run(worker_number * sessions + i)
+        except Exception as e:  # 한 세션의 실패로 전체 측정을 멈추지 않습니다.
+            errors.append(str(e))
+        reruns += runner.reruns
+    return {
+        'timings': timings,
+        'reruns': reruns,
+        'elapsed': time.perf_counter() - started,
+        'rss_growth_kb': _rss_kb() - rss_before,
+        'sessions': sessions,
+        'errors': errors,
+    }
+
+
+def run_benchmark(processes, sessions):
+    data_dir = tempfile.mkdtemp(prefix='jobstraveling-bench-')
+    os.environ['JOBSTRAVELING_STORAGE'] = 'sqlite'
+    os.environ['JOBSTRAVELING_DB_PATH'] = os.path.join(data_dir, 'bench.db')
+
+    per_process = [sessions // processes + (1 if i < sessions % processes else 0) for i in range(processes)]
+    started = time.perf_counter()
+    with Pool(processes) as pool:
+        results = pool.map(run_worker, [(i, n) for i, n in enumerate(per_process) if n])
+    wall_time = time.perf_counter() - started
+
+    timings = {}
+    for result in results:
+        for name, values in result['timings'].items():
+            timings.setdefault(name, []).extend(values)
+    total_reruns = sum(r['reruns'] for r in results)
+    return {
+        'processes': processes,
+        'sessions': sessions,
+        'wall_time_s': round(wall_time, 2),
+        'reruns_per_sec': round(total_reruns / wall_time, 2) if wall_time else 0.0,
+        'rss_per_session_kb': round(sum(r['rss_growth_kb'] for r in results) / max(1, sessions), 1),
+        'errors': sum(len(r['errors']) for r in results),
+        'first_error': next((r['errors'][0] for r in results if r['errors']), None),
+        'steps': {
+            name: {
+                'count': len(values),
+                'p50_ms': round(_percentile(values, 0.5), 2),
+                'p99_ms': round(_percentile(values, 0.99), 2),
+            }
+            for name, values in sorted(timings.items())
+        },
+    }
+
+
+def compare_with_baseline(report, baseline):
+    """p99 지연 시간과 초당 rerun 수를 기준값과 비교하여 회귀 목록을 반환합니다."""
+    regressions = []
+    for name, step in report['steps'].items():
+        base = baseline.get('steps', {}).get(name)
+        if base and step['p99_ms'] > base['p99_ms'] * REGRESSION_TOLERANCE:
+            regressions.append(f"{name}: p99 {base['p99_ms']}ms → {step['p99_ms']}ms")
+    if report['reruns_per_sec'] * REGRESSION_TOLERANCE < baseline.get('reruns_per_sec', 0):
+        regressions.append(f"reruns/sec {baseline['reruns_per_sec']} → {report['reruns_per_sec']}")
+    return regressions
+
+
+def print_report(report):
+    print(f"세션 {report['sessions']}개 / 프로세스 {report['processes']}개 · {report['wall_time_s']}초")
+    print(f"reruns/sec: {report['reruns_per_sec']} · 세션당 RSS 증가: {report['rss_per_session_kb']}KB · 오류: {report['errors']}")
+    if report['first_error']:
+        print(f"  첫 번째 오류: {report['first_error']}")
+    print(f"{'단계':20s} {'횟수':>6s} {'p50(ms)':>10s} {'p99(ms)':>10s}")
+    for name, step in report['steps'].items():
+        print(f"{name:20s} {step['count']:6d} {step['p50_ms']:10.2f} {step['p99_ms']:10.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="app.py 헤드리스 부하 테스트")
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--sessions', type=int, default=50, help="전체 가상 학생 세션 수")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="기준값 JSON 경로")
+    parser.add_argument('--update-baseline', action='store_true', help="이번 결과를 기준값으로 저장")
+    parser.add_argument('--compare', action='store_true', help="기준값과 비교하여 회귀 시 종료 코드 1")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(max(1, args.processes), args.sessions)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"기준값 저장: {args.baseline}")
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"기준값 파일이 없습니다: {args.baseline} (--update-baseline으로 먼저 생성하세요)")
+            return 1
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_with_baseline(report, json.load(f))
+        if regressions:
+            print("⚠️ 성능 회귀:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("기준값 대비 회귀 없음")
+    return 1 if report['errors'] else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
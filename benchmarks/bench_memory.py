@@ -0,0 +1,133 @@
+"""
+리포트/프로그램 메모리 사용량 벤치마크 (tracemalloc).
+
+같은 리포트 N건을 (1) 지금까지의 방식대로 dict 목록으로 보관할 때와 (2) InMemoryReportRepository가
+ReportRecord(records.py)로 보관할 때의 리포트당 바이트 수를 비교합니다. 프로그램은 ProgramCatalog의
+ProgramRecord 보관분과 dict 목록을 같은 방식으로 비교합니다.
+
+리포트는 실제 저장 경로처럼 JSON에서 디코딩한 dict로 만들어, 같은 값이라도 레코드마다 다른 문자열 객체를 갖게 합니다.
+(dict 쪽은 활동 요약(_totals) 없이 목록과 ID 색인만 재므로, 저장소 쪽 수치가 불리하게 측정됩니다)
+
+실행 예:
+  python benchmarks/bench_memory.py
+  python benchmarks/bench_memory.py --reports 50000 --content-chars 600
+"""
+import os
+import sys
+import gc
+import json
+import random
+import argparse
+import tracemalloc
+from datetime import datetime, timedelta
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'jobstraveling'))
+
+from storage import InMemoryReportRepository  # noqa: E402
+from catalog import ProgramCatalog  # noqa: E402
+from ids import new_report_id  # noqa: E402
+
+JOB_FIELDS = ['IT/소프트웨어', '건설/환경', '과학/연구', '의료/보건', '예술/디자인', '교육', '금융/경영']
+SCHOOLS = ['한빛중학교', '새솔고등학교', '푸른중학교', '미래고등학교']
+PROGRAM_NAMES = [f"{field} 진로 체험 {i}" for field in JOB_FIELDS for i in range(1, 6)]
+CONTENT_WORDS = ['오늘', '체험에서', '새로운', '경험을', '했다', '직업', '현장', '선생님께서', '설명해', '주셨고', '재미있었다', '앞으로']
+
+
+def make_report_json(rng, index, content_chars):
+    created_at = datetime(2025, 3, 1) + timedelta(minutes=index, microseconds=rng.randrange(1_000_000))
+    content = ''
+    while len(content) < content_chars:
+        content += rng.choice(CONTENT_WORDS) + ' '
+    report = {
+        'programName': rng.choice(PROGRAM_NAMES),
+        'experienceDate': (datetime(2025, 3, 1) + timedelta(days=rng.randrange(60))).date().isoformat(),
+        'jobField': rng.choice(JOB_FIELDS),
+        'rating': rng.randint(1, 5),
+        'reportContent': content[:content_chars],
+        'createdAt': created_at.isoformat(),
+        'schoolName': rng.choice(SCHOOLS),
+        'classNumber': str(rng.randint(1, 10)),
+        'studentName': f"학생{rng.randrange(500)}",
+    }
+    return f"student{rng.randrange(500)}@example.com", json.dumps(report, ensure_ascii=False)
+
+
+def measure(build):
+    """build()가 만든 객체가 차지하는 바이트 수를 반환합니다. (객체는 측정이 끝날 때까지 살려 둡니다)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return used
+
+
+def bench_reports(count, content_chars):
+    rng = random.Random(42)
+    rows = [make_report_json(rng, i, content_chars) for i in range(count)]
+
+    def as_dicts():
+        # 이전 InMemoryReportRepository와 같은 보관 방식: {userId: [report dict]} + {id: (userId, report)}
+        reports, by_id = {}, {}
+        for user_id, payload in rows:
+            report = json.loads(payload)
+            report['id'] = new_report_id(report['createdAt'])
+            reports.setdefault(user_id, []).append(report)
+            by_id[report['id']] = (user_id, report)
+        return reports, by_id
+
+    def as_records():
+        repository = InMemoryReportRepository()
+        for user_id, payload in rows:
+            repository.add_report(user_id, json.loads(payload))
+        return repository
+
+    content_bytes = measure(lambda: [json.loads(payload)['reportContent'] for _, payload in rows])
+    dict_bytes = measure(as_dicts)
+    record_bytes = measure(as_records)
+    return {
+        'content': content_bytes / count,
+        'dict': dict_bytes / count,
+        'record': record_bytes / count,
+    }
+
+
+def bench_programs(count):
+    rng = random.Random(7)
+    rows = [json.dumps({
+        'id': str(i), 'name': rng.choice(PROGRAM_NAMES), 'field': rng.choice(JOB_FIELDS),
+        'description': '현장 전문가와 함께하는 진로 체험 프로그램', 'date': f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        'location': rng.choice(['온라인', '서울 건축센터', '대학 강당', '과학관']),
+    }, ensure_ascii=False) for i in range(count)]
+
+    dict_bytes = measure(lambda: {program['id']: program for program in map(json.loads, rows)})
+    catalog_bytes = measure(lambda: ProgramCatalog(map(json.loads, rows)))
+    return {'dict': dict_bytes / count, 'record': catalog_bytes / count}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="리포트/프로그램 메모리 사용량 벤치마크")
+    parser.add_argument('--reports', type=int, default=20000, help="리포트 수")
+    parser.add_argument('--content-chars', type=int, default=300, help="소감 본문 길이(글자)")
+    parser.add_argument('--programs', type=int, default=5000, help="프로그램 수")
+    args = parser.parse_args(argv)
+
+    reports = bench_reports(args.reports, args.content_chars)
+    print(f"리포트 {args.reports}건 (본문 {args.content_chars}자, 본문 문자열 자체 {reports['content']:.0f} B/건)")
+    print(f"  dict 보관          {reports['dict']:10.0f} B/건   (본문 제외 {reports['dict'] - reports['content']:.0f} B)")
+    print(f"  ReportRecord 보관  {reports['record']:10.0f} B/건   (본문 제외 {reports['record'] - reports['content']:.0f} B, 인덱스/요약 포함)")
+    print(f"  절감               {1 - reports['record'] / reports['dict']:10.1%}")
+
+    programs = bench_programs(args.programs)
+    print(f"프로그램 {args.programs}건")
+    print(f"  dict 보관          {programs['dict']:10.0f} B/건")
+    print(f"  ProgramCatalog     {programs['record']:10.0f} B/건   (field/location/날짜 인덱스 포함)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
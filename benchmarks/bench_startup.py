@@ -0,0 +1,126 @@
+"""
+app.py 시작/rerun 시간 벤치마크 (streamlit.testing.v1.AppTest).
+
+새 프로세스에서 앱을 처음 실행해 첫 화면(로그인)이 그려질 때까지의 시간과,
+로그인 후 홈/프로그램 목록 페이지에서 rerun 한 번에 걸리는 시간을 측정합니다.
+첫 실행은 import 비용이 포함되므로 측정마다 새 프로세스를 띄웁니다.
+
+--ref를 주면 해당 git 리비전의 jobstraveling 폴더를 임시 폴더에 풀어 같은 방식으로 측정하고 나란히 비교합니다.
+(예: 페이지 레지스트리 도입 전후 비교)
+
+실행 예:
+  python benchmarks/bench_startup.py
+  python benchmarks/bench_startup.py --ref HEAD~1 --repeat 5 --reruns 50
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+APP_DIR = os.path.join(REPO_DIR, 'jobstraveling')
+
+
+def _percentile(values, quantile):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(quantile * (len(values) - 1))))]
+
+
+def measure_once(app_dir, reruns):
+    """(하위 프로세스에서 실행) 첫 렌더 시간과 페이지별 rerun 시간을 측정해 dict로 반환합니다."""
+    from streamlit.testing.v1 import AppTest  # streamlit import 자체는 두 버전에 공통이므로 측정에서 제외합니다.
+
+    sys.path.insert(0, app_dir)
+    app = AppTest.from_file(os.path.join(app_dir, 'app.py'), default_timeout=60)
+
+    started = time.perf_counter()
+    app.run()
+    first_render_ms = (time.perf_counter() - started) * 1000
+    if app.exception:
+        raise RuntimeError(f"첫 실행에서 예외 발생: {app.exception}")
+
+    def timed_reruns():
+        timings = []
+        for _ in range(reruns):
+            started = time.perf_counter()
+            app.run()
+            timings.append((time.perf_counter() - started) * 1000)
+        if app.exception:
+            raise RuntimeError(f"rerun에서 예외 발생: {app.exception}")
+        return timings
+
+    result = {'first_render_ms': first_render_ms, 'reruns': {'login': timed_reruns()}}
+    app.button(key='mock_login_normal').click().run()
+    result['reruns']['home'] = timed_reruns()
+    app.button(key='navigate_to_program_list_from_home').click().run()
+    result['reruns']['program_list'] = timed_reruns()
+    return result
+
+
+def run_app(app_dir, repeat, reruns):
+    """측정마다 새 프로세스(빈 SQLite DB)에서 measure_once를 실행하고 결과를 모읍니다."""
+    first_render = []
+    rerun_timings = {}
+    for _ in range(repeat):
+        env = dict(os.environ)
+        env['JOBSTRAVELING_STORAGE'] = 'sqlite'
+        env['JOBSTRAVELING_DB_PATH'] = os.path.join(tempfile.mkdtemp(prefix='jobstraveling-startup-'), 'bench.db')
+        output = subprocess.run(
+            [sys.executable, __file__, '--worker', app_dir, '--reruns', str(reruns)],
+            env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        first_render.append(result['first_render_ms'])
+        for page, values in result['reruns'].items():
+            rerun_timings.setdefault(page, []).extend(values)
+    return {
+        'first_render_ms': round(sum(first_render) / len(first_render), 1),
+        'rerun_p50_ms': {page: round(_percentile(values, 0.5), 2) for page, values in rerun_timings.items()},
+    }
+
+
+def export_revision(ref):
+    """git 리비전의 jobstraveling 폴더를 임시 폴더에 풀고 그 경로를 반환합니다."""
+    target = tempfile.mkdtemp(prefix='jobstraveling-ref-')
+    archive = subprocess.run(['git', 'archive', ref, 'jobstraveling'], cwd=REPO_DIR, check=True, capture_output=True).stdout
+    subprocess.run(['tar', '-x', '-C', target], input=archive, check=True)
+    return os.path.join(target, 'jobstraveling')
+
+
+def print_results(results):
+    labels = list(results)
+    print(f"{'지표':28s}" + ''.join(f"{label:>16s}" for label in labels))
+    print(f"{'첫 렌더(ms)':28s}" + ''.join(f"{results[label]['first_render_ms']:16.1f}" for label in labels))
+    for page in results[labels[0]]['rerun_p50_ms']:
+        row = f"{'rerun p50 ' + page + '(ms)':28s}"
+        row += ''.join(f"{results[label]['rerun_p50_ms'].get(page, 0.0):16.2f}" for label in labels)
+        print(row)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="app.py 시작/rerun 시간 벤치마크")
+    parser.add_argument('--ref', help="비교할 git 리비전 (예: HEAD~1)")
+    parser.add_argument('--repeat', type=int, default=3, help="새 프로세스로 측정할 횟수")
+    parser.add_argument('--reruns', type=int, default=30, help="페이지별 rerun 측정 횟수")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(measure_once(args.worker, args.reruns)))
+        return 0
+
+    results = {'current': run_app(APP_DIR, args.repeat, args.reruns)}
+    if args.ref:
+        results[args.ref] = run_app(export_revision(args.ref), args.repeat, args.reruns)
+    print_results(results)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,45 @@
+"""
+HTML 템플릿 렌더링 마이크로벤치마크.
+
+기존 방식(매 렌더마다 파일을 읽고 str.replace를 연쇄 호출)과
+TemplateCache + Template.render(프로세스 단위 캐시, 단일 패스 치환)의 렌더 1회당 비용을 비교합니다.
+
+실행: python benchmarks/bench_templates.py
+"""
+import os
+import sys
+import json
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'jobstraveling'))
+
+from templates import TemplateCache  # noqa: E402
+
+HTML_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'jobstraveling', 'htmls')
+CONTEXT = {
+    'FIREBASE_CONFIG': json.dumps({'apiKey': 'demo', 'projectId': 'jobstraveling'}),
+    'INITIAL_AUTH_TOKEN': 'token',
+    'APP_ID': 'default-app-id',
+}
+
+
+def render_before(file_name):
+    with open(os.path.join(HTML_DIR, file_name), 'r', encoding='utf-8') as f:
+        html = f.read()
+    for name, value in CONTEXT.items():
+        html = html.replace('{{' + name + '}}', value)
+    return html
+
+
+def main(number=2000):
+    cache = TemplateCache(HTML_DIR)
+    for file_name in ('program_list.html', 'view_reports.html'):
+        assert render_before(file_name) == cache.get(file_name).render(CONTEXT)
+        before = timeit.timeit(lambda: render_before(file_name), number=number) / number
+        after = timeit.timeit(lambda: cache.get(file_name).render(CONTEXT), number=number) / number
+        print(f"{file_name:20s} before: {before * 1e6:8.1f} µs/render  "
+              f"after: {after * 1e6:8.1f} µs/render  ({before / after:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
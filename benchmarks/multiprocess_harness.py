@@ -0,0 +1,202 @@
+"""
+여러 서버 프로세스 공유 상태 점검 (streamlit.testing.v1.AppTest).
+
+로드 밸런서 뒤에서 Streamlit 서버 여러 개가 같은 공유 저장소(SQLite 파일)를 쓰는 상황을 흉내 내어,
+서로 다른 두 프로세스(A, B)에서 앱을 실행하고 다음을 확인합니다.
+  1. A에서 로그인한 브라우저가 세션 쿠키를 보내며 B에 접속하면 다시 로그인하지 않아도 홈 화면이 열린다.
+     (URL 쿼리 파라미터에는 세션 토큰이 없다)
+  2. A가 저장한 리포트가 B의 '나의 기록 보기'(render_view_reports_page)에 표시된다.
+  3. B가 리포트 검색 색인을 만든 뒤 A가 새 리포트를 저장해도, B의 검색 결과에 새 리포트가 나온다.
+     (B의 결과 캐시는 공유 태그 버전을 RESULT_CACHE_CHECK_MS마다 확인하므로 그 시간이 지난 뒤에 확인합니다)
+  4. A가 추가한 프로그램이 B의 프로그램 카탈로그에 반영되고, 관리자가 B에서 같은 프로그램(이름/일자/장소)을
+     다시 등록하면 중복으로 제외된다.
+  5. A에서 로그아웃하면 B에서도 같은 토큰이 더 이상 유효하지 않다.
+
+리포트 입력 폼은 iframe(컴포넌트)이라 AppTest로 제출할 수 없으므로, 저장은 A 프로세스 안에서
+폼 제출과 같은 경로(prepare_report → 쓰기 대기열 get_report_writer)로 수행합니다.
+
+실행: python benchmarks/multiprocess_harness.py   (실패 시 종료 코드 1)
+"""
+import os
+import sys
+import time
+import uuid
+import tempfile
+import multiprocessing
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.join(BENCH_DIR, '..', 'jobstraveling')
+APP_PATH = os.path.join(APP_DIR, 'app.py')
+RESULT_CACHE_CHECK_MS = 200
+
+
+class AppProcess:
+    """AppTest 세션 하나를 가진 서버 프로세스. 명령을 Pipe로 받아 실행하고 결과를 돌려줍니다."""
+
+    def __init__(self):
+        from streamlit.testing.v1 import AppTest
+
+        sys.path.insert(0, APP_DIR)
+        self.app = AppTest.from_file(APP_PATH, default_timeout=60)
+
+    def run(self):
+        self.app.run()
+        if self.app.exception:
+            raise RuntimeError(str(self.app.exception))
+
+    def login(self):
+        self.run()
+        self.app.button(key='mock_login_normal').click()
+        self.run()
+        return self.app.session_state['auth_token'], dict(self.app.query_params)
+
+    def open_with_session_cookie(self, token):
+        # AppTest는 쿠키를 보낼 수 없으므로, 브라우저가 연결 요청에 실어 보낸 쿠키를 읽는 함수만 바꿉니다.
+        import runtime
+        read_session_cookie = runtime.read_session_cookie
+        runtime.read_session_cookie = lambda: token
+        try:
+            self.run()
+        finally:
+            runtime.read_session_cookie = read_session_cookie
+        return self.app.session_state['current_page']
+
+    def save_report(self, report):
+        import runtime
+        from validation import prepare_report
+
+        profile = self.app.session_state['user_data']
+        prepared, error_message = prepare_report(report, profile)
+        if error_message:
+            raise RuntimeError(error_message)
+        return runtime.get_report_writer().save(profile['email'], prepared)['id']
+
+    def view_reports(self, search_query=''):
+        self.app.session_state['current_page'] = 'view_reports'
+        self.app.session_state['report_search_query'] = search_query
+        self.run()
+        return [element.value for element in self.app.subheader]
+
+    def add_program(self, program):
+        import runtime
+        return runtime.add_program_to_catalog(program)['id']
+
+    def create_programs(self, programs):
+        import runtime
+        saved_programs, rejects = runtime.create_programs(programs)
+        return [program['id'] for program in saved_programs], rejects
+
+    def has_program(self, program_id):
+        import runtime
+        return runtime.get_program_catalog().get_program(program_id) is not None
+
+    def logout(self):
+        self.app.session_state['current_page'] = 'home'
+        self.run()
+        self.app.button(key='logout_btn').click()
+        self.run()
+
+    def is_token_valid(self, token):
+        import runtime
+        return runtime.get_session_token_store().resolve(token) is not None
+
+
+def serve(connection, db_path):
+    os.environ['JOBSTRAVELING_STORAGE'] = 'sqlite'
+    os.environ['JOBSTRAVELING_DB_PATH'] = db_path
+    os.environ['JOBSTRAVELING_RESULT_CACHE_CHECK_MS'] = str(RESULT_CACHE_CHECK_MS)
+    process = AppProcess()
+    while True:
+        command, args = connection.recv()
+        if command == 'stop':
+            return
+        try:
+            connection.send(('ok', getattr(process, command)(*args)))
+        except Exception as e:  # 실패는 부모 프로세스에서 보고합니다.
+            connection.send(('error', f"{type(e).__name__}: {e}"))
+
+
+class Remote:
+    def __init__(self, name, db_path):
+        context = multiprocessing.get_context('spawn')
+        self.name = name
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=serve, args=(child, db_path), daemon=True)
+        self.process.start()
+
+    def __getattr__(self, command):
+        def call(*args):
+            self.connection.send((command, args))
+            status, value = self.connection.recv()
+            if status == 'error':
+                raise RuntimeError(f"[{self.name}] {command}: {value}")
+            return value
+        return call
+
+    def close(self):
+        self.connection.send(('stop', ()))
+        self.process.join(timeout=10)
+
+
+def sample_report(program_name, content):
+    return {
+        'programName': program_name,
+        'experienceDate': '2025-01-10',
+        'jobField': 'IT/소프트웨어',
+        'rating': 4,
+        'reportContent': content,
+    }
+
+
+def main():
+    db_path = os.path.join(tempfile.mkdtemp(prefix='jobstraveling-multiprocess-'), 'shared.db')
+    server_a, server_b = Remote('A', db_path), Remote('B', db_path)
+    checks = []
+
+    def check(description, passed):
+        checks.append(passed)
+        print(f"{'✅' if passed else '❌'} {description}")
+
+    try:
+        token, query_params = server_a.login()
+        check("로그인 후 URL 쿼리 파라미터에 세션 토큰이 없다", token not in str(query_params))
+        check("A에서 받은 세션 쿠키로 B에 접속하면 홈 화면이 열린다", server_b.open_with_session_cookie(token) == 'home')
+
+        first_name = f"다중 프로세스 체험 {uuid.uuid4().hex[:6]}"
+        server_a.save_report(sample_report(first_name, "A 프로세스에서 저장한 첫 번째 리포트"))
+        check("A가 저장한 리포트가 B의 나의 기록 보기에 표시된다",
+              any(first_name in title for title in server_b.view_reports()))
+
+        keyword = f"keyword{uuid.uuid4().hex[:8]}"
+        check("B의 검색 색인에는 아직 새 리포트가 없다", not server_b.view_reports(keyword))
+        second_name = f"다중 프로세스 검색 {uuid.uuid4().hex[:6]}"
+        server_a.save_report(sample_report(second_name, f"A 프로세스에서 저장한 검색용 리포트 {keyword}"))
+        time.sleep(RESULT_CACHE_CHECK_MS / 1000)
+        check("A가 새로 저장한 리포트가 B의 검색 결과에 나온다",
+              any(second_name in title for title in server_b.view_reports(keyword)))
+
+        program_id = server_a.add_program({
+            'id': f"mp-{uuid.uuid4().hex[:8]}", 'name': '다중 프로세스 프로그램', 'field': 'IT/소프트웨어',
+            'description': '공유 저장소 점검용', 'date': '2025-03-01', 'location': '온라인',
+        })
+        check("A가 추가한 프로그램이 B의 카탈로그에 반영된다", server_b.has_program(program_id))
+
+        new_program = {'name': f"관리자 등록 {uuid.uuid4().hex[:6]}", 'field': 'IT/소프트웨어',
+                       'description': '', 'date': '2025-04-01', 'location': '온라인'}
+        created_ids, _ = server_a.create_programs([new_program])
+        duplicate_ids, rejects = server_b.create_programs([{**new_program, 'name': f"  {new_program['name'].upper()} "}])
+        check("A가 등록한 프로그램을 B에서 다시 등록하면 중복으로 제외된다",
+              len(created_ids) == 1 and not duplicate_ids and len(rejects) == 1 and server_b.has_program(created_ids[0]))
+
+        server_a.logout()
+        check("A에서 로그아웃하면 B에서도 토큰이 무효가 된다", not server_b.is_token_valid(token))
+    finally:
+        server_a.close()
+        server_b.close()
+
+    print(f"{sum(checks)}/{len(checks)} 통과 (공유 DB: {db_path})")
+    return 0 if all(checks) else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+from validation import UNSPECIFIED_JOB_FIELD
+
+# --- 관리자 통계 (Analytics) ---
+# 전체 리포트를 열(column) 단위 배열로 읽어 pandas DataFrame을 만들고,
+# 별점 분포 / 프로그램별 리포트 수 / 분야별 월간 추이 / 반별 참여 현황을 벡터화된 group-by로 계산합니다.
+# 리포트 본문(reportContent)은 통계에 필요 없으므로 저장소에서 빼고 읽습니다. (iter_reports(include_content=False):
+# SQLite는 json_remove, Firestore는 select()로 본문 없이 가져오므로 본문을 디코딩하거나 전송하지 않습니다)
+# 통계 대시보드(views/analytics_dashboard.py)에서는 저장소의 data_version()을 키로 `st.cache_data`에 캐시하여, 새 리포트가 저장될 때만 다시 계산합니다.
+# 증분 집계가 아니므로 리포트가 한 건이라도 저장되면 다음 조회 때 전체 리포트를 다시 읽어 DataFrame을 새로 만듭니다.
+# (수업 중처럼 저장이 잦을 때는 대시보드를 열 때마다 전체를 다시 계산하게 됩니다)
+
+FRAME_COLUMNS = ['userId', 'schoolName', 'classNumber', 'programName', 'jobField', 'rating', 'experienceDate']
+CATEGORY_COLUMNS = ['schoolName', 'classNumber', 'programName', 'jobField']
+TOP_PROGRAMS = 20
+
+
+def load_report_frame(reports):
+    """리포트 스트림을 열 배열로 모아 DataFrame으로 변환합니다. (행마다 dict를 보관하지 않음)"""
+    columns = {column: [] for column in FRAME_COLUMNS}
+    for report in reports:
+        for column, values in columns.items():
+            values.append(report.get(column))
+
+    frame = pd.DataFrame(columns)
+    # 반복되는 문자열 값은 category로 저장해 메모리와 group-by 비용을 줄입니다.
+    # 빈 값은 저장소 요약과 같은 키(UNSPECIFIED_JOB_FIELD)로 모읍니다. (예전에 빈 문자열로 저장된 리포트 포함)
+    for column in CATEGORY_COLUMNS:
+        frame[column] = frame[column].mask(frame[column] == '').fillna(UNSPECIFIED_JOB_FIELD).astype('category')
+    frame['rating'] = pd.to_numeric(frame['rating'], errors='coerce').fillna(0).astype(np.int8)
+    frame['experienceDate'] = pd.to_datetime(frame['experienceDate'], errors='coerce')
+    return frame
+
+
+def rating_distribution(frame):
+    """별점(0~5)별 리포트 수."""
+    counts = np.bincount(frame['rating'].clip(0, 5).to_numpy(), minlength=6)
+    return pd.DataFrame({'리포트 수': counts}, index=pd.Index(range(6), name='별점'))
+
+
+def reports_per_program(frame, top=TOP_PROGRAMS):
+    """리포트가 많은 프로그램 순으로 리포트 수와 평균 별점."""
+    grouped = frame.groupby('programName', observed=True)['rating'].agg(['size', 'mean'])
+    grouped.columns = ['리포트 수', '평균 별점']
+    grouped['평균 별점'] = grouped['평균 별점'].round(2)
+    return grouped.sort_values('리포트 수', ascending=False).head(top)
+
+
+def job_field_trend(frame):
+    """체험 월별 / 분야별 리포트 수 (행: 월, 열: 분야)."""
+    dated = frame.dropna(subset=['experienceDate'])
+    if dated.empty:
+        return pd.DataFrame()
+    month = dated['experienceDate'].dt.to_period('M').dt.to_timestamp()
+    return (dated.groupby([month, 'jobField'], observed=True).size()
+            .unstack(fill_value=0)
+            .sort_index())
+
+
+def class_participation(frame):
+    """학교/반별 리포트 수, 참여 학생 수, 학생당 리포트 수, 평균 별점."""
+    grouped = frame.groupby(['schoolName', 'classNumber'], observed=True).agg(
+        reports=('rating', 'size'),
+        students=('userId', 'nunique'),
+        average_rating=('rating', 'mean'),
+    )
+    grouped['reports_per_student'] = (grouped['reports'] / grouped['students']).round(2)
+    grouped['average_rating'] = grouped['average_rating'].round(2)
+    grouped.columns = ['리포트 수', '참여 학생 수', '평균 별점', '학생당 리포트 수']
+    return grouped.sort_values('리포트 수', ascending=False)
+
+
+def compute_analytics(reports):
+    """관리자 대시보드에 필요한 모든 집계를 한 번에 계산합니다."""
+    frame = load_report_frame(reports)
+    return {
+        'total_reports': len(frame),
+        'total_students': int(frame['userId'].nunique()),
+        'average_rating': float(frame['rating'].mean()) if len(frame) else None,
+        'rating_distribution': rating_distribution(frame),
+        'reports_per_program': reports_per_program(frame),
+        'job_field_trend': job_field_trend(frame),
+        'class_participation': class_participation(frame),
+    }
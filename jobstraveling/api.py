@@ -0,0 +1,277 @@
+import os
+import sys
+import argparse
+import functools
+import contextlib
+from datetime import date
+
+try:
+    from fastapi import FastAPI, Depends, HTTPException, Header, Query
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import StreamingResponse
+    from fastapi.staticfiles import StaticFiles
+except ImportError:  # API 서버를 실행할 때만 필요합니다.
+    FastAPI = None
+
+from storage import create_report_repository, DEFAULT_HEADER_PAGE_SIZE
+from catalog import ProgramCatalog, DEFAULT_PROGRAMS, DEFAULT_PAGE_SIZE
+from programs import ProgramCatalogReplica, create_program_repository
+from search import SearchService
+from validation import prepare_report
+from auth import SignedTokenStore, authenticate, public_profile, load_token_secret, default_token_secret_path
+from users import UserRegistry, create_user_repository, normalize_email, DEMO_ADMIN_ACCOUNT, DEMO_USER_ACCOUNT
+from writer import ReportWriteQueue, WriteRejectedError, WriteFailedError
+from result_cache import create_tag_versions, reports_tag
+import assets
+import exporter
+
+# --- JSON API 서버 (ASGI) ---
+# 저장/검사/조회 로직을 Streamlit의 rerun 모델 밖에서 제공하는 독립 API 서버입니다.
+# Streamlit 앱(JOBSTRAVELING_API_URL 설정 시)과 HTML 컴포넌트가 이 API를 호출하므로,
+# UI 서버와 별도로 uvicorn 워커 수를 늘려 확장할 수 있습니다.
+#
+# - 각 워커 프로세스는 저장소/카탈로그/검색 색인/쓰기 대기열을 한 번씩 만듭니다. (get_services)
+#   리포트/계정/프로그램은 공유 저장소(SQLite 파일 또는 Firestore)에 있으므로 어느 워커에 요청이 가도 같은 결과를 봅니다.
+#   (memory 백엔드는 워커마다 따로 보관하므로 워커 1개로만 사용하세요)
+# - 인증은 서명 토큰(SignedTokenStore)이라 토큰을 발급한 워커가 아니어도 확인할 수 있습니다.
+#   모든 워커가 같은 키를 쓰도록 JOBSTRAVELING_TOKEN_SECRET이 없으면 공유 키 파일(auth.load_token_secret,
+#   기본값: SQLite 파일과 같은 폴더의 api_token_secret)에서 읽습니다. uvicorn api:app으로 바로 실행해도 같습니다.
+#   서비스는 워커가 시작할 때 만들므로, 키나 저장소 설정이 잘못되면 첫 요청이 아니라 시작할 때 실패합니다.
+# - HTML 컴포넌트(frontend/)와 자체 호스팅 에셋(static/)도 이 서버가 직접 제공합니다.
+# - 관리자 리포트 내보내기는 저장소에서 조금씩 읽은 청크를 그대로 응답으로 흘려보냅니다. (서버 메모리 일정)
+#   브라우저 링크로 내려받을 수 있도록, 로그인 토큰 대신 필터만 담은 짧은 수명의 서명 티켓을 주소에 씁니다.
+#
+# 실행:
+#   python jobstraveling/api.py --port 8600 --workers 4
+#   (또는 jobstraveling 폴더에서 uvicorn api:app --port 8600 --workers 4)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FRONTEND_DIR = os.path.join(BASE_DIR, 'frontend')
+
+DEFAULT_PORT = 8600
+MAX_PAGE_SIZE = 100
+# 내용 해시가 붙은 에셋 파일은 주소가 바뀌지 않는 한 내용도 바뀌지 않으므로 오래 캐시합니다.
+STATIC_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+WRITE_ACK_TIMEOUT_SECONDS = 10
+EXPORT_TICKET_TTL_SECONDS = 120  # 내보내기 내려받기 링크의 유효 시간
+EXPORT_FILTER_KEYS = ('schoolName', 'classNumber', 'dateFrom', 'dateTo')
+
+
+class ApiServices:
+    """API 워커 프로세스 하나가 공유하는 서비스 묶음."""
+
+    def __init__(self, storage_backend=None, token_secret=None):
+        storage_backend = storage_backend or os.environ.get('JOBSTRAVELING_STORAGE', 'sqlite')
+        firestore_pool = None
+        if storage_backend == 'firestore':
+            from firestore_store import FirestoreClientPool
+            firestore_pool = FirestoreClientPool.from_env()
+        self.reports = create_report_repository(storage_backend, firestore_pool=firestore_pool)
+        self.search = SearchService()
+        program_repository = create_program_repository(storage_backend)
+        program_repository.ensure_programs(DEFAULT_PROGRAMS)
+        self.programs = ProgramCatalogReplica(program_repository, ProgramCatalog(), on_program=self.search.index_program)
+        # API 서버는 결과 캐시를 두지 않지만, Streamlit 프로세스의 목록 캐시가 새 리포트를 보도록 태그 버전을 올립니다.
+        self.tag_versions = create_tag_versions(storage_backend)
+        self.writer = ReportWriteQueue(self.reports.add_reports, on_saved=self._on_report_saved)
+        self.users = UserRegistry(create_user_repository(storage_backend))
+        self.users.ensure(DEMO_ADMIN_ACCOUNT)
+        self.users.ensure(DEMO_USER_ACCOUNT)
+        token_secret = token_secret or load_token_secret()
+        self.tokens = SignedTokenStore(token_secret)
+        # 내보내기 티켓은 다른 키로 서명하여 로그인 토큰으로 쓸 수 없게 합니다.
+        self.export_tickets = SignedTokenStore(f"{token_secret}:export", ttl_seconds=EXPORT_TICKET_TTL_SECONDS)
+
+    def _on_report_saved(self, user_id, report):
+        self.search.index_report(user_id, report)
+        self.tag_versions.bump([reports_tag(user_id)])
+
+
+@functools.lru_cache(maxsize=None)
+def get_services():
+    """워커 프로세스당 한 번만 서비스를 생성합니다. (첫 요청 시)"""
+    return ApiServices()
+
+
+def _clamp_limit(limit, default):
+    return max(1, min(limit or default, MAX_PAGE_SIZE))
+
+
+def create_app():
+    """API 앱을 생성합니다. FastAPI가 설치되어 있지 않으면 ImportError가 발생합니다."""
+    if FastAPI is None:
+        raise ImportError("API 서버를 실행하려면 fastapi와 uvicorn이 필요합니다. (pip install fastapi uvicorn)")
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        get_services()  # 설정 오류(서명 키, 저장소)를 첫 요청이 아니라 워커 시작 시점에 드러냅니다.
+        yield
+
+    app = FastAPI(title="잡스트래블링 API", lifespan=lifespan)
+    # HTML 컴포넌트는 Streamlit 주소에서 열리므로 다른 출처의 요청을 허용합니다. (쿠키 없이 Bearer 토큰만 사용)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=os.environ.get('JOBSTRAVELING_API_CORS_ORIGINS', '*').split(','),
+        allow_methods=['GET', 'POST'],
+        allow_headers=['Authorization', 'Content-Type'],
+    )
+
+    @app.middleware('http')
+    async def cache_static_assets(request, call_next):
+        response = await call_next(request)
+        if request.url.path.startswith('/static/') and response.status_code == 200:
+            response.headers['Cache-Control'] = STATIC_CACHE_CONTROL
+        return response
+
+    def current_user(authorization: str = Header(None)):
+        scheme, _, token = (authorization or '').partition(' ')
+        profile = get_services().tokens.resolve(token) if scheme.lower() == 'bearer' else None
+        if profile is None:
+            raise HTTPException(status_code=401, detail="로그인이 필요합니다.")
+        return profile
+
+    @app.get('/api/health')
+    def health():
+        return {'status': 'ok', 'pid': os.getpid()}
+
+    # --- 인증 / 사용자 ---
+
+    @app.post('/api/login')
+    def login(body: dict):
+        services = get_services()
+        profile = authenticate(services.users.get(body.get('email')), body.get('password'))
+        if profile is None:
+            raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 올바르지 않습니다.")
+        return {'token': services.tokens.issue(profile), 'user': profile}
+
+    @app.get('/api/me')
+    def me(user: dict = Depends(current_user)):
+        return {'user': user}
+
+    @app.get('/api/users/{email}')
+    def get_user(email: str, user: dict = Depends(current_user)):
+        # 본인 또는 관리자만 조회할 수 있습니다.
+        if normalize_email(email) != user.get('email') and not user.get('isAdmin'):
+            raise HTTPException(status_code=403, detail="조회 권한이 없습니다.")
+        account = get_services().users.get(email)
+        if account is None:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+        return {'user': public_profile(account)}
+
+    # --- 리포트 ---
+
+    @app.post('/api/reports', status_code=201)
+    def save_report(body: dict, user: dict = Depends(current_user)):
+        report, error_message = prepare_report(body, user)
+        if error_message:
+            raise HTTPException(status_code=422, detail=error_message)
+        try:
+            saved_report = get_services().writer.save(user['email'], report, timeout=WRITE_ACK_TIMEOUT_SECONDS)
+        except (WriteRejectedError, WriteFailedError) as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        return {'report': saved_report}
+
+    @app.get('/api/reports')
+    def list_reports(before: str = None, limit: int = Query(None), user: dict = Depends(current_user)):
+        count, headers, next_cursor = get_services().reports.load_report_page(
+            user['email'], before=before, limit=_clamp_limit(limit, DEFAULT_HEADER_PAGE_SIZE)
+        )
+        return {'count': count, 'reports': headers, 'nextCursor': next_cursor}
+
+    @app.get('/api/reports/{report_id}')
+    def get_report(report_id: str, user: dict = Depends(current_user)):
+        report = get_services().reports.get_report(report_id, user['email'])
+        if report is None:
+            raise HTTPException(status_code=404, detail="리포트를 찾을 수 없습니다.")
+        return {'report': report}
+
+    # --- 리포트 내보내기 (관리자) ---
+
+    @app.post('/api/exports/reports')
+    def create_report_export(body: dict, user: dict = Depends(current_user)):
+        if not user.get('isAdmin'):
+            raise HTTPException(status_code=403, detail="내보내기 권한이 없습니다.")
+        export_format = body.get('format') or 'csv'
+        if export_format not in exporter.available_formats():
+            raise HTTPException(status_code=422, detail=f"지원하지 않는 파일 형식입니다: {export_format}")
+        ticket = get_services().export_tickets.issue(
+            {'format': export_format, **{key: body.get(key) or None for key in EXPORT_FILTER_KEYS}}
+        )
+        return {'url': f"/api/exports/reports/{ticket}", 'expiresIn': EXPORT_TICKET_TTL_SECONDS}
+
+    @app.get('/api/exports/reports/{ticket}')
+    def download_report_export(ticket: str):
+        export = get_services().export_tickets.resolve(ticket)
+        if export is None:
+            raise HTTPException(status_code=404, detail="내려받기 링크가 만료되었습니다. 내보내기를 다시 요청해 주세요.")
+        reports = get_services().reports.iter_reports(
+            export['schoolName'], export['classNumber'], export['dateFrom'], export['dateTo']
+        )
+        mime_type, extension = exporter.EXPORT_FORMATS[export['format']]
+        file_name = f"jobs_reports_{date.today().strftime('%Y%m%d')}.{extension}"
+        return StreamingResponse(exporter.iter_export(reports, export['format']), media_type=mime_type,
+                                 headers={'Content-Disposition': f'attachment; filename="{file_name}"'})
+
+    # --- 프로그램 카탈로그 (로그인 없이 조회) ---
+
+    @app.get('/api/programs')
+    def query_programs(field: str = None, location: str = None, dateFrom: str = None, dateTo: str = None,
+                       after: str = None, limit: int = Query(None), q: str = None):
+        services = get_services()
+        catalog = services.programs.sync()  # 다른 프로세스가 추가한 프로그램을 먼저 반영합니다.
+        limit = _clamp_limit(limit, DEFAULT_PAGE_SIZE)
+        if q:
+            # 검색어가 있으면 점수 순으로 한 페이지만 반환합니다. (커서 없음)
+            programs = [catalog.get_program(program_id) for program_id in services.search.search_programs(q, limit)]
+            return {'programs': [p for p in programs if p], 'nextCursor': None}
+        programs, next_cursor = catalog.query(field=field, location=location, date_from=dateFrom,
+                                              date_to=dateTo, after=after, limit=limit)
+        return {'programs': programs, 'nextCursor': next_cursor}
+
+    @app.get('/api/programs/{program_id}')
+    def get_program(program_id: str):
+        program = get_services().programs.sync().get_program(program_id)
+        if program is None:
+            raise HTTPException(status_code=404, detail="프로그램을 찾을 수 없습니다.")
+        return {'program': program}
+
+    # --- HTML 컴포넌트 / 정적 에셋 ---
+    app.mount('/components/report_form', StaticFiles(directory=os.path.join(FRONTEND_DIR, 'report_form'), html=True),
+              name='report_form')
+    if os.path.isdir(assets.STATIC_DIR):
+        app.mount('/static', StaticFiles(directory=assets.STATIC_DIR), name='static')
+
+    return app
+
+
+# uvicorn이 워커마다 이 모듈을 import하여 사용하는 앱 (FastAPI가 없으면 None)
+app = create_app() if FastAPI is not None else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="잡스트래블링 JSON API 서버를 실행합니다.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=1, help="uvicorn 워커 프로세스 수")
+    args = parser.parse_args(argv)
+
+    try:
+        import uvicorn
+    except ImportError:
+        print("API 서버를 실행하려면 fastapi와 uvicorn이 필요합니다. (pip install fastapi uvicorn)", file=sys.stderr)
+        return 1
+
+    try:
+        load_token_secret()  # 워커를 띄우기 전에 키를 확인하고, 없으면 공유 키 파일을 만들어 둡니다.
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    if not os.environ.get('JOBSTRAVELING_TOKEN_SECRET'):
+        print(f"서명 키: {default_token_secret_path()}", file=sys.stderr)
+
+    uvicorn.run('api:app', host=args.host, port=args.port, workers=args.workers, app_dir=BASE_DIR)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
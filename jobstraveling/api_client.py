@@ -0,0 +1,84 @@
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+
+# --- JSON API 클라이언트 ---
+# JOBSTRAVELING_API_URL이 설정되면 Streamlit 앱은 로그인과 리포트 저장을 API 서버(api.py)에 요청합니다.
+# 표준 라이브러리(urllib)만 사용하므로 앱 쪽에 추가 의존성이 없습니다.
+
+DEFAULT_TIMEOUT_SECONDS = 10
+
+
+class ApiError(RuntimeError):
+    """API 요청이 실패했을 때 발생합니다. 메시지는 사용자에게 그대로 보여줄 수 있는 문장입니다."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class ApiClient:
+    """API 서버에 JSON 요청을 보내는 클라이언트. 연결은 요청마다 새로 엽니다."""
+
+    def __init__(self, base_url, timeout=DEFAULT_TIMEOUT_SECONDS):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def _request(self, method, path, token=None, body=None, params=None):
+        url = f"{self.base_url}{path}"
+        if params:
+            url += '?' + urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
+        headers = {'Accept': 'application/json'}
+        data = None
+        if body is not None:
+            data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        if token:
+            headers['Authorization'] = f"Bearer {token}"
+        request = urllib.request.Request(url, data=data, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read() or b'null')
+        except urllib.error.HTTPError as e:
+            try:
+                detail = json.loads(e.read()).get('detail')
+            except (ValueError, AttributeError):
+                detail = None
+            raise ApiError(detail or f"API 요청이 실패했습니다. (HTTP {e.code})", status=e.code) from e
+        except (urllib.error.URLError, TimeoutError) as e:
+            raise ApiError("API 서버에 연결할 수 없습니다. 잠시 후 다시 시도해 주세요.") from e
+
+    def login(self, email, password):
+        """로그인에 성공하면 (토큰, 프로필), 이메일/비밀번호가 틀리면 None을 반환합니다."""
+        try:
+            result = self._request('POST', '/api/login', body={'email': email, 'password': password})
+        except ApiError as e:
+            if e.status == 401:
+                return None
+            raise
+        return result['token'], result['user']
+
+    def get_user(self, token, email):
+        return self._request('GET', f"/api/users/{urllib.parse.quote(email)}", token=token)['user']
+
+    def save_report(self, token, report_data):
+        """리포트를 저장하고 저장된 리포트(id 포함)를 반환합니다. 검사/저장 실패 시 ApiError가 발생합니다."""
+        return self._request('POST', '/api/reports', token=token, body=report_data)['report']
+
+    def create_report_export(self, token, export_format, **filters):
+        """
+        관리자 리포트 내보내기 링크를 만듭니다. (filters: schoolName, classNumber, dateFrom, dateTo)
+        반환된 주소는 API 서버가 파일을 스트리밍으로 보내며, 잠시 뒤 만료됩니다.
+        """
+        result = self._request('POST', '/api/exports/reports', token=token, body={'format': export_format, **filters})
+        return f"{self.base_url}{result['url']}"
+
+    def get_report(self, token, report_id):
+        return self._request('GET', f"/api/reports/{urllib.parse.quote(report_id)}", token=token)['report']
+
+    def query_programs(self, field=None, location=None, after=None, limit=None, q=None):
+        result = self._request('GET', '/api/programs', params={
+            'field': field, 'location': location, 'after': after, 'limit': limit, 'q': q,
+        })
+        return result['programs'], result.get('nextCursor')
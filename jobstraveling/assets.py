@@ -0,0 +1,241 @@
+import os
+import re
+import json
+import hashlib
+import argparse
+import urllib.request
+
+from templates import rendered_template_sources
+
+# --- 프런트엔드 에셋 자체 호스팅 (Asset Pipeline) ---
+# HTML 템플릿이 렌더링될 때마다 iframe이 CDN(Tailwind, Google Fonts, Firebase SDK)에서
+# 스크립트/폰트를 다시 받지 않도록, 빌드 단계에서 이 에셋들을 static 폴더에 내려받아 두고
+# HTML 템플릿을 컴파일할 때 CDN 주소를 로컬 주소로 바꿉니다.
+# 빌드는 앱이 실제로 렌더링하는 템플릿(templates.RENDERED_TEMPLATES, 내장 Mock HTML 포함)만 읽고,
+# 그 템플릿이 참조하는 에셋만 내려받습니다.
+#
+# - 파일 이름에 내용 해시를 붙이므로(예: firebase-app.3f2a9c1b.js) 내용이 바뀌면 주소도 바뀌어 오래 캐시해도 안전합니다.
+# - Tailwind Play CDN(브라우저에서 매번 CSS를 생성하는 스크립트)은 각 HTML 파일에서 실제로 쓰는 클래스만 남긴
+#   CSS로 바꿔 <style>에 인라인합니다. Google Fonts의 @font-face CSS도 로컬 폰트 파일 주소로 바꿔 인라인합니다.
+#   원본 CSS는 미리 빌드된 Tailwind 2.2.19 전체 CSS이므로 Play CDN(v3)에만 있는 유틸리티(임의 값 w-[37px] 등)는
+#   들어 있지 않습니다. 빌드 때 class 속성의 클래스 중 CSS에도 페이지 <style>에도 없는 것을 출력하고 manifest에 기록합니다.
+# - static 폴더는 API 서버(JOBSTRAVELING_API_URL)가 있으면 API 서버의 /static/ 경로로 제공되어
+#   Cache-Control: public, max-age=31536000, immutable이 붙습니다.
+#   API 서버가 없으면 앱에서 components.declare_component(path=STATIC_DIR)로 등록한 컴포넌트 경로로 제공됩니다.
+#   (Streamlit의 앱 정적 파일 서빙은 .js/.css를 text/plain으로 보내므로 스크립트에 사용할 수 없습니다.
+#    컴포넌트 경로는 올바른 MIME 타입을 주지만 Cache-Control: public만 붙이므로 재검증 요청은 남습니다.)
+# - 빌드하지 않았으면(manifest.json 없음) HTML을 바꾸지 않으므로 기존처럼 CDN을 사용합니다.
+#
+# 빌드 (배포 전에 한 번, htmls를 수정한 뒤에도 다시 실행):
+#   python jobstraveling/assets.py build
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, 'static')
+HTML_DIR = os.path.join(BASE_DIR, 'htmls')
+MANIFEST_FILE = 'manifest.json'
+HASH_LENGTH = 8
+
+# 내려받아 로컬 주소로 바꿀 스크립트 (의존하는 파일보다 먼저 오도록 나열합니다)
+VENDOR_SCRIPTS = [
+    'https://www.gstatic.com/firebasejs/11.6.1/firebase-app.js',
+    'https://www.gstatic.com/firebasejs/11.6.1/firebase-auth.js',
+    'https://www.gstatic.com/firebasejs/11.6.1/firebase-firestore.js',
+    'https://www.gstatic.com/firebasejs/10.12.2/firebase-app.js',
+    'https://www.gstatic.com/firebasejs/10.12.2/firebase-auth.js',
+    'https://www.gstatic.com/firebasejs/10.12.2/firebase-firestore.js',
+]
+GOOGLE_FONTS_URL = 'https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap'
+# Play CDN 대신 클래스 선별의 원본으로 사용할 전체 유틸리티 CSS
+TAILWIND_CSS_URL = 'https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css'
+# Google Fonts는 User-Agent에 따라 다른 형식을 주므로 woff2를 받도록 최신 브라우저로 요청합니다.
+FONT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36'
+
+TAILWIND_SCRIPT_TAG = re.compile(r'<script src="https://cdn\.tailwindcss\.com"></script>')
+GOOGLE_FONTS_IMPORT = re.compile(r"@import url\(['\"]?https://fonts\.googleapis\.com/css2\?[^)]*\);")
+FONT_FILE_URL = re.compile(r'url\((https://fonts\.gstatic\.com/[^)]+)\)')
+# Tailwind의 콘텐츠 스캔과 같은 방식으로, 파일에서 클래스 이름이 될 수 있는 모든 토큰을 모읍니다.
+CLASS_CANDIDATE = re.compile(r'[A-Za-z0-9_:/.%\-]+')
+CSS_CLASS_SELECTOR = re.compile(r'\.((?:\\.|[A-Za-z0-9_-])+)')
+CLASS_ATTRIBUTE = re.compile(r'\bclass="([^"]*)"')
+STYLE_BLOCK = re.compile(r'<style[^>]*>(.*?)</style>', re.S)
+
+
+def _fetch(url, user_agent=None):
+    request = urllib.request.Request(url, headers={'User-Agent': user_agent or 'jobstraveling-assets'})
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return response.read()
+
+
+def _hashed_name(url, content):
+    """내용 해시를 붙인 파일 이름. (예: firebase-app.3f2a9c1b.js)"""
+    stem, ext = os.path.splitext(os.path.basename(url.split('?')[0]))
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    return f"{stem}.{digest}{ext}"
+
+
+# --- CSS 선별 (사용하는 클래스만 남기기) ---
+
+def _split_blocks(css):
+    """최상위 규칙을 (prelude, body) 목록으로 나눕니다. 중괄호 중첩(@media 등)을 고려합니다."""
+    blocks, depth, start, body_start = [], 0, 0, None
+    for i, char in enumerate(css):
+        if char == '{':
+            if depth == 0:
+                body_start = i
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                blocks.append((css[start:body_start].strip(), css[body_start + 1:i]))
+                start = i + 1
+    return blocks
+
+
+def _selector_used(selector, used_classes):
+    classes = [re.sub(r'\\(.)', r'\1', name) for name in CSS_CLASS_SELECTOR.findall(selector)]
+    return all(name in used_classes for name in classes)
+
+
+def purge_css(css, used_classes):
+    """
+    used_classes에 있는 클래스만 쓰는 규칙을 남긴 CSS를 반환합니다.
+    클래스 선택자가 없는 기본 규칙(preflight)과 @keyframes 등은 그대로 유지합니다.
+    """
+    out = []
+    for prelude, body in _split_blocks(css):
+        if prelude.startswith(('@media', '@supports')):
+            inner = purge_css(body, used_classes)
+            if inner:
+                out.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith('@'):
+            out.append(f"{prelude}{{{body}}}")
+        else:
+            selectors = [s for s in prelude.split(',') if _selector_used(s, used_classes)]
+            if selectors:
+                out.append(f"{','.join(selectors)}{{{body}}}")
+    return ''.join(out)
+
+
+def collect_class_candidates(source):
+    return set(CLASS_CANDIDATE.findall(source))
+
+
+def css_class_names(css):
+    """CSS에 선택자로 등장하는 클래스 이름 집합."""
+    return {re.sub(r'\\(.)', r'\1', name) for name in CSS_CLASS_SELECTOR.findall(css)}
+
+
+def missing_tailwind_classes(source, tailwind_css):
+    """
+    class 속성에 쓰였지만 Tailwind CSS에도 페이지의 <style>에도 없는 클래스 목록.
+    (Play CDN에서는 동작하지만 선별한 CSS에서는 스타일이 빠지는 클래스. 스크립트에서 만드는 클래스는 검사하지 않습니다)
+    """
+    used = {name for value in CLASS_ATTRIBUTE.findall(source) for name in value.split() if '{{' not in name}
+    defined = css_class_names(tailwind_css) | css_class_names(''.join(STYLE_BLOCK.findall(source)))
+    return sorted(used - defined)
+
+
+# --- 빌드 ---
+
+def build(static_dir=STATIC_DIR, html_dir=HTML_DIR):
+    """
+    렌더링되는 템플릿이 참조하는 에셋을 내려받아 static_dir에 기록하고 manifest를 만듭니다. 반환값: manifest(dict).
+    """
+    os.makedirs(static_dir, exist_ok=True)
+    sources = dict(rendered_template_sources(html_dir))
+    combined = ''.join(sources.values())
+    files = {}  # {원본 URL: static 폴더 기준 파일 이름}
+
+    def write(url, content):
+        file_name = _hashed_name(url, content)
+        with open(os.path.join(static_dir, file_name), 'wb') as f:
+            f.write(content)
+        files[url] = file_name
+        print(f"  {url} → {file_name}")
+
+    # 1) 스크립트: Firebase 모듈은 서로를 절대 주소로 import하므로, 먼저 받은 파일의 주소로 바꾼 뒤 해시합니다.
+    #    (같은 폴더 기준 상대 경로라 HTML의 주소와 같은 URL로 해석되어 모듈이 한 번만 로드됩니다)
+    #    템플릿이 직접 쓰는 모듈이 import하는 모듈(firebase-app)도 함께 받습니다.
+    used_versions = {url.rsplit('/', 2)[-2] for url in VENDOR_SCRIPTS if url in combined}
+    for url in VENDOR_SCRIPTS:
+        if url.rsplit('/', 2)[-2] not in used_versions:
+            continue
+        text = _fetch(url).decode('utf-8')
+        for dependency_url, file_name in files.items():
+            text = text.replace(dependency_url, f"./{file_name}")
+        write(url, text.encode('utf-8'))
+
+    # 2) Google Fonts: 폰트 파일을 받아 로컬 주소로 바꾼 @font-face CSS를 만듭니다.
+    font_css = ''
+    if GOOGLE_FONTS_IMPORT.search(combined):
+        font_css = _fetch(GOOGLE_FONTS_URL, FONT_USER_AGENT).decode('utf-8')
+        for font_url in sorted(set(FONT_FILE_URL.findall(font_css))):
+            write(font_url, _fetch(font_url))
+
+    # 3) Tailwind: 템플릿마다 실제로 쓰는 클래스만 남긴 CSS를 만들고, 원본 CSS에 없는 클래스를 알립니다.
+    tailwind, tailwind_missing = {}, {}
+    tailwind_pages = [name for name, source in sorted(sources.items()) if TAILWIND_SCRIPT_TAG.search(source)]
+    tailwind_css = _fetch(TAILWIND_CSS_URL).decode('utf-8') if tailwind_pages else ''
+    for name in tailwind_pages:
+        tailwind[name] = purge_css(tailwind_css, collect_class_candidates(sources[name]))
+        print(f"  tailwind ({name}): {len(tailwind[name]):,} bytes")
+        missing = missing_tailwind_classes(sources[name], tailwind_css)
+        if missing:
+            tailwind_missing[name] = missing
+            print(f"  ⚠️ tailwind ({name}): Tailwind 2.2.19 CSS에 없는 클래스 {len(missing)}개: {' '.join(missing)}")
+
+    manifest = {'files': files, 'font_css': font_css, 'tailwind': tailwind, 'tailwind_missing': tailwind_missing}
+    with open(os.path.join(static_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    return manifest
+
+
+# --- 런타임 (HTML 치환) ---
+
+class AssetManifest:
+    """빌드 결과(manifest.json)로 HTML의 CDN 주소를 로컬 주소로 바꿉니다."""
+
+    def __init__(self, manifest, url_prefix):
+        self.url_prefix = url_prefix
+        self.tailwind = manifest.get('tailwind', {})
+        self.urls = {url: f"{url_prefix}{file_name}" for url, file_name in manifest.get('files', {}).items()}
+        self.font_css = self._replace_urls(manifest.get('font_css', ''))
+
+    @classmethod
+    def load(cls, url_prefix, static_dir=STATIC_DIR):
+        """manifest.json이 없으면(빌드 전) None을 반환합니다."""
+        manifest_path = os.path.join(static_dir, MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return None
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), url_prefix)
+
+    def _replace_urls(self, text):
+        for url, local_url in self.urls.items():
+            text = text.replace(url, local_url)
+        return text
+
+    def rewrite_html(self, name, source):
+        """템플릿 컴파일 전에 한 번 호출됩니다. (TemplateCache의 transform)"""
+        css = self.tailwind.get(name)
+        if css is not None:
+            source = TAILWIND_SCRIPT_TAG.sub(lambda _: f"<style>{css}</style>", source)
+        if self.font_css:
+            source = GOOGLE_FONTS_IMPORT.sub(lambda _: self.font_css, source)
+        return self._replace_urls(source)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CDN 에셋을 내려받아 static 폴더에 기록합니다.")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--static-dir', default=STATIC_DIR, help="출력 폴더 (기본값: jobstraveling/static)")
+    args = parser.parse_args(argv)
+
+    manifest = build(args.static_dir)
+    print(f"완료: 파일 {len(manifest['files'])}개, Tailwind 페이지 {len(manifest['tailwind'])}개, "
+          f"누락 클래스가 있는 페이지 {len(manifest['tailwind_missing'])}개")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
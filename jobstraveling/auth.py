@@ -0,0 +1,276 @@
+import os
+import hmac
+import json
+import time
+import sqlite3
+import base64
+import hashlib
+import secrets
+import tempfile
+import threading
+
+from storage import DEFAULT_DB_PATH
+
+# --- 인증 (Authentication) ---
+# 비밀번호는 PBKDF2-SHA256 해시로만 저장하고, 비교는 hmac.compare_digest로 상수 시간에 수행합니다.
+# 로그인에 성공하면 세션 토큰을 발급하여 프로세스 단위 토큰 저장소에 사용자 프로필과 함께 보관합니다.
+# 이후 rerun에서는 토큰 조회(dict 조회 O(1))만 하므로 비밀번호 해시를 다시 계산하지 않습니다.
+# 여러 Streamlit 프로세스가 로드 밸런서 뒤에서 함께 동작할 때는 토큰을 공유 SQLite 파일에 두어(SQLiteSessionTokenStore)
+# 어느 프로세스로 연결되어도 같은 토큰으로 로그인 상태를 확인하고, 로그아웃 시 모든 프로세스에서 폐기되게 합니다.
+# 여러 프로세스가 토큰을 함께 확인해야 하는 API 서버(api.py)는 서버 상태가 없는 서명 토큰(SignedTokenStore)을 사용합니다.
+
+PASSWORD_HASH_ALGORITHM = 'pbkdf2_sha256'
+PASSWORD_HASH_ITERATIONS = 120_000
+SESSION_TOKEN_TTL_SECONDS = 12 * 60 * 60  # 하루 수업 시간 동안 유지
+PURGE_INTERVAL = 256  # 토큰을 이만큼 발급할 때마다 만료된 토큰을 정리
+
+# 계정이 없을 때도 같은 시간만큼 해시를 계산하여, 응답 시간으로 이메일 존재 여부를 알 수 없게 합니다.
+_DUMMY_SALT = b'jobstraveling-dummy-salt'
+TOKEN_SECRET_FILE_NAME = 'api_token_secret'
+
+
+def _b64encode(data):
+    return base64.b64encode(data).decode('ascii')
+
+
+def hash_password(password, salt=None, iterations=PASSWORD_HASH_ITERATIONS):
+    """비밀번호를 'pbkdf2_sha256$반복횟수$salt$hash' 형식의 문자열로 해시합니다."""
+    salt = salt or secrets.token_bytes(16)
+    digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+    return f"{PASSWORD_HASH_ALGORITHM}${iterations}${_b64encode(salt)}${_b64encode(digest)}"
+
+
+def verify_password(password, password_hash):
+    """비밀번호가 저장된 해시와 일치하는지 상수 시간 비교로 확인합니다."""
+    try:
+        algorithm, iterations, salt, expected = password_hash.split('$')
+        iterations = int(iterations)
+        salt = base64.b64decode(salt)
+        expected = base64.b64decode(expected)
+    except (AttributeError, ValueError):
+        return False
+    if algorithm != PASSWORD_HASH_ALGORITHM:
+        return False
+    digest = hashlib.pbkdf2_hmac('sha256', (password or '').encode('utf-8'), salt, iterations)
+    return hmac.compare_digest(digest, expected)
+
+
+def public_profile(account):
+    """계정 정보에서 비밀번호 해시 등 민감 정보를 제거한 프로필을 반환합니다."""
+    return {key: value for key, value in account.items() if key not in ('password', 'passwordHash')}
+
+
+def authenticate(account, password):
+    """
+    계정과 비밀번호를 확인하여 성공 시 프로필, 실패 시 None을 반환합니다.
+    계정이 없어도(None) 같은 비용의 해시 계산을 수행합니다.
+    """
+    if account is None or not account.get('passwordHash'):
+        hashlib.pbkdf2_hmac('sha256', (password or '').encode('utf-8'), _DUMMY_SALT, PASSWORD_HASH_ITERATIONS)
+        return None
+    if not verify_password(password, account['passwordHash']):
+        return None
+    return public_profile(account)
+
+
+class SessionTokenStore:
+    """세션 토큰 → (만료 시각, 사용자 프로필)을 보관하는 프로세스 단위 저장소."""
+
+    def __init__(self, ttl_seconds=SESSION_TOKEN_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._tokens = {}
+        self._issued = 0
+
+    def issue(self, profile):
+        """새 세션 토큰을 발급합니다."""
+        token = secrets.token_urlsafe(32)
+        with self._lock:
+            self._issued += 1
+            if self._issued % PURGE_INTERVAL == 0:
+                self._purge_expired()
+            self._tokens[token] = (time.monotonic() + self.ttl_seconds, dict(profile))
+        return token
+
+    def resolve(self, token):
+        """토큰이 유효하면 사용자 프로필을, 없거나 만료되었으면 None을 반환합니다."""
+        if not token:
+            return None
+        entry = self._tokens.get(token)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self.revoke(token)
+            return None
+        return entry[1]
+
+    def revoke(self, token):
+        with self._lock:
+            self._tokens.pop(token, None)
+
+    def _purge_expired(self):
+        now = time.monotonic()
+        for token in [t for t, (expires_at, _) in self._tokens.items() if expires_at < now]:
+            del self._tokens[token]
+
+
+class SignedTokenStore:
+    """
+    서버에 상태를 두지 않는 서명 토큰. (API 서버처럼 여러 워커 프로세스가 같은 토큰을 확인해야 할 때 사용)
+    토큰은 '프로필·만료 시각(JSON, base64url).HMAC-SHA256 서명' 형식이며, 같은 비밀 키를 가진 프로세스라면
+    어디서든 조회 없이 확인할 수 있습니다. 발급된 토큰은 서버에서 폐기할 수 없으므로(revoke는 아무 일도 하지 않음)
+    만료 시각까지 유효합니다.
+    """
+
+    def __init__(self, secret, ttl_seconds=SESSION_TOKEN_TTL_SECONDS):
+        if not secret:
+            raise ValueError("서명 토큰에는 비밀 키가 필요합니다.")
+        self.ttl_seconds = ttl_seconds
+        self._secret = secret.encode('utf-8') if isinstance(secret, str) else secret
+
+    def _sign(self, payload):
+        return base64.urlsafe_b64encode(hmac.new(self._secret, payload, hashlib.sha256).digest()).rstrip(b'=')
+
+    def issue(self, profile):
+        """프로필과 만료 시각을 담은 서명 토큰을 발급합니다."""
+        body = json.dumps({'exp': int(time.time() + self.ttl_seconds), 'profile': dict(profile)},
+                          ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        payload = base64.urlsafe_b64encode(body).rstrip(b'=')
+        return (payload + b'.' + self._sign(payload)).decode('ascii')
+
+    def resolve(self, token):
+        """서명과 만료 시각이 유효하면 사용자 프로필을, 아니면 None을 반환합니다."""
+        if not token:
+            return None
+        payload, _, signature = token.encode('ascii', 'ignore').partition(b'.')
+        if not hmac.compare_digest(self._sign(payload), signature):
+            return None
+        try:
+            data = json.loads(base64.urlsafe_b64decode(payload + b'=' * (-len(payload) % 4)))
+        except ValueError:
+            return None
+        if data.get('exp', 0) < time.time():
+            return None
+        return data.get('profile')
+
+    def revoke(self, token):
+        # 상태가 없으므로 폐기할 수 없습니다. 로그아웃한 클라이언트는 토큰을 버리고, 토큰은 만료 시각에 무효가 됩니다.
+        pass
+
+
+def default_token_secret_path():
+    """서명 키 파일 경로. (JOBSTRAVELING_TOKEN_SECRET_FILE 또는 공유 SQLite 파일과 같은 폴더)"""
+    db_path = os.environ.get('JOBSTRAVELING_DB_PATH', DEFAULT_DB_PATH)
+    return (os.environ.get('JOBSTRAVELING_TOKEN_SECRET_FILE')
+            or os.path.join(os.path.dirname(os.path.abspath(db_path)), TOKEN_SECRET_FILE_NAME))
+
+
+def load_token_secret(secret_file=None):
+    """
+    서명 토큰의 비밀 키를 반환합니다. JOBSTRAVELING_TOKEN_SECRET이 있으면 그 값을, 없으면 공유 키 파일을 읽습니다.
+    키 파일이 없으면 새 키를 만들어 둡니다. 임시 파일을 os.link로 옮기므로 여러 워커가 동시에 시작해도
+    한 키만 남고 모든 워커가 같은 키를 읽습니다. 키를 읽거나 만들 수 없으면 RuntimeError가 발생합니다.
+    """
+    secret = os.environ.get('JOBSTRAVELING_TOKEN_SECRET')
+    if secret:
+        return secret
+    path = secret_file or default_token_secret_path()
+    try:
+        if not os.path.exists(path):
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.token-secret-')  # 소유자만 읽기/쓰기
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(secrets.token_urlsafe(32))
+                os.link(temp_path, path)
+            except FileExistsError:
+                pass  # 다른 워커가 먼저 만들었습니다.
+            finally:
+                os.unlink(temp_path)
+        with open(path, 'r', encoding='utf-8') as f:
+            secret = f.read().strip()
+    except OSError as e:
+        raise RuntimeError(
+            f"서명 키 파일({path})을 읽거나 만들 수 없습니다: {e}. "
+            "JOBSTRAVELING_TOKEN_SECRET 또는 JOBSTRAVELING_TOKEN_SECRET_FILE을 설정해 주세요."
+        ) from e
+    if not secret:
+        raise RuntimeError(f"서명 키 파일({path})이 비어 있습니다. 파일을 지우거나 JOBSTRAVELING_TOKEN_SECRET을 설정해 주세요.")
+    return secret
+
+
+class SQLiteSessionTokenStore:
+    """
+    세션 토큰을 공유 SQLite 파일에 보관하는 저장소. SessionTokenStore와 같은 인터페이스입니다.
+    토큰 원문 대신 SHA-256 해시를 저장하며, 만료 시각은 프로세스 간에 비교할 수 있도록 벽시계 시각(time.time)을 씁니다.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, ttl_seconds=SESSION_TOKEN_TTL_SECONDS):
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._issued = 0
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS session_tokens (
+                    token_hash TEXT PRIMARY KEY,
+                    expires_at REAL NOT NULL,
+                    profile TEXT NOT NULL
+                )
+            """)
+            # 이전 버전이 URL 재접속 코드를 보관하던 테이블 (세션 쿠키로 바뀌어 더 이상 쓰지 않음)
+            self._conn.execute('DROP TABLE IF EXISTS session_handoffs')
+            self._conn.commit()
+
+    @staticmethod
+    def _hash(token):
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def issue(self, profile):
+        token = secrets.token_urlsafe(32)
+        with self._lock:
+            self._issued += 1
+            if self._issued % PURGE_INTERVAL == 0:
+                self._conn.execute('DELETE FROM session_tokens WHERE expires_at < ?', (time.time(),))
+            self._conn.execute(
+                'INSERT INTO session_tokens (token_hash, expires_at, profile) VALUES (?, ?, ?)',
+                (self._hash(token), time.time() + self.ttl_seconds, json.dumps(dict(profile), ensure_ascii=False)),
+            )
+            self._conn.commit()
+        return token
+
+    def resolve(self, token):
+        if not token:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT expires_at, profile FROM session_tokens WHERE token_hash = ?', (self._hash(token),)
+            ).fetchone()
+        if row is None:
+            return None
+        if row[0] < time.time():
+            self.revoke(token)
+            return None
+        return json.loads(row[1])
+
+    def revoke(self, token):
+        if not token:
+            return
+        with self._lock:
+            self._conn.execute('DELETE FROM session_tokens WHERE token_hash = ?', (self._hash(token),))
+            self._conn.commit()
+
+
+def create_session_token_store(backend=None, db_path=None):
+    """리포트 저장소와 같은 환경 변수(JOBSTRAVELING_STORAGE / JOBSTRAVELING_DB_PATH)로 세션 토큰 저장소를 생성합니다."""
+    backend = backend or os.environ.get('JOBSTRAVELING_STORAGE', 'sqlite')
+    if backend == 'memory':
+        return SessionTokenStore()
+    if backend in ('sqlite', 'firestore'):
+        return SQLiteSessionTokenStore(db_path or os.environ.get('JOBSTRAVELING_DB_PATH', DEFAULT_DB_PATH))
+    raise ValueError(f"지원하지 않는 저장소 백엔드입니다: {backend}")
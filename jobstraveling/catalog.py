@@ -0,0 +1,141 @@
+import bisect
+import threading
+
+from records import ProgramRecord
+
+# --- 진로 프로그램 카탈로그 ---
+# 모든 세션이 공유하는 프로그램 목록입니다. (runtime.py에서 `st.cache_resource`로 한 번만 생성)
+# field / location 별 인덱스와 (date, id) 순으로 정렬된 키 목록을 유지하여,
+# 필터 조회와 키셋(keyset) 페이지네이션을 전체 목록 스캔 없이 처리합니다.
+# 프로그램은 ProgramRecord(records.py)로 보관하고, 반환할 때만 dict로 변환합니다.
+
+# 프로그램 목록 초기 데이터 (Mock Program Data)
+DEFAULT_PROGRAMS = [
+    {'id': '1', 'name': 'AI 개발자 체험 프로그램', 'field': 'IT/소프트웨어', 'description': '인공지능 모델을 직접 설계하고 코딩하는 경험', 'date': '2024-11-20', 'location': '온라인'},
+    {'id': '2', 'name': '친환경 건축가 워크숍', 'field': '건설/환경', 'description': '지속 가능한 건축 설계 및 재료 탐구', 'date': '2024-12-05', 'location': '서울 건축센터'},
+    {'id': '3', 'name': '우주 과학자 진로 특강', 'field': '과학/연구', 'description': 'NASA 탐사선 데이터 분석 및 우주 관측', 'date': '2025-01-10', 'location': '대학 강당'},
+]
+
+DEFAULT_PAGE_SIZE = 10
+
+
+def encode_cursor(key):
+    """(date, id) 정렬 키를 페이지 커서 문자열로 변환합니다."""
+    return f"{key[0]}|{key[1]}"
+
+
+def decode_cursor(cursor):
+    """페이지 커서 문자열을 (date, id) 정렬 키로 변환합니다."""
+    date_value, _, program_id = cursor.partition('|')
+    return (date_value, program_id)
+
+
+def _discard_key(keys, key):
+    """정렬된 키 목록에서 key를 이진 탐색으로 찾아 제거합니다."""
+    i = bisect.bisect_left(keys, key)
+    if i < len(keys) and keys[i] == key:
+        del keys[i]
+
+
+class ProgramCatalog:
+    """field / date / location 인덱스를 가진 프로그램 카탈로그."""
+
+    def __init__(self, programs=()):
+        self._lock = threading.RLock()
+        self._programs = {}     # {id: ProgramRecord}
+        self._keys = []         # 전체 프로그램의 (date, id) 정렬 목록
+        self._by_field = {}     # {field: [(date, id), ...]} (정렬 유지)
+        self._by_location = {}  # {location: [(date, id), ...]} (정렬 유지)
+        for program in programs:
+            self.add_program(program)
+
+    def __len__(self):
+        return len(self._programs)
+
+    def add_program(self, program):
+        """프로그램을 추가(또는 같은 id면 교체)하고 인덱스를 갱신합니다."""
+        record = ProgramRecord.from_dict(program)
+        with self._lock:
+            if record.id in self._programs:
+                self.remove_program(record.id)
+            key = record.sort_key
+            self._programs[record.id] = record
+            bisect.insort(self._keys, key)
+            bisect.insort(self._by_field.setdefault(record.field, []), key)
+            bisect.insort(self._by_location.setdefault(record.location, []), key)
+        return record.to_dict()
+
+    def add_programs(self, programs):
+        """여러 프로그램을 한 번의 Lock 구간에서 추가합니다."""
+        with self._lock:
+            return [self.add_program(program) for program in programs]
+
+    def remove_program(self, program_id):
+        """프로그램을 삭제하고 인덱스에서 제거합니다."""
+        with self._lock:
+            record = self._programs.pop(str(program_id), None)
+            if record is None:
+                return None
+            key = record.sort_key
+            _discard_key(self._keys, key)
+            for index, value in ((self._by_field, record.field), (self._by_location, record.location)):
+                keys = index.get(value)
+                if keys is not None:
+                    _discard_key(keys, key)
+                    if not keys:
+                        del index[value]
+            return record.to_dict()
+
+    def get_program(self, program_id):
+        record = self._programs.get(str(program_id))
+        return None if record is None else record.to_dict()
+
+    def all_programs(self):
+        """전체 프로그램을 날짜순으로 반환합니다. (색인 초기 구축용)"""
+        with self._lock:
+            return [self._programs[key[1]].to_dict() for key in self._keys]
+
+    def fields(self):
+        """등록된 분야 목록 (필터 선택지용)."""
+        return sorted(self._by_field)
+
+    def locations(self):
+        """등록된 장소 목록 (필터 선택지용)."""
+        return sorted(self._by_location)
+
+    def query(self, field=None, location=None, date_from=None, date_to=None,
+              after=None, limit=DEFAULT_PAGE_SIZE):
+        """
+        필터 조건에 맞는 프로그램을 날짜순으로 한 페이지만 반환합니다.
+        반환값: (programs, next_cursor) — 다음 페이지가 없으면 next_cursor는 None입니다.
+        after에는 이전 호출이 반환한 next_cursor를 전달합니다.
+        """
+        with self._lock:
+            # 가장 선택도가 높은(짧은) 인덱스를 후보 목록으로 사용합니다.
+            candidates = [self._keys]
+            if field:
+                candidates.append(self._by_field.get(field, []))
+            if location:
+                candidates.append(self._by_location.get(location, []))
+            keys = min(candidates, key=len)
+
+            start = bisect.bisect_left(keys, (date_from, '')) if date_from else 0
+            if after:
+                start = max(start, bisect.bisect_right(keys, decode_cursor(after)))
+
+            page = []
+            next_cursor = None
+            for i in range(start, len(keys)):
+                key = keys[i]
+                if date_to and key[0] > date_to:
+                    break
+                record = self._programs[key[1]]
+                if field and record.field != field:
+                    continue
+                if location and record.location != location:
+                    continue
+                if len(page) == limit:
+                    next_cursor = encode_cursor(page[-1].sort_key)
+                    break
+                page.append(record)
+            return [record.to_dict() for record in page], next_cursor
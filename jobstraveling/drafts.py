@@ -0,0 +1,130 @@
+import os
+import json
+import sqlite3
+import threading
+
+from storage import DEFAULT_DB_PATH
+
+# --- 리포트 초안 저장소 (Draft Store) ---
+# 리포트 입력 폼은 입력 내용을 브라우저(localStorage)에 계속 보관하고,
+# DRAFT_FLUSH_SECONDS 간격으로 마지막 전송 이후 바뀐 필드(diff)만 서버로 보냅니다.
+# 서버는 사용자당 초안 하나를 보관하여, 다른 기기/브라우저에서 접속하거나 localStorage가 지워져도 이어서 쓸 수 있습니다.
+# 리포트가 저장되면 초안은 삭제됩니다.
+
+DRAFT_FIELDS = ('programName', 'experienceDate', 'jobField', 'rating', 'reportContent')
+DRAFT_FLUSH_SECONDS = 15  # 폼 컴포넌트가 서버로 diff를 보내는 최소 간격
+MAX_DRAFT_CONTENT_LENGTH = 20_000  # 초안 필드 하나에 보관할 최대 글자 수
+
+
+def clean_changes(changes):
+    """초안 필드만 남기고 문자열 길이를 제한합니다."""
+    cleaned = {}
+    for key, value in (changes or {}).items():
+        if key not in DRAFT_FIELDS:
+            continue
+        if isinstance(value, str):
+            value = value[:MAX_DRAFT_CONTENT_LENGTH]
+        cleaned[key] = value
+    return cleaned
+
+
+class DraftRepository:
+    """초안 저장소 인터페이스. 초안(dict)에는 필드 값과 'updatedAt'(브라우저 기준 ms)이 들어 있습니다."""
+
+    def get_draft(self, user_id):
+        """사용자의 초안을 반환합니다. 없으면 None."""
+        raise NotImplementedError
+
+    def apply_changes(self, user_id, changes, updated_at):
+        """
+        바뀐 필드만 기존 초안에 합쳐 저장하고 합쳐진 초안을 반환합니다.
+        updated_at이 저장된 초안보다 오래되었으면(늦게 도착한 diff) 무시하고 기존 초안을 반환합니다.
+        """
+        raise NotImplementedError
+
+    def delete_draft(self, user_id):
+        raise NotImplementedError
+
+
+class InMemoryDraftRepository(DraftRepository):
+    """프로세스 메모리에 초안을 보관하는 저장소 (테스트/데모용)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._drafts = {}
+
+    def get_draft(self, user_id):
+        draft = self._drafts.get(user_id)
+        return dict(draft) if draft else None
+
+    def apply_changes(self, user_id, changes, updated_at):
+        with self._lock:
+            draft = self._drafts.get(user_id) or {}
+            if draft.get('updatedAt', 0) <= updated_at:
+                draft = {**draft, **clean_changes(changes), 'updatedAt': updated_at}
+                self._drafts[user_id] = draft
+            return dict(draft)
+
+    def delete_draft(self, user_id):
+        with self._lock:
+            self._drafts.pop(user_id, None)
+
+
+class SQLiteDraftRepository(DraftRepository):
+    """SQLite 기반 초안 저장소. 리포트 저장소와 같은 DB 파일을 사용합니다."""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS report_drafts (
+                    user_id TEXT PRIMARY KEY,
+                    updated_at INTEGER NOT NULL,
+                    data TEXT NOT NULL
+                )
+            """)
+            self._conn.commit()
+
+    def get_draft(self, user_id):
+        with self._lock:
+            row = self._conn.execute('SELECT data FROM report_drafts WHERE user_id = ?', (user_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def apply_changes(self, user_id, changes, updated_at):
+        with self._lock:
+            try:
+                row = self._conn.execute('SELECT data FROM report_drafts WHERE user_id = ?', (user_id,)).fetchone()
+                draft = json.loads(row[0]) if row else {}
+                if draft.get('updatedAt', 0) <= updated_at:
+                    draft = {**draft, **clean_changes(changes), 'updatedAt': updated_at}
+                    self._conn.execute(
+                        'INSERT INTO report_drafts (user_id, updated_at, data) VALUES (?, ?, ?) '
+                        'ON CONFLICT (user_id) DO UPDATE SET updated_at = excluded.updated_at, data = excluded.data',
+                        (user_id, updated_at, json.dumps(draft, ensure_ascii=False)),
+                    )
+                    self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return draft
+
+    def delete_draft(self, user_id):
+        with self._lock:
+            self._conn.execute('DELETE FROM report_drafts WHERE user_id = ?', (user_id,))
+            self._conn.commit()
+
+
+def create_draft_repository(backend=None, db_path=None):
+    """리포트 저장소와 같은 환경 변수(JOBSTRAVELING_STORAGE / JOBSTRAVELING_DB_PATH)로 초안 저장소를 생성합니다."""
+    backend = backend or os.environ.get('JOBSTRAVELING_STORAGE', 'sqlite')
+    if backend == 'memory':
+        return InMemoryDraftRepository()
+    if backend in ('sqlite', 'firestore'):
+        # Firestore 백엔드에서도 초안은 서버의 SQLite 파일에 둡니다.
+        return SQLiteDraftRepository(db_path or os.environ.get('JOBSTRAVELING_DB_PATH', DEFAULT_DB_PATH))
+    raise ValueError(f"지원하지 않는 저장소 백엔드입니다: {backend}")
@@ -0,0 +1,177 @@
+import io
+import csv
+import sys
+import json
+import argparse
+
+# --- 리포트 내보내기 (Streaming Export) ---
+# 저장소의 iter_reports 제너레이터에서 리포트를 하나씩 받아 CSV / JSONL / Parquet로 직렬화합니다.
+# 전체 리포트 목록을 메모리에 만들지 않고 작은 청크(문자열/바이트) 단위로 흘려보내므로,
+# 리포트 수와 관계없이 메모리 사용량이 일정하게 유지됩니다.
+# - API 서버(api.py)는 iter_export의 바이트 청크를 그대로 HTTP 응답으로 흘려보냅니다. (StreamingResponse)
+# - CLI는 표준 출력/파일에 바로 씁니다.
+# - Streamlit 앱의 내려받기 버튼(st.download_button)은 파일 전체를 세션이 끝날 때까지 서버 메모리에 보관하므로,
+#   API 서버가 없을 때만 크기 제한을 두고 사용합니다. (views/export_reports.py)
+#
+# CLI 사용 예:
+#   python jobstraveling/exporter.py --format csv --school "일반 고등학교" --class 101 > reports.csv
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pyarrow가 없으면 Parquet 내보내기만 비활성화합니다.
+    pyarrow = None
+
+EXPORT_COLUMNS = [
+    'id', 'userId', 'schoolName', 'classNumber', 'studentName',
+    'programName', 'experienceDate', 'jobField', 'rating', 'reportContent', 'createdAt',
+]
+ROWS_PER_CHUNK = 500  # 청크 하나에 담을 행 수 (CSV/JSONL) 및 Parquet row group 크기
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'jsonl': ('application/x-ndjson', 'jsonl'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+
+
+def available_formats():
+    """현재 환경에서 사용할 수 있는 내보내기 형식 목록."""
+    return [name for name in EXPORT_FORMATS if name != 'parquet' or pyarrow is not None]
+
+
+def iter_csv(reports):
+    """리포트를 CSV 텍스트 청크로 변환합니다. (첫 청크는 엑셀 호환을 위한 BOM + 헤더)"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, extrasaction='ignore')
+    buffer.write('\ufeff')
+    writer.writeheader()
+    for i, report in enumerate(reports, 1):
+        writer.writerow(report)
+        if i % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_jsonl(reports):
+    """리포트를 JSON Lines 텍스트 청크로 변환합니다."""
+    lines = []
+    for report in reports:
+        lines.append(json.dumps({key: report.get(key) for key in EXPORT_COLUMNS}, ensure_ascii=False))
+        if len(lines) == ROWS_PER_CHUNK:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+class _ChunkSink:
+    """ParquetWriter가 쓴 바이트를 모아 두었다가 drain()으로 꺼내는 쓰기 전용 파일 객체."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_parquet(reports):
+    """리포트를 ROWS_PER_CHUNK 행 단위 row group으로 나누어 Parquet 바이트 청크로 변환합니다. (pyarrow 필요)"""
+    if pyarrow is None:
+        raise RuntimeError("Parquet 내보내기에는 pyarrow가 필요합니다. (pip install pyarrow)")
+    schema = pyarrow.schema(
+        [(column, pyarrow.int64() if column == 'rating' else pyarrow.string()) for column in EXPORT_COLUMNS]
+    )
+    sink = _ChunkSink()
+    with pyarrow.parquet.ParquetWriter(sink, schema) as writer:
+        batch = []
+        for report in reports:
+            batch.append(report)
+            if len(batch) == ROWS_PER_CHUNK:
+                writer.write_table(pyarrow.Table.from_pylist(batch, schema=schema))
+                batch = []
+                yield sink.drain()
+        if batch:
+            writer.write_table(pyarrow.Table.from_pylist(batch, schema=schema))
+    yield sink.drain()  # 남은 row group과 footer
+
+
+class _Counter:
+    """스트림을 그대로 흘려보내면서 행 수를 셉니다."""
+
+    def __init__(self, iterable):
+        self._iterable = iterable
+        self.count = 0
+
+    def __iter__(self):
+        for item in self._iterable:
+            self.count += 1
+            yield item
+
+
+def iter_export(reports, export_format):
+    """리포트 스트림을 지정한 형식의 바이트 청크로 변환합니다."""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 내보내기 형식입니다: {export_format}")
+    if export_format == 'parquet':
+        yield from iter_parquet(reports)
+        return
+    chunks = iter_csv(reports) if export_format == 'csv' else iter_jsonl(reports)
+    for chunk in chunks:
+        yield chunk.encode('utf-8')
+
+
+def export_reports(reports, export_format, binary_file):
+    """리포트 스트림을 지정한 형식으로 binary_file에 씁니다. 쓴 행 수를 반환합니다."""
+    counter = _Counter(reports)
+    for chunk in iter_export(counter, export_format):
+        binary_file.write(chunk)
+    return counter.count
+
+
+def main(argv=None):
+    from storage import create_report_repository
+
+    parser = argparse.ArgumentParser(description="잡스리포트 내보내기 (CSV/JSONL/Parquet)")
+    parser.add_argument('--format', choices=list(EXPORT_FORMATS), default='csv')
+    parser.add_argument('--school', help="학교 이름으로 필터")
+    parser.add_argument('--class', dest='class_number', help="반 번호로 필터")
+    parser.add_argument('--date-from', help="체험 일자 시작 (YYYY-MM-DD)")
+    parser.add_argument('--date-to', help="체험 일자 끝 (YYYY-MM-DD)")
+    parser.add_argument('--output', help="출력 파일 경로 (기본값: 표준 출력)")
+    parser.add_argument('--db', help="SQLite 파일 경로")
+    args = parser.parse_args(argv)
+
+    repository = create_report_repository(db_path=args.db)
+    reports = repository.iter_reports(args.school, args.class_number, args.date_from, args.date_to)
+    if args.output:
+        with open(args.output, 'wb') as f:
+            count = export_reports(reports, args.format, f)
+    else:
+        count = export_reports(reports, args.format, sys.stdout.buffer)
+    print(f"{count}건 내보냄", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
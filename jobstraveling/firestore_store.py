@@ -0,0 +1,288 @@
+import os
+import json
+import random
+import asyncio
+import itertools
+import threading
+from datetime import datetime
+
+from ids import new_report_id, timestamp_ms_from_iso
+from storage import (
+    ReportRepository, DEFAULT_HEADER_PAGE_SIZE, empty_summary, report_matches, check_storable_report,
+)
+from validation import job_field_key, UNSPECIFIED_JOB_FIELD  # noqa: F401 (기존 import 경로 유지)
+
+# --- Firestore 리포트 저장소 (Async Firestore Backend) ---
+# JOBSTRAVELING_STORAGE=firestore 일 때 사용하는 백엔드입니다. htmls의 Firestore 경로 규칙을 그대로 따릅니다.
+#   artifacts/{appId}/users/{userId}/reports/{reportId}         리포트 (문서 ID = ULID)
+#   artifacts/{appId}/users/{userId}/reportSummary/summary      활동 요약 (Increment/Maximum 변환으로 증분 갱신)
+#   artifacts/{appId}/public/data/reportVersionShards/{n}       data_version 분산 카운터 (n = 0..VERSION_SHARD_COUNT-1)
+#     한 문서에는 초당 약 1회의 지속 쓰기만 가능하므로, 배치마다 임의의 샤드 하나만 증가시키고 읽을 때 합산합니다.
+#
+# 비동기 클라이언트(AsyncClient) 여러 개를 전용 이벤트 루프 스레드 하나에서 돌리는 클라이언트 풀을 두고,
+# Streamlit 스크립트(동기 코드)는 코루틴을 그 루프에 제출한 뒤 결과를 기다립니다.
+# - 여러 문서 읽기는 get_all 한 번(배치 RPC)으로 처리합니다.
+# - 한 페이지에 여러 컬렉션이 필요하면(요약 + 목록 등) asyncio.gather로 동시에 요청합니다.
+#
+# 필요한 색인은 저장소 루트의 firestore.indexes.json에 정의되어 있습니다. 배포 전에 한 번 적용하세요.
+#   firebase deploy --only firestore:indexes
+# - reports collection group의 id 단일 필드 색인: ID로 리포트 조회 (get_report)
+# - reports collection group의 schoolName / classNumber + __name__ 복합 색인: 관리자 내보내기 필터 (iter_reports)
+#
+# 로컬 개발/테스트는 Firestore 에뮬레이터로 합니다. FIRESTORE_EMULATOR_HOST=localhost:8080 이 설정되어 있으면
+# 클라이언트가 자동으로 에뮬레이터에 접속합니다.
+#
+# 환경 변수:
+# - JOBSTRAVELING_FIRESTORE_PROJECT: 프로젝트 ID (없으면 __firebase_config의 projectId)
+# - JOBSTRAVELING_FIRESTORE_POOL_SIZE: 클라이언트 풀 크기 (기본 4)
+# - __app_id: 경로의 appId (runtime.py와 같은 값)
+
+try:
+    from google.cloud import firestore
+    from google.cloud.firestore_v1 import transforms
+    from google.cloud.firestore_v1.field_path import FieldPath
+except ImportError:  # google-cloud-firestore가 없으면 이 백엔드만 사용할 수 없습니다.
+    firestore = None
+
+DEFAULT_POOL_SIZE = int(os.environ.get('JOBSTRAVELING_FIRESTORE_POOL_SIZE', '4'))
+REQUEST_TIMEOUT_SECONDS = 30
+# 목록(헤더) 조회 시 select()로 가져올 필드 (CONTENT_FIELDS 제외)
+HEADER_FIELDS = (
+    'programName', 'experienceDate', 'jobField', 'rating', 'createdAt',
+    'schoolName', 'classNumber', 'studentName',
+)
+WRITE_BATCH_LIMIT = 250  # Firestore 배치 쓰기 한도(500)를 넘지 않도록 (리포트 1건 = 쓰기 2건)
+VERSION_SHARD_COUNT = int(os.environ.get('JOBSTRAVELING_FIRESTORE_VERSION_SHARDS', '16'))
+
+
+def _project_from_env():
+    project = os.environ.get('JOBSTRAVELING_FIRESTORE_PROJECT')
+    if not project:
+        project = json.loads(os.environ.get('__firebase_config', '{}')).get('projectId')
+    if not project:
+        raise ValueError("Firestore 프로젝트 ID가 없습니다. JOBSTRAVELING_FIRESTORE_PROJECT 또는 __firebase_config를 설정하세요.")
+    return project
+
+
+class FirestoreClientPool:
+    """전용 이벤트 루프 스레드에서 AsyncClient 여러 개를 돌아가며 사용하는 클라이언트 풀."""
+
+    def __init__(self, project, size=DEFAULT_POOL_SIZE):
+        if firestore is None:
+            raise RuntimeError("Firestore 백엔드를 사용하려면 google-cloud-firestore 패키지가 필요합니다.")
+        self.project = project
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='firestore-loop', daemon=True)
+        self._thread.start()
+        # gRPC aio 채널이 풀의 이벤트 루프에 묶이도록 클라이언트도 그 루프 안에서 생성합니다.
+        self._clients = [self.run(self._create_client()) for _ in range(max(1, size))]
+        self._next_client = itertools.count()
+
+    @classmethod
+    def from_env(cls):
+        return cls(_project_from_env())
+
+    async def _create_client(self):
+        return firestore.AsyncClient(project=self.project)
+
+    def client(self):
+        """요청마다 풀의 클라이언트를 돌아가며 반환합니다."""
+        return self._clients[next(self._next_client) % len(self._clients)]
+
+    def run(self, coroutine, timeout=REQUEST_TIMEOUT_SECONDS):
+        """코루틴을 풀의 이벤트 루프에서 실행하고 결과를 기다립니다. (Streamlit 스크립트 스레드에서 호출)"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout)
+
+    def gather(self, *coroutines, timeout=REQUEST_TIMEOUT_SECONDS):
+        """여러 코루틴을 동시에 실행하고 결과를 순서대로 반환합니다."""
+        async def run_all():
+            return await asyncio.gather(*coroutines)
+        return self.run(run_all(), timeout)
+
+    def close(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+
+
+class FirestoreReportRepository(ReportRepository):
+    """AsyncClient 풀을 사용하는 Firestore 리포트 저장소."""
+
+    def __init__(self, pool, app_id=None):
+        self.pool = pool
+        self.app_id = app_id or os.environ.get('__app_id', 'default-app-id')
+
+    # --- 경로 ---
+
+    def _app(self, client):
+        return client.collection('artifacts').document(self.app_id)
+
+    def _reports(self, client, user_id):
+        return self._app(client).collection('users').document(user_id).collection('reports')
+
+    def _summary(self, client, user_id):
+        return self._app(client).collection('users').document(user_id).collection('reportSummary').document('summary')
+
+    def _version_shards(self, client):
+        return self._app(client).collection('public').document('data').collection('reportVersionShards')
+
+    @staticmethod
+    def _snapshot_to_report(snapshot):
+        report = snapshot.to_dict()
+        report['id'] = snapshot.id
+        return report
+
+    # --- 쓰기 ---
+
+    def add_report(self, user_id, report_data):
+        return self.add_reports([(user_id, report_data)])[0]
+
+    def add_reports(self, items):
+        return self.pool.run(self._add_reports(items))
+
+    async def _add_reports(self, items):
+        client = self.pool.client()
+        saved = []
+        for start in range(0, len(items), WRITE_BATCH_LIMIT):
+            batch = client.batch()
+            chunk = items[start:start + WRITE_BATCH_LIMIT]
+            for user_id, report_data in chunk:
+                check_storable_report(report_data)
+                report = {k: v for k, v in report_data.items() if k != 'id'}
+                report_id = new_report_id(report['createdAt'])
+                # id/userId를 함께 저장하여 collection group 쿼리(ID 조회, 관리자 내보내기)에서 사용합니다.
+                batch.set(self._reports(client, user_id).document(report_id), {**report, 'id': report_id, 'userId': user_id})
+                # 리포트와 같은 배치에서 요약 문서를 서버 측 변환으로 증분 갱신합니다.
+                batch.set(self._summary(client, user_id), {
+                    'reportCount': transforms.Increment(1),
+                    'ratingSum': transforms.Increment(report.get('rating') or 0),
+                    'lastCreatedAtMs': transforms.Maximum(timestamp_ms_from_iso(report['createdAt']) or 0),
+                    'jobFieldCounts': {job_field_key(report): transforms.Increment(1)},
+                }, merge=True)
+                saved.append({**report, 'id': report_id})
+            shard = self._version_shards(client).document(str(random.randrange(VERSION_SHARD_COUNT)))
+            batch.set(shard, {'count': transforms.Increment(len(chunk))}, merge=True)
+            await batch.commit()
+        return saved
+
+    # --- 읽기 ---
+
+    def get_report(self, report_id, user_id=None):
+        return self.pool.run(self._get_report(report_id, user_id))
+
+    async def _get_report(self, report_id, user_id):
+        client = self.pool.client()
+        if user_id is not None:
+            snapshot = await self._reports(client, user_id).document(report_id).get()
+            return self._snapshot_to_report(snapshot) if snapshot.exists else None
+        # 작성자를 모르면 collection group 쿼리로 찾습니다. (userId로 경로를 아는 경우보다 느림)
+        query = client.collection_group('reports').where(filter=firestore.FieldFilter('id', '==', report_id)).limit(1)
+        async for snapshot in query.stream():
+            if snapshot.reference.path.startswith(f'artifacts/{self.app_id}/'):
+                return self._snapshot_to_report(snapshot)
+        return None
+
+    def get_reports(self, report_ids, user_id):
+        return self.pool.run(self._get_reports(report_ids, user_id))
+
+    async def _get_reports(self, report_ids, user_id):
+        # 문서 여러 개를 get_all 한 번(BatchGetDocuments)으로 읽고, 요청한 ID 순서대로 돌려줍니다.
+        client = self.pool.client()
+        collection = self._reports(client, user_id)
+        found = {}
+        async for snapshot in client.get_all([collection.document(report_id) for report_id in report_ids]):
+            if snapshot.exists:
+                found[snapshot.id] = self._snapshot_to_report(snapshot)
+        return [found[report_id] for report_id in report_ids if report_id in found]
+
+    def _newest_first(self, client, user_id, before=None):
+        query = self._reports(client, user_id).order_by(FieldPath.document_id(), direction=firestore.Query.DESCENDING)
+        if before:
+            query = query.start_after({FieldPath.document_id(): self._reports(client, user_id).document(before)})
+        return query
+
+    def list_reports(self, user_id, limit=None, offset=0):
+        return self.pool.run(self._list_reports(user_id, limit, offset))
+
+    async def _list_reports(self, user_id, limit, offset):
+        query = self._newest_first(self.pool.client(), user_id).offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return [self._snapshot_to_report(snapshot) async for snapshot in query.stream()]
+
+    def list_report_headers(self, user_id, before=None, limit=DEFAULT_HEADER_PAGE_SIZE):
+        return self.pool.run(self._list_report_headers(user_id, before, limit))
+
+    async def _list_report_headers(self, user_id, before, limit):
+        # select()로 본문(CONTENT_FIELDS)을 빼고 limit + 1개만 읽어 다음 페이지 유무를 판단합니다.
+        query = self._newest_first(self.pool.client(), user_id, before).select(list(HEADER_FIELDS)).limit(limit + 1)
+        snapshots = [snapshot async for snapshot in query.stream()]
+        headers = [self._snapshot_to_report(snapshot) for snapshot in snapshots[:limit]]
+        return headers, (headers[-1]['id'] if len(snapshots) > limit else None)
+
+    def load_report_page(self, user_id, before=None, limit=DEFAULT_HEADER_PAGE_SIZE):
+        # 요약 문서(리포트 수)와 리포트 목록 컬렉션을 동시에 요청합니다.
+        summary, (headers, next_cursor) = self.pool.gather(
+            self._get_summary(user_id), self._list_report_headers(user_id, before, limit),
+        )
+        return summary['reportCount'], headers, next_cursor
+
+    def count_reports(self, user_id):
+        return self.get_summary(user_id)['reportCount']
+
+    def iter_reports(self, school_name=None, class_number=None, date_from=None, date_to=None, batch_size=500,
+                     include_content=True):
+        # 전체 사용자의 reports 하위 컬렉션을 collection group 쿼리로 batch_size씩 나누어 읽습니다.
+        # 학교/반 조건은 Firestore에서, 체험 일자 범위는 report_matches로 거릅니다. (복합 색인 없이 동작)
+        last_snapshot = None
+        while True:
+            snapshots = self.pool.run(
+                self._iter_batch(school_name, class_number, last_snapshot, batch_size, include_content)
+            )
+            if not snapshots:
+                return
+            for snapshot in snapshots:
+                if not snapshot.reference.path.startswith(f'artifacts/{self.app_id}/'):
+                    continue
+                report = self._snapshot_to_report(snapshot)
+                if report_matches(report, None, None, date_from, date_to):
+                    yield report
+            last_snapshot = snapshots[-1]
+
+    async def _iter_batch(self, school_name, class_number, last_snapshot, batch_size, include_content=True):
+        query = self.pool.client().collection_group('reports')
+        if school_name:
+            query = query.where(filter=firestore.FieldFilter('schoolName', '==', school_name))
+        if class_number:
+            query = query.where(filter=firestore.FieldFilter('classNumber', '==', class_number))
+        query = query.order_by(FieldPath.document_id())
+        if last_snapshot is not None:
+            query = query.start_after(last_snapshot)
+        if not include_content:
+            query = query.select(list(HEADER_FIELDS) + ['id', 'userId'])
+        return [snapshot async for snapshot in query.limit(batch_size).stream()]
+
+    def data_version(self):
+        return self.pool.run(self._data_version())
+
+    async def _data_version(self):
+        # 샤드 문서(최대 VERSION_SHARD_COUNT개)를 한 번에 읽어 합산합니다.
+        total = 0
+        async for snapshot in self._version_shards(self.pool.client()).stream():
+            total += (snapshot.to_dict() or {}).get('count', 0)
+        return total
+
+    def get_summary(self, user_id):
+        return self.pool.run(self._get_summary(user_id))
+
+    async def _get_summary(self, user_id):
+        snapshot = await self._summary(self.pool.client(), user_id).get()
+        totals = snapshot.to_dict() if snapshot.exists else None
+        if not totals or not totals.get('reportCount'):
+            return empty_summary()
+        last_ms = totals.get('lastCreatedAtMs')
+        return {
+            'reportCount': totals['reportCount'],
+            'lastReportDate': datetime.fromtimestamp(last_ms / 1000).date().isoformat() if last_ms else None,
+            'averageRating': round(totals.get('ratingSum', 0) / totals['reportCount'], 2),
+            'jobFieldCounts': dict(totals.get('jobFieldCounts') or {}),
+        }
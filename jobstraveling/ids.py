@@ -0,0 +1,69 @@
+import time
+import secrets
+import threading
+from datetime import datetime
+
+# --- 리포트 ID 생성기 (ULID) ---
+# 48비트 밀리초 타임스탬프 + 80비트 난수를 Crockford Base32 26자로 인코딩한 ID입니다.
+# - 문자열 정렬 순서가 곧 생성(작성) 시각 순서이므로, 목록을 createdAt으로 다시 정렬할 필요가 없습니다.
+# - 난수 부분이 80비트라 여러 서버 프로세스가 조율 없이 ID를 만들어도 충돌하지 않습니다.
+# - 같은 밀리초에 여러 ID를 만들면 난수 부분을 1씩 증가시켜 프로세스 안에서 단조 증가를 보장합니다.
+
+CROCKFORD_BASE32 = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+ID_LENGTH = 26
+RANDOM_BITS = 80
+MAX_TIMESTAMP_MS = (1 << 48) - 1
+
+
+def _encode(value):
+    chars = []
+    for _ in range(ID_LENGTH):
+        chars.append(CROCKFORD_BASE32[value & 31])
+        value >>= 5
+    return ''.join(reversed(chars))
+
+
+def timestamp_ms_from_iso(value):
+    """ISO 형식 시각 문자열(createdAt)을 밀리초 타임스탬프로 변환합니다. 해석할 수 없으면 None."""
+    try:
+        return int(datetime.fromisoformat(value).timestamp() * 1000)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+class ULIDGenerator:
+    """프로세스 안에서 단조 증가하는 ULID 생성기."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def new_id(self, timestamp_ms=None):
+        """
+        ID를 생성합니다. timestamp_ms를 주면 그 시각의 ID를 만듭니다. (과거 리포트 가져오기 등)
+        마지막으로 만든 ID보다 과거 시각이면 단조 증가 상태를 바꾸지 않고 난수만으로 만듭니다.
+        """
+        with self._lock:
+            if timestamp_ms is None:
+                # 현재 시각은 Lock 안에서 읽습니다. (Lock 밖에서 읽으면 먼저 시각을 읽은 스레드가 나중에 ID를 만들어 순서가 뒤집힐 수 있음)
+                timestamp_ms = time.time_ns() // 1_000_000
+            timestamp_ms = max(0, min(MAX_TIMESTAMP_MS, timestamp_ms))
+            if timestamp_ms < self._last_ms:
+                random_part = secrets.randbits(RANDOM_BITS)
+            else:
+                if timestamp_ms == self._last_ms and self._last_random < (1 << RANDOM_BITS) - 1:
+                    self._last_random += 1
+                else:
+                    self._last_ms = timestamp_ms
+                    self._last_random = secrets.randbits(RANDOM_BITS)
+                timestamp_ms, random_part = self._last_ms, self._last_random
+        return _encode((timestamp_ms << RANDOM_BITS) | random_part)
+
+
+_GENERATOR = ULIDGenerator()
+
+
+def new_report_id(created_at=None):
+    """리포트 ID를 생성합니다. createdAt이 있으면 그 시각을, 없으면 현재 시각을 ID에 담습니다."""
+    return _GENERATOR.new_id(timestamp_ms_from_iso(created_at) if created_at else None)
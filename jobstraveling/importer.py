@@ -0,0 +1,243 @@
+import os
+import io
+import csv
+import json
+import time
+import uuid
+import argparse
+from datetime import datetime
+from itertools import islice
+
+from ids import timestamp_ms_from_iso
+from validation import (
+    validate_report, validate_program, normalize_program, PROGRAM_DUPLICATE_MESSAGE, UNSPECIFIED_JOB_FIELD,
+)
+
+# --- 대량 가져오기 (Bulk Import) ---
+# 학교 단위로 프로그램/과거 리포트를 한꺼번에 등록하기 위한 파이프라인입니다.
+# CSV 또는 JSONL 파일을 한 줄씩 스트리밍으로 읽어 chunk_size 단위로 나누고,
+# 화면 저장과 같은 규칙(validation.py)으로 검사한 뒤 chunk마다 한 번의 배치 트랜잭션으로 저장합니다.
+# 파일 전체를 메모리에 올리지 않으므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+#
+# CLI 사용 예 (리포트를 SQLite 저장소로 가져오기):
+#   python jobstraveling/importer.py reports reports.csv --chunk-size 2000
+# 프로그램은 모든 서버 프로세스가 공유하는 SQLite 프로그램 저장소(programs.py)에 저장되며, 관리자 페이지(대량 가져오기)에서
+# 가져옵니다. 가져온 서버의 카탈로그와 검색 색인에는 바로 반영되고, 다른 서버 프로세스는 다음 조회 때 변경분을 읽어 반영합니다.
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REJECTS_KEPT = 100  # 화면/로그에 보여줄 거부 행 수 상한 (전체 거부 수는 별도로 집계)
+
+SUPPORTED_FORMATS = ('csv', 'jsonl')
+
+
+class ImportResult:
+    """가져오기 결과 (읽은 행 수, 저장된 행 수, 거부된 행 수, 처리 속도)."""
+
+    def __init__(self):
+        self.rows_read = 0
+        self.rows_imported = 0
+        self.rows_rejected = 0
+        self.rejects = []  # [(행 번호, 사유), ...] (최대 MAX_REJECTS_KEPT개)
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_sec(self):
+        return self.rows_read / self.elapsed if self.elapsed else 0.0
+
+    def reject(self, row_number, reason):
+        self.rows_rejected += 1
+        if len(self.rejects) < MAX_REJECTS_KEPT:
+            self.rejects.append((row_number, reason))
+
+    def summary(self):
+        return (f"{self.rows_read}행 읽음 · {self.rows_imported}행 저장 · {self.rows_rejected}행 거부 "
+                f"({self.elapsed:.2f}초, {self.rows_per_sec:,.0f}행/초)")
+
+
+def detect_format(file_name):
+    """파일 확장자로 형식(csv/jsonl)을 판단합니다."""
+    extension = os.path.splitext(file_name)[1].lower().lstrip('.')
+    if extension == 'json':
+        extension = 'jsonl'
+    if extension not in SUPPORTED_FORMATS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {file_name} (CSV 또는 JSONL만 가능)")
+    return extension
+
+
+def iter_records(text_file, file_format):
+    """텍스트 파일에서 (행 번호, dict 또는 오류 메시지)를 하나씩 읽어 반환합니다."""
+    if file_format == 'csv':
+        for row_number, row in enumerate(csv.DictReader(text_file), 2):  # 1행은 헤더
+            yield row_number, row
+    else:
+        for row_number, line in enumerate(text_file, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield row_number, f"JSON 형식 오류: {e.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield row_number, "JSON 객체가 아닙니다."
+                continue
+            yield row_number, record
+
+
+def _text(row, key):
+    """행의 값을 문자열로 읽습니다. JSONL의 숫자 값(예: "userId": 5)도 문자열로 바꿉니다."""
+    value = row.get(key)
+    return '' if value is None else str(value).strip()
+
+
+def _parse_rating(rating):
+    """별점 값을 0~5 정수로 변환합니다. 4.5처럼 정수가 아닌 값은 버리지 않고 거부합니다."""
+    if isinstance(rating, bool):
+        raise ValueError(f"별점이 숫자가 아닙니다: {rating}")
+    try:
+        number = float(rating)
+    except (TypeError, ValueError):
+        raise ValueError(f"별점이 숫자가 아닙니다: {rating}")
+    if not number.is_integer():
+        raise ValueError(f"별점은 정수여야 합니다: {rating}")
+    if not 0 <= number <= 5:
+        raise ValueError(f"별점은 0~5 사이여야 합니다: {rating}")
+    return int(number)
+
+
+def parse_report_row(row):
+    """
+    가져오기 행을 (user_id, report_data)로 변환합니다.
+    userId(또는 email) 열이 필요하며, createdAt이 없으면 현재 시각을 사용합니다.
+    createdAt은 리포트 ID(ULID)의 시각이 되므로 ISO 형식으로 해석할 수 없으면 거부합니다.
+    """
+    user_id = _text(row, 'userId') or _text(row, 'email')
+    if not user_id:
+        raise ValueError("userId(또는 email) 열이 비어 있습니다.")
+    report = {
+        'programName': _text(row, 'programName'),
+        'experienceDate': _text(row, 'experienceDate'),
+        'jobField': _text(row, 'jobField') or UNSPECIFIED_JOB_FIELD,
+        'reportContent': '' if row.get('reportContent') is None else str(row['reportContent']),
+        'rating': None,
+    }
+    # 작성자 정보(학교/반/이름)는 있으면 함께 저장하여 관리자 내보내기 필터에 사용합니다.
+    for key in ('schoolName', 'classNumber', 'studentName'):
+        if _text(row, key):
+            report[key] = _text(row, key)
+    rating = row.get('rating')
+    if rating is not None and _text(row, 'rating'):
+        report['rating'] = _parse_rating(rating)
+    error_message = validate_report(report)
+    if error_message:
+        raise ValueError(error_message)
+    created_at = _text(row, 'createdAt')
+    if created_at and timestamp_ms_from_iso(created_at) is None:
+        raise ValueError(f"작성 시각(createdAt)을 ISO 형식으로 해석할 수 없습니다: {created_at}")
+    report['createdAt'] = created_at or datetime.now().isoformat()
+    return user_id, report
+
+
+def parse_program_row(row):
+    """가져오기 행을 카탈로그 프로그램 dict로 변환합니다. (화면 등록과 같이 정규화하며, id가 없으면 새로 부여)"""
+    program = normalize_program({key: row.get(key) for key in ('name', 'field', 'description', 'date', 'location')})
+    program['id'] = _text(row, 'id')
+    error_message = validate_program(program)
+    if error_message:
+        raise ValueError(error_message)
+    program['id'] = program['id'] or uuid.uuid4().hex[:12]
+    return program
+
+
+def run_import(records, parse_row, save_batch, chunk_size=DEFAULT_CHUNK_SIZE, on_progress=None, duplicate_reason=None):
+    """
+    레코드 스트림을 chunk 단위로 검사/저장합니다.
+    - parse_row(row): 저장할 값으로 변환, 잘못된 행은 ValueError
+    - save_batch(values): chunk 하나를 한 번의 트랜잭션으로 저장
+      duplicate_reason을 주면 save_batch는 (저장된 목록, 중복으로 건너뛴 값 목록)을 반환하고,
+      건너뛴 값의 행은 이 사유로 거부 처리됩니다.
+    - on_progress(result): chunk 저장 후 호출 (진행률 표시용)
+    """
+    result = ImportResult()
+    started = time.perf_counter()
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+        values, value_rows = [], []
+        for row_number, row in chunk:
+            result.rows_read += 1
+            if isinstance(row, str):
+                result.reject(row_number, row)
+                continue
+            try:
+                values.append(parse_row(row))
+                value_rows.append(row_number)
+            except ValueError as e:
+                result.reject(row_number, str(e))
+        if values:
+            saved = save_batch(values)
+            if duplicate_reason is None:
+                result.rows_imported += len(values)
+            else:
+                saved, duplicates = saved
+                duplicate_ids = {id(value) for value in duplicates}
+                for row_number, value in zip(value_rows, values):
+                    if id(value) in duplicate_ids:
+                        result.reject(row_number, duplicate_reason)
+                result.rows_imported += len(saved)
+        result.elapsed = time.perf_counter() - started
+        if on_progress:
+            on_progress(result)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def import_reports(text_file, file_format, save_batch, chunk_size=DEFAULT_CHUNK_SIZE, on_progress=None):
+    """리포트 파일을 가져옵니다. save_batch는 [(user_id, report_data), ...]를 받습니다."""
+    return run_import(iter_records(text_file, file_format), parse_report_row, save_batch, chunk_size, on_progress)
+
+
+def import_programs(text_file, file_format, save_batch, chunk_size=DEFAULT_CHUNK_SIZE, on_progress=None):
+    """
+    프로그램 파일을 가져옵니다. save_batch는 [program, ...]을 받아 (저장된 목록, 중복 목록)을 반환합니다.
+    (runtime.import_programs_batch: 이미 등록된 프로그램과 같은 이름/일자/장소의 행은 중복으로 거부됩니다)
+    """
+    return run_import(iter_records(text_file, file_format), parse_program_row, save_batch, chunk_size, on_progress,
+                      duplicate_reason=PROGRAM_DUPLICATE_MESSAGE)
+
+
+def open_text(binary_file):
+    """업로드된 바이너리 파일을 스트리밍 텍스트 파일로 감쌉니다. (BOM이 있는 엑셀 CSV 포함)"""
+    return io.TextIOWrapper(binary_file, encoding='utf-8-sig', newline='')
+
+
+def main(argv=None):
+    from storage import create_report_repository
+
+    parser = argparse.ArgumentParser(description="잡스리포트 대량 가져오기 (CSV/JSONL)")
+    parser.add_argument('kind', choices=['reports'], help="가져올 데이터 종류")
+    parser.add_argument('path', help="가져올 파일 경로 (.csv 또는 .jsonl)")
+    parser.add_argument('--format', choices=SUPPORTED_FORMATS, help="파일 형식 (기본값: 확장자로 판단)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="배치 트랜잭션당 행 수")
+    parser.add_argument('--db', help="SQLite 파일 경로 (기본값: JOBSTRAVELING_DB_PATH 또는 data/jobstraveling.db)")
+    args = parser.parse_args(argv)
+
+    repository = create_report_repository(db_path=args.db)
+    file_format = args.format or detect_format(args.path)
+    with open(args.path, 'r', encoding='utf-8-sig', newline='') as f:
+        result = import_reports(
+            f, file_format, repository.add_reports, args.chunk_size,
+            on_progress=lambda r: print(f"\r{r.rows_read:,}행 처리 중...", end='', flush=True),
+        )
+    print()
+    print(result.summary())
+    for row_number, reason in result.rejects:
+        print(f"  {row_number}행: {reason}")
+    return 0 if not result.rows_rejected else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,126 @@
+import os
+import time
+import functools
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+# --- 렌더링 프로파일러 (Instrumentation) ---
+# 환경 변수 JOBSTRAVELING_PROFILE=1 일 때만 동작하는 계측 계층입니다.
+# 페이지 렌더 함수, HTML 로드/치환, components.html, 저장소 호출 시간을 이름별로 기록하고
+# 최근 WINDOW_SIZE개 측정값으로 p50/p90/p99를 계산합니다. (프로세스 메모리에만 보관)
+# 꺼져 있으면 instrument()는 원래 함수를 그대로 반환하고 timed()는 아무것도 하지 않으므로 오버헤드가 없습니다.
+
+ENABLED = os.environ.get('JOBSTRAVELING_PROFILE', '') not in ('', '0', 'false')
+WINDOW_SIZE = 1000  # 지표별로 보관할 최근 측정값 수
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _percentile(sorted_values, quantile):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(quantile * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class RollingTimer:
+    """최근 측정값(초)을 고정 크기 창으로 보관하는 타이머."""
+
+    __slots__ = ('samples', 'count', 'total')
+
+    def __init__(self):
+        self.samples = deque(maxlen=WINDOW_SIZE)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds):
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+
+
+class Profiler:
+    """이름별 RollingTimer를 관리하는 프로세스 단위 프로파일러."""
+
+    def __init__(self, enabled=ENABLED):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._timers = {}
+
+    def record(self, name, seconds):
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                timer = self._timers[name] = RollingTimer()
+            timer.record(seconds)
+
+    @contextmanager
+    def timed(self, name):
+        """with 블록의 실행 시간을 기록합니다. (st.rerun 등 예외로 빠져나가도 기록)"""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def instrument(self, name):
+        """함수 실행 시간을 기록하는 데코레이터."""
+        def decorator(func):
+            if not self.enabled:
+                return func
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timed(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def instrument_methods(self, obj, prefix, method_names):
+        """객체의 지정한 메서드들을 계측 래퍼로 바꿉니다. (저장소 인스턴스 등)"""
+        if self.enabled:
+            for method_name in method_names:
+                method = getattr(obj, method_name, None)
+                if method is not None:
+                    setattr(obj, method_name, self.instrument(f"{prefix}.{method_name}")(method))
+        return obj
+
+    def reset(self):
+        with self._lock:
+            self._timers.clear()
+
+    def snapshot(self):
+        """지표별 호출 수, 평균, 백분위수(ms)를 이름순으로 반환합니다."""
+        with self._lock:
+            items = [(name, timer.count, timer.total, sorted(timer.samples)) for name, timer in self._timers.items()]
+        rows = []
+        for name, count, total, samples in sorted(items):
+            row = {'name': name, 'count': count, 'mean_ms': round(total / count * 1000, 3)}
+            for quantile in QUANTILES:
+                row[f"p{int(quantile * 100)}_ms"] = round(_percentile(samples, quantile) * 1000, 3)
+            row['max_ms'] = round(samples[-1] * 1000, 3) if samples else 0.0
+            rows.append(row)
+        return rows
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 노출 형식(summary)으로 지표를 직렬화합니다."""
+        lines = [
+            '# HELP jobstraveling_duration_seconds Duration of instrumented render steps and storage calls.',
+            '# TYPE jobstraveling_duration_seconds summary',
+        ]
+        with self._lock:
+            items = [(name, timer.count, timer.total, sorted(timer.samples)) for name, timer in self._timers.items()]
+        for name, count, total, samples in sorted(items):
+            for quantile in QUANTILES:
+                lines.append(f'jobstraveling_duration_seconds{{name="{name}",quantile="{quantile}"}} '
+                             f'{_percentile(samples, quantile):.6f}')
+            lines.append(f'jobstraveling_duration_seconds_sum{{name="{name}"}} {total:.6f}')
+            lines.append(f'jobstraveling_duration_seconds_count{{name="{name}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+# 프로세스 전체에서 공유하는 프로파일러 (모듈은 Streamlit 재실행 사이에도 한 번만 import됩니다)
+PROFILER = Profiler()
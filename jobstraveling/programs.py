@@ -0,0 +1,245 @@
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+
+from storage import DEFAULT_DB_PATH
+
+# --- 프로그램 저장소 (Program Store) ---
+# 프로그램 카탈로그(catalog.py)는 프로세스 메모리의 인덱스이므로, 여러 Streamlit/API 프로세스가 같은 목록을 보도록
+# 원본은 공유 저장소(기본값 SQLite 파일)에 둡니다. 저장될 때마다 증가하는 순번(seq)을 부여하여,
+# 각 프로세스는 마지막으로 반영한 순번 이후의 변경분만 읽어 자신의 카탈로그와 검색 색인에 반영합니다.
+# 관리자가 새로 등록하는 프로그램은 정규화한 (이름, 일자, 장소)의 해시(fingerprint)로 중복을 막습니다.
+# 해시 색인도 공유 저장소에 두므로 여러 프로세스에서 같은 프로그램을 동시에 등록해도 한 건만 저장됩니다.
+
+
+def program_fingerprint(program):
+    """이름/일자/장소를 정규화(NFKC, 대소문자, 연속 공백)해 만든 중복 판정용 해시."""
+    parts = (' '.join(unicodedata.normalize('NFKC', str(program.get(key) or '')).casefold().split())
+             for key in ('name', 'date', 'location'))
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+class ProgramRepository:
+    """프로그램 저장소 인터페이스."""
+
+    def upsert_programs(self, programs):
+        """프로그램을 추가(같은 id면 교체)하고 저장된 프로그램 목록을 반환합니다."""
+        raise NotImplementedError
+
+    def insert_new_programs(self, programs):
+        """
+        같은 fingerprint의 프로그램이 없을 때만 저장합니다. (한 번의 트랜잭션)
+        반환값: (저장된 프로그램 목록, 중복으로 건너뛴 프로그램 목록)
+        """
+        raise NotImplementedError
+
+    def ensure_programs(self, programs):
+        """저장소가 비어 있을 때만 초기 프로그램을 저장합니다."""
+        raise NotImplementedError
+
+    def changes_since(self, seq):
+        """seq 이후에 저장된 프로그램을 저장 순서대로 반환합니다. 반환값: (programs, last_seq)"""
+        raise NotImplementedError
+
+
+class InMemoryProgramRepository(ProgramRepository):
+    """프로세스 메모리에 프로그램을 보관하는 저장소 (테스트/데모용)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._log = []  # [(seq, program)] — 같은 id가 다시 저장되면 새 순번으로 추가됩니다.
+        self._fingerprints = {}  # {fingerprint: programId}
+        self._fingerprint_by_id = {}  # {programId: fingerprint}
+
+    def _append(self, program):
+        program = {**program, 'id': str(program['id'])}
+        previous = self._fingerprint_by_id.pop(program['id'], None)
+        if previous is not None and self._fingerprints.get(previous) == program['id']:
+            del self._fingerprints[previous]
+        fingerprint = program_fingerprint(program)
+        self._fingerprints[fingerprint] = program['id']
+        self._fingerprint_by_id[program['id']] = fingerprint
+        self._log.append((len(self._log) + 1, program))
+        return dict(program)
+
+    def upsert_programs(self, programs):
+        with self._lock:
+            return [self._append(program) for program in programs]
+
+    def insert_new_programs(self, programs):
+        saved, duplicates = [], []
+        with self._lock:
+            for program in programs:
+                if program_fingerprint(program) in self._fingerprints:
+                    duplicates.append(program)
+                else:
+                    saved.append(self._append(program))
+        return saved, duplicates
+
+    def ensure_programs(self, programs):
+        with self._lock:
+            if self._log:
+                return
+        self.upsert_programs(programs)
+
+    def changes_since(self, seq):
+        with self._lock:
+            changes = self._log[seq:]
+            return [dict(program) for _, program in changes], len(self._log)
+
+
+class SQLiteProgramRepository(ProgramRepository):
+    """SQLite 기반 프로그램 저장소. 리포트 저장소와 같은 DB 파일을 사용합니다."""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            # 교체 시 행을 지우고 다시 넣어 새 seq를 받습니다. (AUTOINCREMENT: 지운 seq를 재사용하지 않음)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS programs (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    program_id TEXT NOT NULL UNIQUE,
+                    data TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS program_fingerprints (
+                    fingerprint TEXT PRIMARY KEY,
+                    program_id TEXT NOT NULL
+                )
+            """)
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_program_fingerprints_id ON program_fingerprints (program_id)')
+            self._conn.commit()
+        self._backfill_fingerprints()
+
+    def _backfill_fingerprints(self):
+        """해시 색인이 생기기 전에 저장된 프로그램의 fingerprint를 채웁니다. (한 번만 수행됨)"""
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT data FROM programs
+                WHERE program_id NOT IN (SELECT program_id FROM program_fingerprints)
+            """).fetchall()
+            if not rows:
+                return
+            try:
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO program_fingerprints (fingerprint, program_id) VALUES (?, ?)',
+                    [(program_fingerprint(program), program['id']) for program in map(json.loads, (row[0] for row in rows))],
+                )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def _write(self, program):
+        program = {**program, 'id': str(program['id'])}
+        self._conn.execute('DELETE FROM programs WHERE program_id = ?', (program['id'],))
+        self._conn.execute('DELETE FROM program_fingerprints WHERE program_id = ?', (program['id'],))
+        self._conn.execute(
+            'INSERT INTO programs (program_id, data) VALUES (?, ?)',
+            (program['id'], json.dumps(program, ensure_ascii=False)),
+        )
+        self._conn.execute(
+            'INSERT OR REPLACE INTO program_fingerprints (fingerprint, program_id) VALUES (?, ?)',
+            (program_fingerprint(program), program['id']),
+        )
+        return program
+
+    def upsert_programs(self, programs):
+        with self._lock:
+            try:
+                saved = [self._write(program) for program in programs]
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return saved
+
+    def insert_new_programs(self, programs):
+        saved, duplicates = [], []
+        with self._lock:
+            try:
+                # BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡아, 다른 프로세스가 확인과 저장 사이에 끼어들지 못하게 합니다.
+                self._conn.execute('BEGIN IMMEDIATE')
+                for program in programs:
+                    exists = self._conn.execute(
+                        'SELECT 1 FROM program_fingerprints WHERE fingerprint = ?', (program_fingerprint(program),)
+                    ).fetchone()
+                    if exists:
+                        duplicates.append(program)
+                    else:
+                        saved.append(self._write(program))
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return saved, duplicates
+
+    def ensure_programs(self, programs):
+        with self._lock:
+            has_programs = self._conn.execute('SELECT 1 FROM programs LIMIT 1').fetchone() is not None
+        if not has_programs:
+            # 여러 프로세스가 동시에 초기화해도 같은 id로 교체될 뿐이므로 결과는 같습니다.
+            self.upsert_programs(programs)
+
+    def changes_since(self, seq):
+        with self._lock:
+            rows = self._conn.execute('SELECT seq, data FROM programs WHERE seq > ? ORDER BY seq', (seq,)).fetchall()
+        if not rows:
+            return [], seq
+        return [json.loads(row[1]) for row in rows], rows[-1][0]
+
+
+class ProgramCatalogReplica:
+    """
+    공유 프로그램 저장소의 변경분을 이 프로세스의 카탈로그(ProgramCatalog)에 반영합니다.
+    sync()는 마지막으로 반영한 seq 이후의 행만 읽으므로, 변경이 없으면 인덱스 범위 조회 한 번으로 끝납니다.
+    on_program은 반영된 프로그램마다 호출됩니다. (검색 색인 갱신용)
+    """
+
+    def __init__(self, repository, catalog, on_program=None):
+        self.repository = repository
+        self.catalog = catalog
+        self.on_program = on_program
+        self._lock = threading.Lock()
+        self._seq = 0
+
+    def sync(self):
+        with self._lock:
+            programs, self._seq = self.repository.changes_since(self._seq)
+            for program in self.catalog.add_programs(programs):
+                if self.on_program is not None:
+                    self.on_program(program)
+        return self.catalog
+
+    def add_programs(self, programs):
+        """프로그램을 공유 저장소에 저장한 뒤 이 프로세스의 카탈로그에 바로 반영합니다."""
+        saved = self.repository.upsert_programs(programs)
+        self.sync()
+        return saved
+
+    def add_new_programs(self, programs):
+        """중복이 아닌 프로그램만 저장하고 카탈로그에 반영합니다. 반환값: (saved, duplicates)"""
+        saved, duplicates = self.repository.insert_new_programs(programs)
+        if saved:
+            self.sync()
+        return saved, duplicates
+
+
+def create_program_repository(backend=None, db_path=None):
+    """리포트 저장소와 같은 환경 변수(JOBSTRAVELING_STORAGE / JOBSTRAVELING_DB_PATH)로 프로그램 저장소를 생성합니다."""
+    backend = backend or os.environ.get('JOBSTRAVELING_STORAGE', 'sqlite')
+    if backend == 'memory':
+        return InMemoryProgramRepository()
+    if backend in ('sqlite', 'firestore'):
+        # Firestore 백엔드는 리포트만 담당하므로 프로그램은 서버의 SQLite 파일에 둡니다.
+        return SQLiteProgramRepository(db_path or os.environ.get('JOBSTRAVELING_DB_PATH', DEFAULT_DB_PATH))
+    raise ValueError(f"지원하지 않는 저장소 백엔드입니다: {backend}")
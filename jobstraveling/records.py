@@ -0,0 +1,175 @@
+import sys
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# --- 메모리 절약형 레코드 (Compact Records) ---
+# 프로세스 메모리에 오래 보관하는 리포트/프로그램(InMemoryReportRepository, ProgramCatalog)을 dict 대신
+# __slots__ 데이터클래스로 보관합니다. dict는 레코드마다 키 해시 테이블을 따로 가지므로 필드가 10개 안팎이어도
+# 수백 바이트의 오버헤드가 생깁니다.
+# - 반복되는 짧은 값(jobField, programName, 날짜, 학교명, 장소 등)은 sys.intern으로 한 벌만 보관합니다.
+# - createdAt은 ISO 문자열 대신 에포크 기준 마이크로초 정수로 보관합니다. (시간대 없는 로컬 시각 그대로, 무손실 변환)
+# - 목록(헤더)에 쓰지 않는 소감 본문(reportContent)은 레코드 밖의 ContentStore에 두고 번호로만 참조합니다.
+# 저장소 밖으로 내보낼 때는 to_dict()로 기존과 같은 dict를 만듭니다.
+
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def iso_to_epoch_us(value):
+    """
+    시간대 없는 ISO 시각 문자열을 에포크 기준 마이크로초 정수로 변환합니다.
+    정수에서 같은 문자열로 되돌릴 수 없으면(시간대 포함, 날짜만 있는 값 등) None.
+    """
+    if type(value) is not str:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        return None
+    epoch_us = (parsed - _NAIVE_EPOCH) // timedelta(microseconds=1)
+    return epoch_us if epoch_us_to_iso(epoch_us) == value else None
+
+
+def epoch_us_to_iso(epoch_us):
+    """iso_to_epoch_us의 역변환."""
+    return (_NAIVE_EPOCH + timedelta(microseconds=epoch_us)).isoformat()
+
+
+class ContentStore:
+    """큰 본문 문자열을 레코드 밖에 보관합니다. put()이 돌려준 번호로 get()합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._contents = []
+
+    def __len__(self):
+        return len(self._contents)
+
+    def put(self, content):
+        with self._lock:
+            self._contents.append(content)
+            return len(self._contents) - 1
+
+    def get(self, ref):
+        return self._contents[ref]
+
+
+# 같은 값이 여러 리포트에 반복되어 sys.intern으로 공유하는 리포트 키
+REPORT_INTERNED_KEYS = ('programName', 'experienceDate', 'jobField', 'schoolName', 'classNumber', 'studentName')
+
+
+@dataclass(slots=True)
+class ReportRecord:
+    """리포트 한 건. 값이 없는 필드는 None이며 to_dict()에서 빠집니다."""
+
+    id: str
+    program_name: str = None
+    experience_date: str = None
+    job_field: str = None
+    rating: int = None
+    created_at_us: int = None   # createdAt (에포크 마이크로초)
+    content_ref: int = None     # reportContent의 ContentStore 번호
+    school_name: str = None
+    class_number: str = None
+    student_name: str = None
+    extra: dict = None          # 위에 없는 키, 또는 정수로 바꿀 수 없는 createdAt 원문
+
+    @classmethod
+    def from_dict(cls, report, contents):
+        """리포트 dict를 레코드로 변환합니다. 본문은 contents(ContentStore)에 넣습니다."""
+        extra = {key: value for key, value in report.items() if key not in _REPORT_KEYS}
+        created_at = report.get('createdAt')
+        created_at_us = iso_to_epoch_us(created_at)
+        if created_at is not None and created_at_us is None:
+            extra['createdAt'] = created_at
+        content = report.get('reportContent')
+        return cls(
+            id=report['id'],
+            program_name=_intern(report.get('programName')),
+            experience_date=_intern(report.get('experienceDate')),
+            job_field=_intern(report.get('jobField')),
+            rating=report.get('rating'),
+            created_at_us=created_at_us,
+            content_ref=None if content is None else contents.put(content),
+            school_name=_intern(report.get('schoolName')),
+            class_number=_intern(report.get('classNumber')),
+            student_name=_intern(report.get('studentName')),
+            extra=extra or None,
+        )
+
+    @property
+    def created_at(self):
+        if self.created_at_us is not None:
+            return epoch_us_to_iso(self.created_at_us)
+        return self.extra.get('createdAt') if self.extra else None
+
+    def to_dict(self, contents=None):
+        """리포트 dict로 변환합니다. contents를 주지 않으면 본문을 뺀 헤더만 만듭니다."""
+        report = {'id': self.id}
+        for key, value in (('programName', self.program_name), ('experienceDate', self.experience_date),
+                           ('jobField', self.job_field), ('rating', self.rating)):
+            if value is not None:
+                report[key] = value
+        if contents is not None and self.content_ref is not None:
+            report['reportContent'] = contents.get(self.content_ref)
+        created_at = self.created_at
+        if created_at is not None:
+            report['createdAt'] = created_at
+        # 작성자 정보는 prepare_report가 항상 채우므로 None이어도 키를 유지합니다.
+        report['schoolName'] = self.school_name
+        report['classNumber'] = self.class_number
+        report['studentName'] = self.student_name
+        if self.extra:
+            report.update((key, value) for key, value in self.extra.items() if key != 'createdAt')
+        return report
+
+
+_REPORT_KEYS = frozenset(REPORT_INTERNED_KEYS + ('id', 'rating', 'createdAt', 'reportContent'))
+
+
+@dataclass(slots=True)
+class ProgramRecord:
+    """프로그램 한 건. 분야/장소/날짜는 카탈로그 인덱스 키와 같은 문자열 객체를 공유합니다."""
+
+    id: str
+    name: str = ''
+    field: str = ''
+    date: str = ''
+    location: str = ''
+    description: str = ''
+    extra: dict = None
+
+    @classmethod
+    def from_dict(cls, program):
+        extra = {key: value for key, value in program.items() if key not in _PROGRAM_KEYS}
+        return cls(
+            id=_intern(str(program['id'])),
+            name=_intern(program.get('name', '')),
+            field=_intern(program.get('field', '')),
+            date=_intern(program.get('date', '')),
+            location=_intern(program.get('location', '')),
+            description=program.get('description', ''),
+            extra=extra or None,
+        )
+
+    @property
+    def sort_key(self):
+        return (self.date, self.id)
+
+    def to_dict(self):
+        program = {
+            'id': self.id, 'name': self.name, 'field': self.field,
+            'description': self.description, 'date': self.date, 'location': self.location,
+        }
+        if self.extra:
+            program.update(self.extra)
+        return program
+
+
+_PROGRAM_KEYS = frozenset(('id', 'name', 'field', 'description', 'date', 'location'))
@@ -0,0 +1,242 @@
+import os
+import time
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from storage import DEFAULT_DB_PATH
+
+# --- 페이지 결과 캐시 (Result Cache) ---
+# 목록 페이지(프로그램 목록, 나의 기록 보기)는 데이터가 바뀌는 것보다 훨씬 자주 읽히므로,
+# (페이지, 사용자, 필터/검색어/커서) 키로 조회 결과를 프로세스 메모리에 보관합니다.
+#
+# - 항목 수(max_entries)와 대략적인 바이트 수(pickle 크기 합, max_bytes)를 넘으면 가장 오래 쓰지 않은 항목부터 버립니다. (LRU)
+# - 항목마다 TTL이 있어 오래된 결과가 무한히 남지 않습니다.
+# - 항목에는 태그(예: 'reports:<userId>', 'programs')를 붙이고, 쓰기 경로는 태그 단위로 무효화합니다.
+#   태그 버전은 공유 저장소(기본값 SQLite 파일)에 두므로, 다른 서버 프로세스(또는 API 워커)에서 일어난 쓰기도
+#   버전 비교로 감지됩니다. 버전은 계산 전에 읽어 두므로, 계산 중에 일어난 쓰기도 놓치지 않습니다.
+# - 공유 저장소의 버전은 태그마다 프로세스당 version_check_seconds에 한 번만 읽습니다. (적중할 때마다 SQLite를 읽지 않음)
+#   이 프로세스의 쓰기는 바로 반영되고, 다른 프로세스의 쓰기는 최대 그 시간만큼 늦게 보일 수 있습니다.
+# - 적중/실패/만료/무효화/축출 횟수를 stats()로 제공합니다. (관리자 성능 진단 페이지에 표시)
+
+DEFAULT_MAX_ENTRIES = int(os.environ.get('JOBSTRAVELING_RESULT_CACHE_ENTRIES', '2048'))
+DEFAULT_MAX_BYTES = int(os.environ.get('JOBSTRAVELING_RESULT_CACHE_MB', '32')) * 1024 * 1024
+DEFAULT_TTL_SECONDS = float(os.environ.get('JOBSTRAVELING_RESULT_CACHE_TTL', '300'))
+DEFAULT_VERSION_CHECK_SECONDS = int(os.environ.get('JOBSTRAVELING_RESULT_CACHE_CHECK_MS', '1000')) / 1000
+
+PROGRAMS_TAG = 'programs'
+
+
+def reports_tag(user_id):
+    """사용자 리포트 목록에 의존하는 결과의 태그."""
+    return f"reports:{user_id}"
+
+
+class TagVersions:
+    """태그 → 버전(정수) 저장소 인터페이스. 기본 구현은 프로세스 메모리에 보관합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions = {}
+
+    def get(self, tags):
+        """{tag: version}을 반환합니다. 한 번도 무효화되지 않은 태그의 버전은 0입니다."""
+        return {tag: self._versions.get(tag, 0) for tag in tags}
+
+    def bump(self, tags):
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+
+class SQLiteTagVersions(TagVersions):
+    """여러 서버 프로세스가 공유하는 SQLite 태그 버전 저장소. 리포트 저장소와 같은 DB 파일을 사용합니다."""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_tag_versions (
+                    tag TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL
+                )
+            """)
+            self._conn.commit()
+
+    def get(self, tags):
+        tags = list(tags)
+        if not tags:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT tag, version FROM cache_tag_versions WHERE tag IN ({','.join('?' * len(tags))})", tags
+            ).fetchall()
+        versions = dict(rows)
+        return {tag: versions.get(tag, 0) for tag in tags}
+
+    def bump(self, tags):
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    'INSERT INTO cache_tag_versions (tag, version) VALUES (?, 1) '
+                    'ON CONFLICT (tag) DO UPDATE SET version = version + 1',
+                    [(tag,) for tag in tags],
+                )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+
+def create_tag_versions(backend=None, db_path=None):
+    """리포트 저장소와 같은 환경 변수(JOBSTRAVELING_STORAGE / JOBSTRAVELING_DB_PATH)로 태그 버전 저장소를 생성합니다."""
+    backend = backend or os.environ.get('JOBSTRAVELING_STORAGE', 'sqlite')
+    if backend == 'memory':
+        return TagVersions()
+    if backend in ('sqlite', 'firestore'):
+        return SQLiteTagVersions(db_path or os.environ.get('JOBSTRAVELING_DB_PATH', DEFAULT_DB_PATH))
+    raise ValueError(f"지원하지 않는 저장소 백엔드입니다: {backend}")
+
+
+class _Entry:
+    __slots__ = ('value', 'expires_at', 'size', 'versions')
+
+    def __init__(self, value, expires_at, size, versions):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.versions = versions  # 계산 시점의 {tag: version}
+
+
+class ResultCache:
+    """TTL과 LRU 축출, 크기 제한, 태그 무효화를 지원하는 결과 캐시. 반환된 값은 공유되므로 수정하지 마세요."""
+
+    def __init__(self, tag_versions=None, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES,
+                 ttl_seconds=DEFAULT_TTL_SECONDS, version_check_seconds=DEFAULT_VERSION_CHECK_SECONDS):
+        self.tag_versions = tag_versions or TagVersions()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.version_check_seconds = version_check_seconds
+        self._lock = threading.Lock()
+        self._known_versions = {}  # {tag: (version, 읽은 시각)} — 공유 저장소에서 마지막으로 읽은 버전
+        self._invalidations = 0  # 읽는 도중 무효화가 있었으면 읽은 버전을 기억하지 않기 위한 순번
+        self._entries = OrderedDict()  # {key: _Entry} (최근 사용 순)
+        self._by_tag = {}  # {tag: {key, ...}}
+        self._bytes = 0
+        self._counters = {'hits': 0, 'misses': 0, 'expired': 0, 'invalidated': 0, 'evicted': 0}
+
+    def get_or_compute(self, key, compute, tags=()):
+        """
+        key의 결과가 있고 유효하면(TTL 이내, 태그 버전 동일) 그대로 반환하고, 아니면 compute()로 계산해 보관합니다.
+        tags는 이 결과가 의존하는 데이터의 태그입니다.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at < time.monotonic():
+                self._discard(key, 'expired')
+            elif entry.versions and self._current_versions(entry.versions) != entry.versions:
+                self._discard(key, 'invalidated')  # 다른 프로세스의 쓰기
+            else:
+                with self._lock:
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                    self._counters['hits'] += 1
+                return entry.value
+
+        with self._lock:
+            self._counters['misses'] += 1
+        versions = self._current_versions(tags)
+        value = compute()
+        self._store(key, value, versions)
+        return value
+
+    def _current_versions(self, tags):
+        """태그 버전을 반환합니다. version_check_seconds 안에 읽은 태그는 공유 저장소를 다시 읽지 않습니다."""
+        now = time.monotonic()
+        with self._lock:
+            known = {tag: self._known_versions.get(tag) for tag in tags}
+            invalidations = self._invalidations
+        stale = [tag for tag, entry in known.items() if entry is None or now - entry[1] >= self.version_check_seconds]
+        versions = {tag: entry[0] for tag, entry in known.items() if entry is not None}
+        if stale:
+            fresh = self.tag_versions.get(stale)
+            with self._lock:
+                if invalidations == self._invalidations:
+                    for tag, version in fresh.items():
+                        self._known_versions[tag] = (version, now)
+            versions.update(fresh)
+        return {tag: versions[tag] for tag in tags}
+
+    def _store(self, key, value, versions):
+        size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        if size > self.max_bytes:
+            return  # 캐시 전체보다 큰 결과는 보관하지 않습니다.
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _Entry(value, time.monotonic() + self.ttl_seconds, size, versions)
+            self._bytes += size
+            for tag in versions:
+                self._by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._counters['evicted'] += 1
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        for tag in entry.versions:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+                    self._known_versions.pop(tag, None)  # 보관한 항목이 없는 태그의 버전은 기억하지 않습니다.
+        return True
+
+    def _discard(self, key, reason):
+        with self._lock:
+            if self._remove(key):
+                self._counters[reason] += 1
+
+    def invalidate(self, *tags):
+        """태그가 붙은 결과를 모든 프로세스에서 무효화합니다. (이 프로세스의 항목은 바로 제거합니다)"""
+        self.tag_versions.bump(tags)
+        with self._lock:
+            self._invalidations += 1
+            for tag in tags:
+                self._known_versions.pop(tag, None)  # 다음 조회 때 새 버전을 읽습니다.
+                for key in list(self._by_tag.get(tag, ())):
+                    if self._remove(key):
+                        self._counters['invalidated'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._known_versions.clear()
+            self._by_tag.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """적중률 튜닝용 카운터와 현재 크기."""
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return {
+                **self._counters,
+                'hit_rate': round(self._counters['hits'] / lookups, 3) if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl_seconds,
+                'version_check_seconds': self.version_check_seconds,
+            }
@@ -0,0 +1,426 @@
+import streamlit as st
+import streamlit.components.v1 as components
+import os
+import json
+import uuid
+
+from storage import create_report_repository
+from templates import TemplateCache, MOCK_HTML_TEMPLATES
+from catalog import ProgramCatalog, DEFAULT_PROGRAMS
+from programs import ProgramCatalogReplica, create_program_repository
+from search import SearchService
+from validation import prepare_report, validate_program, normalize_program, PROGRAM_DUPLICATE_MESSAGE
+import assets
+from profiler import PROFILER
+from auth import create_session_token_store, authenticate, SESSION_TOKEN_TTL_SECONDS
+from users import UserRegistry, create_user_repository, DEMO_ADMIN_ACCOUNT, DEMO_USER_ACCOUNT
+from writer import ReportWriteQueue, WriteRejectedError, WriteFailedError
+from api_client import ApiClient, ApiError
+from result_cache import ResultCache, create_tag_versions, reports_tag, PROGRAMS_TAG
+
+# --- 앱 공용 런타임 ---
+# 페이지 모듈(views/)이 함께 쓰는 프로세스 단위 리소스(st.cache_resource)와 세션/인증/HTML 헬퍼입니다.
+# app.py 스크립트는 rerun마다 처음부터 다시 실행되지만, import된 이 모듈은 프로세스당 한 번만 실행되므로
+# 상수·인라인 HTML 템플릿·함수 정의를 rerun마다 다시 만들지 않습니다.
+
+# --- Firebase SDK Admin (Python) 사용을 위한 Stubs ---
+# Python에서 Firestore에 접근하기 위해 가상의 함수를 정의합니다.
+# 실제 Firebase Admin SDK를 가져올 수 없으므로, on-premise 환경에서는
+# 이 부분이 실제 데이터베이스 접근 로직으로 대체됩니다.
+# 리포트와 프로그램 목록은 모든 세션이 공유하는 저장소(storage.py, catalog.py)에 보관합니다.
+
+
+# --- Global Environment Variables ---
+# Canvas 환경 변수 로드 (Firestore 사용을 위한 필수 변수)
+firebaseConfig = json.loads(os.environ.get('__firebase_config', '{}'))
+appId = os.environ.get('__app_id', 'default-app-id')
+initialAuthToken = os.environ.get('__initial_auth_token', '')
+
+def get_firebase_template_context():
+    """HTML 템플릿에 주입할 Firebase 설정 값을 반환합니다."""
+    return {
+        'FIREBASE_CONFIG': json.dumps(firebaseConfig),
+        'INITIAL_AUTH_TOKEN': initialAuthToken,
+        'APP_ID': appId,
+    }
+
+# --- 1. 페이지 상수 및 세션 상태 초기화 ---
+# 페이지 정의 상수
+PAGE_LOGIN = 'login'
+PAGE_SIGNUP = 'signup'
+PAGE_HOME = 'home'
+PAGE_PROGRAM_LIST = 'program_list'
+PAGE_ADD_PROGRAM = 'add_program'
+PAGE_ADD_REPORT = 'add_report'      # 잡스리포트 기록 페이지
+PAGE_VIEW_REPORTS = 'view_reports' # 잡스리포트 목록/상세 보기 페이지
+PAGE_BULK_IMPORT = 'bulk_import'   # 관리자 대량 가져오기 페이지
+PAGE_EXPORT_REPORTS = 'export_reports' # 관리자 리포트 내보내기 페이지
+PAGE_ANALYTICS = 'analytics'       # 관리자 통계 대시보드 페이지
+PAGE_DIAGNOSTICS = 'diagnostics'   # 관리자 성능 진단 페이지
+
+# 데모 로그인 버튼에서 사용하는 Mock 계정 비밀번호 (계정에는 해시만 저장합니다)
+DEMO_ADMIN_PASSWORD = 'adminpassword'
+DEMO_USER_PASSWORD = 'userpassword'
+
+# 세션 상태 기본값 (세션에 없는 키만 채웁니다)
+SESSION_DEFAULTS = {
+    'current_page': PAGE_LOGIN,
+    'user_data': None,  # 로그인한 사용자 정보
+    'is_auth_ready': False,
+    'auth_token': None,  # 로그인 시 발급된 세션 토큰
+    'api_token': None,  # API 서버 모드에서 로그인 시 API가 발급한 토큰
+    # 리포트 폼 데이터를 저장할 세션 상태 (HTML 컴포넌트에서 전달받음)
+    'current_report_data': None,
+    'report_saved_successfully': False,
+}
+
+def init_session_state():
+    """세션 상태 기본값을 채웁니다. (rerun마다 호출되며, 이미 있는 키는 건드리지 않습니다)"""
+    for key, value in SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = value
+
+# --- Firebase Stubs (Python Backend) ---
+
+STORAGE_PROFILED_METHODS = ['add_report', 'add_reports', 'get_report', 'get_reports', 'list_reports', 'list_report_headers', 'load_report_page', 'count_reports', 'get_summary', 'data_version']
+
+STORAGE_BACKEND = os.environ.get('JOBSTRAVELING_STORAGE', 'sqlite')
+# 설정되면 로그인/리포트 저장을 API 서버(api.py)에 요청하고, 리포트 폼 컴포넌트도 API 서버에서 제공받습니다.
+# (목록 조회는 같은 공유 저장소를 직접 읽으므로 sqlite/firestore 백엔드와 함께 사용합니다)
+API_URL = os.environ.get('JOBSTRAVELING_API_URL', '').rstrip('/')
+
+@st.cache_resource
+def get_api_client():
+    """API 서버 클라이언트를 프로세스당 한 번만 생성합니다. API 서버를 쓰지 않으면 None."""
+    return ApiClient(API_URL) if API_URL else None
+
+@st.cache_resource
+def get_firestore_client_pool():
+    """Firestore AsyncClient 풀(전용 이벤트 루프 스레드 포함)을 프로세스당 한 번만 생성합니다."""
+    from firestore_store import FirestoreClientPool
+    return FirestoreClientPool(firebaseConfig.get('projectId') or os.environ.get('JOBSTRAVELING_FIRESTORE_PROJECT'))
+
+@st.cache_resource
+def get_report_store():
+    """모든 세션이 공유하는 리포트 저장소를 프로세스당 한 번만 생성합니다."""
+    firestore_pool = get_firestore_client_pool() if STORAGE_BACKEND == 'firestore' else None
+    repository = create_report_repository(STORAGE_BACKEND, firestore_pool=firestore_pool)
+    # JOBSTRAVELING_PROFILE=1이면 저장소 호출 시간을 계측합니다.
+    return PROFILER.instrument_methods(repository, 'storage', STORAGE_PROFILED_METHODS)
+
+@st.cache_resource
+def get_search_service():
+    """
+    프로그램/리포트 전문 검색 색인을 프로세스당 한 번만 생성합니다. (이후에는 증분 갱신)
+    프로그램은 get_program_replica가 공유 저장소와 동기화하면서 색인합니다.
+    """
+    return SearchService()
+
+@st.cache_resource
+def get_program_replica():
+    """
+    공유 프로그램 저장소(programs.py)와 이 프로세스의 카탈로그/검색 색인을 잇는 복제본을 프로세스당 한 번만 생성합니다.
+    저장소가 비어 있으면 초기 프로그램 목록을 저장합니다.
+    """
+    repository = create_program_repository(STORAGE_BACKEND)
+    repository.ensure_programs(DEFAULT_PROGRAMS)
+    return ProgramCatalogReplica(repository, ProgramCatalog(), on_program=get_search_service().index_program)
+
+@st.cache_resource
+def get_result_cache():
+    """
+    목록 페이지 조회 결과 캐시(result_cache.py)를 프로세스당 한 번만 생성합니다.
+    무효화 태그 버전은 공유 저장소에 두어 다른 서버 프로세스의 쓰기도 반영됩니다.
+    """
+    return ResultCache(create_tag_versions(STORAGE_BACKEND))
+
+def on_report_saved(user_id, report):
+    """리포트 커밋 후처리: 검색 색인을 갱신하고 해당 사용자의 목록 캐시를 무효화합니다."""
+    get_search_service().index_report(user_id, report)
+    get_result_cache().invalidate(reports_tag(user_id))
+
+def get_program_catalog():
+    """다른 서버 프로세스가 추가한 프로그램까지 반영한 프로그램 카탈로그를 반환합니다. (변경분만 읽음)"""
+    return get_program_replica().sync()
+
+# 저장 요청이 커밋 확인을 기다리는 최대 시간 (flush 주기 + 트랜잭션 시간보다 충분히 길게)
+WRITE_ACK_TIMEOUT_SECONDS = 10
+
+@st.cache_resource
+def get_report_writer():
+    """
+    리포트 저장 요청을 모아 배치 트랜잭션으로 기록하는 작성기를 프로세스당 한 번만 생성합니다.
+    커밋된 리포트는 작성기 스레드에서 검색 색인과 목록 캐시에 바로 반영됩니다. (저장 응답 전에 무효화)
+    """
+    return ReportWriteQueue(get_report_store().add_reports, on_saved=on_report_saved)
+
+def add_program_to_catalog(program):
+    """프로그램을 공유 저장소에 저장하고 카탈로그와 검색 색인을 증분 갱신합니다."""
+    return add_programs_to_catalog([program])[0]
+
+def add_programs_to_catalog(programs):
+    """여러 프로그램을 공유 저장소에 한 번에 저장하고 카탈로그와 검색 색인을 증분 갱신합니다. (프로그램 목록 캐시는 무효화)"""
+    saved_programs = get_program_replica().add_programs(programs)
+    get_result_cache().invalidate(PROGRAMS_TAG)
+    return saved_programs
+
+def import_programs_batch(programs):
+    """
+    대량 가져오기의 프로그램 chunk를 한 번에 저장합니다. (importer.parse_program_row로 정규화/검사된 프로그램)
+    화면 등록(create_programs)과 같은 fingerprint 색인으로 중복을 건너뛰므로, 같은 파일을 다시 가져와도 늘어나지 않습니다.
+    반환값: (저장된 프로그램 목록, 중복으로 건너뛴 프로그램 목록)
+    """
+    saved_programs, duplicates = get_program_replica().add_new_programs(programs)
+    if saved_programs:
+        get_result_cache().invalidate(PROGRAMS_TAG)
+    return saved_programs, duplicates
+
+def create_programs(programs):
+    """
+    관리자가 등록한 새 프로그램들을 검사해 한 번에 저장합니다. (정규화한 이름/일자/장소가 같은 프로그램은 중복으로 제외)
+    카탈로그 인덱스와 검색 색인은 저장된 프로그램만큼 증분 갱신되고, 프로그램 목록 캐시는 태그로 무효화됩니다.
+    반환값: (저장된 프로그램 목록, [(입력 순번(1부터), 사유), ...])
+    """
+    rejects, candidates = [], []
+    for row_number, program in enumerate(programs, start=1):
+        program = normalize_program(program)
+        error_message = validate_program(program)
+        if error_message:
+            rejects.append((row_number, error_message))
+        else:
+            candidates.append((row_number, {**program, 'id': uuid.uuid4().hex[:12]}))
+    if not candidates:
+        return [], rejects
+
+    saved_programs, duplicates = get_program_replica().add_new_programs([program for _, program in candidates])
+    duplicate_ids = {program['id'] for program in duplicates}
+    rejects.extend((row_number, PROGRAM_DUPLICATE_MESSAGE)
+                   for row_number, program in candidates if program['id'] in duplicate_ids)
+    rejects.sort()
+    if saved_programs:
+        get_result_cache().invalidate(PROGRAMS_TAG)
+    return saved_programs, rejects
+
+def save_reports_batch(items):
+    """[(userId, report), ...]를 한 번의 트랜잭션으로 저장하고 검색 색인을 증분 갱신합니다. (대량 가져오기용)"""
+    saved_reports = get_report_store().add_reports(items)
+    search_service = get_search_service()
+    for (user_id, _), report in zip(items, saved_reports):
+        search_service.index_report(user_id, report)
+    get_result_cache().invalidate(*{reports_tag(user_id) for user_id, _ in items})
+    return saved_reports
+
+def get_current_user_id():
+    """Mock User ID 반환. 실제 환경에서는 __initial_auth_token을 파싱해야 합니다."""
+    # 간단히 Mock 사용자 이메일을 ID로 사용합니다.
+    return st.session_state.user_data.get('email') if st.session_state.user_data else None
+
+def save_report_to_firestore(report_data):
+    """
+    Python 백엔드에서 리포트 데이터를 저장합니다.
+    실제 Firestore SDK 대신 모든 세션이 공유하는 리포트 저장소(get_report_store)를 사용합니다.
+    """
+    user_id = get_current_user_id()
+    if not user_id:
+        return False, "사용자 인증 정보를 찾을 수 없습니다."
+
+    api_client = get_api_client()
+    if api_client is not None:
+        # API 서버가 같은 규칙으로 검사한 뒤 저장합니다.
+        try:
+            saved_report = api_client.save_report(st.session_state.api_token, report_data)
+        except ApiError as e:
+            return False, str(e)
+        on_report_saved(user_id, saved_report)
+        report_data['id'] = saved_report['id']
+        return True, ""
+
+    # 필수 필드 유효성 검사 (Streamlit 버튼에서 이미 체크하지만, 백엔드에서도 최종 확인)
+    # 작성 시각과 관리자 내보내기(학교/반 필터)를 위한 작성자 정보를 함께 채웁니다.
+    report, error_message = prepare_report(report_data, st.session_state.user_data)
+    if error_message:
+        return False, error_message
+
+    # 쓰기 대기열을 거쳐 공유 저장소에 기록합니다. 커밋이 끝난 뒤에 반환되며, ID는 저장소가 부여합니다.
+    try:
+        saved_report = get_report_writer().save(user_id, report, timeout=WRITE_ACK_TIMEOUT_SECONDS)
+    except WriteRejectedError as e:
+        return False, f"{e} 잠시 후 '나의 기록 보기'에서 저장 여부를 확인해 주세요."
+    except WriteFailedError as e:
+        return False, f"{e} 리포트가 저장되지 않았으니 잠시 후 다시 저장해 주세요."
+    report_data['id'] = saved_report['id']
+    
+    return True, ""
+
+
+# --- 2. HTML 파일 로드 함수 ---
+HTML_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'htmls')
+# 선언형 커스텀 컴포넌트(components.declare_component)의 로컬 빌드 경로
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend')
+
+@st.cache_resource
+def get_asset_manifest():
+    """
+    자체 호스팅 에셋(assets.py build 결과)을 프로세스당 한 번만 불러옵니다. 빌드 전이면 None (CDN 사용).
+    API 서버가 있으면 API 서버의 /static/ 경로(Cache-Control: immutable)를 사용합니다.
+    없으면 컴포넌트 경로(/component/<이름>/)로 제공되는데, 이 경로는 올바른 MIME 타입과 함께
+    Cache-Control: public만 붙이므로(max-age/immutable 없음) 브라우저가 새로고침 때마다 재검증할 수 있습니다.
+    """
+    if not os.path.exists(os.path.join(assets.STATIC_DIR, assets.MANIFEST_FILE)):
+        return None
+    if API_URL:
+        return assets.AssetManifest.load(f"{API_URL}/static/")
+    static_component = components.declare_component('assets', path=assets.STATIC_DIR)
+    return assets.AssetManifest.load(f"/component/{static_component.name}/")
+
+@st.cache_resource
+def get_template_cache():
+    """HTML 템플릿 캐시를 프로세스당 한 번만 생성합니다. (파일은 mtime이 바뀔 때만 다시 읽습니다)"""
+    asset_manifest = get_asset_manifest()
+    return TemplateCache(HTML_DIR, transform=asset_manifest.rewrite_html if asset_manifest else None)
+
+def load_html_template(file_name):
+    """컴파일된 HTML 템플릿을 반환합니다. 로드에 실패하면 None을 반환합니다."""
+    try:
+        with PROFILER.timed(f"html.load.{file_name}"):
+            if file_name in MOCK_HTML_TEMPLATES:
+                return get_template_cache().get_inline(file_name, MOCK_HTML_TEMPLATES[file_name])
+            return get_template_cache().get(file_name)
+    except FileNotFoundError:
+        st.error(f"⚠️ HTML 파일을 찾을 수 없습니다. 'htmls/{file_name}' 경로를 확인해 주세요.")
+        return None
+    except Exception as e:
+        st.error(f"파일 읽기 중 예기치 않은 오류 발생: {e}")
+        return None
+
+def render_html_template(template, name, context=None, **values):
+    """템플릿 치환 시간을 계측하며 HTML을 렌더링합니다."""
+    with PROFILER.timed(f"html.render.{name}"):
+        return template.render(context, **values)
+
+def render_html_component(name, html_content, **kwargs):
+    """components.html 호출 시간을 계측하며 HTML 컴포넌트를 렌더링합니다."""
+    with PROFILER.timed(f"component.{name}"):
+        return components.html(html_content, **kwargs)
+
+# --- 3. 페이지 전환 ---
+def navigate(page):
+    """세션 상태를 변경하여 페이지를 전환합니다."""
+    st.session_state.current_page = page
+    st.rerun()
+
+# --- 로그인 / 로그아웃 헬퍼 함수 ---
+# 세션 토큰을 담아 두는 브라우저 쿠키. 새로고침이나 재연결로 다른 서버 프로세스에 연결되어 세션 상태가 비어 있어도
+# 연결 요청에 실려 오는 이 쿠키(st.context.cookies)로 로그인 상태를 이어 갑니다. (고정 세션(sticky session) 불필요)
+# 토큰을 URL에 두지 않으므로 공유한 링크, 브라우저 기록, 프록시/리퍼러 로그로 새지 않습니다.
+# Streamlit은 응답 쿠키를 쓸 수 없으므로 높이 0 컴포넌트의 스크립트가 브라우저에서 쿠키를 씁니다. (HttpOnly 불가,
+# SameSite=Strict로 다른 사이트의 요청에는 실리지 않으며 HTTPS에서는 Secure)
+SESSION_COOKIE_NAME = 'jobstraveling_session'
+SESSION_COOKIE_SCRIPT = """<script>
+(function () {{
+    const secure = window.parent.location.protocol === 'https:' ? '; Secure' : '';
+    window.parent.document.cookie = '{name}={value}; Path=/; Max-Age={max_age}; SameSite=Strict' + secure;
+}})();
+</script>"""
+
+@st.cache_resource
+def get_session_token_store():
+    """로그인 세션 토큰 저장소를 프로세스당 한 번만 생성합니다. (sqlite/firestore 백엔드는 모든 프로세스가 공유)"""
+    return create_session_token_store(STORAGE_BACKEND)
+
+@st.cache_resource
+def get_user_registry():
+    """모든 세션이 공유하는 계정 저장소를 프로세스당 한 번만 생성하고 데모 계정을 등록합니다."""
+    registry = UserRegistry(create_user_repository())
+    registry.ensure(DEMO_ADMIN_ACCOUNT)
+    registry.ensure(DEMO_USER_ACCOUNT)
+    return registry
+
+def find_account(email):
+    """이메일로 계정을 찾습니다. (최근 사용된 계정은 LRU 캐시에서 바로 반환)"""
+    return get_user_registry().get(email)
+
+def read_session_cookie():
+    """브라우저가 연결할 때 보낸 세션 쿠키 값. (쿠키가 없거나 st.context가 없는 Streamlit 버전이면 None)"""
+    context = getattr(st, 'context', None)
+    value = context.cookies.get(SESSION_COOKIE_NAME) if context is not None else None
+    return value if isinstance(value, str) and value else None
+
+def write_session_cookie(token):
+    """브라우저의 세션 쿠키를 token으로 바꿉니다. (None이면 지움) 다음 실행의 apply_session_cookie에서 반영됩니다."""
+    st.session_state.pending_session_cookie = (token or '', SESSION_TOKEN_TTL_SECONDS if token else 0)
+
+def apply_session_cookie():
+    """예약된 쿠키 변경이 있으면 쿠키를 쓰는 높이 0 컴포넌트를 렌더링합니다. (로그인/로그아웃 직후 한 번)"""
+    pending = st.session_state.pop('pending_session_cookie', None)
+    if pending is not None:
+        value, max_age = pending
+        render_html_component('session_cookie', SESSION_COOKIE_SCRIPT.format(
+            name=SESSION_COOKIE_NAME, value=value, max_age=max_age), height=0)
+
+def perform_login(email, password):
+    """이메일/비밀번호를 해시와 비교해 확인하고, 세션 토큰을 발급한 뒤 홈으로 이동합니다."""
+    api_client = get_api_client()
+    if api_client is not None:
+        # API 서버가 비밀번호를 확인하고 발급한 토큰은 리포트 저장 요청에 사용합니다.
+        try:
+            result = api_client.login(email, password)
+        except ApiError as e:
+            st.error(f"⚠️ {e}")
+            return
+        st.session_state.api_token, profile = result if result else (None, None)
+    else:
+        profile = authenticate(find_account(email), password)
+    if profile is None:
+        st.error("이메일 또는 비밀번호가 올바르지 않습니다.")
+        return
+
+    # 이후 rerun에서는 토큰만 확인하므로 비밀번호를 다시 검증하지 않습니다.
+    st.session_state.auth_token = get_session_token_store().issue(profile)
+    st.session_state.user_data = profile
+    write_session_cookie(st.session_state.auth_token)
+    navigate(PAGE_HOME)
+
+def perform_mock_login(user_to_login, password):
+    """지정된 데모 계정과 데모 비밀번호로 로그인 처리 후 페이지 이동"""
+    if not user_to_login:
+        st.error("사용자 정보를 찾을 수 없습니다. 데모 계정 설정을 확인해 주세요.")
+        return
+    perform_login(user_to_login['email'], password)
+
+def perform_logout():
+    """세션 토큰을 폐기하고 브라우저의 세션 쿠키를 지운 뒤 로그인 화면으로 이동합니다."""
+    get_session_token_store().revoke(st.session_state.auth_token)
+    # 이 연결의 st.context.cookies에는 연결할 때 받은 쿠키가 남아 있으므로 다시 복원하지 않도록 기억합니다.
+    st.session_state.rejected_session_cookie = st.session_state.auth_token
+    write_session_cookie(None)
+    st.session_state.auth_token = None
+    st.session_state.api_token = None
+    st.session_state.user_data = None
+    navigate(PAGE_LOGIN)
+
+def resolve_session_user():
+    """
+    세션 토큰으로 로그인 사용자를 확인합니다. 토큰이 없거나 만료되었으면 로그아웃 상태로 정리합니다.
+    세션 상태에 토큰이 없으면(새 연결) 브라우저가 보낸 세션 쿠키로 로그인 상태를 복원합니다.
+    """
+    restored = False
+    cookie_token = read_session_cookie()
+    if (not st.session_state.auth_token and cookie_token
+            and cookie_token != st.session_state.get('rejected_session_cookie')):
+        st.session_state.auth_token = cookie_token
+        restored = True
+    profile = get_session_token_store().resolve(st.session_state.auth_token)
+    if profile is None:
+        if restored:
+            # 만료되었거나 폐기된 쿠키는 지우고, 이 연결에서 다시 시도하지 않습니다.
+            st.session_state.rejected_session_cookie = cookie_token
+            write_session_cookie(None)
+        st.session_state.auth_token = None
+        st.session_state.user_data = None
+    elif restored:
+        st.session_state.user_data = profile
+        if st.session_state.current_page == PAGE_LOGIN:
+            st.session_state.current_page = PAGE_HOME
+    apply_session_cookie()
+    return profile
@@ -0,0 +1,178 @@
+import math
+import re
+import threading
+from collections import Counter
+
+# --- 전문 검색 (Full-text Search) 인덱스 ---
+# 프로그램(programName/description)과 리포트(programName/reportContent)에 대한 역색인입니다.
+# 한국어는 띄어쓰기 단위가 검색어와 잘 맞지 않으므로(조사 등), 한글/한자 등 비 ASCII 토큰은
+# 글자 2-gram(bigram)으로 나누고, 영문/숫자 토큰은 단어 단위로 색인합니다.
+# bigram만으로는 한 글자 검색어('우')를 찾을 수 없으므로, 비 ASCII 글자도 따로 색인(_char_postings)하여
+# 한 글자 검색어에만 사용합니다. (여러 글자 검색어의 결과와 점수는 bigram 색인만으로 계산)
+# 문서 추가/삭제 시 해당 문서의 용어만 갱신하는 증분 방식이며, 검색 결과는 BM25 점수로 정렬합니다.
+
+WORD_PATTERN = re.compile(r'\w+')
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text):
+    """텍스트를 색인/검색용 용어 목록으로 변환합니다."""
+    terms = []
+    for word in WORD_PATTERN.findall((text or '').lower()):
+        if word.isascii() or len(word) == 1:
+            terms.append(word)
+        else:
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return terms
+
+
+def char_terms(text):
+    """한 글자 검색어용 색인 용어: 텍스트의 비 ASCII 글자(한글 등) 목록."""
+    return [char for word in WORD_PATTERN.findall((text or '').lower()) if not word.isascii()
+            for char in word if not char.isascii()]
+
+
+def is_char_term(term):
+    """글자 색인으로 찾아야 하는 검색 용어(비 ASCII 한 글자)인지 확인합니다."""
+    return len(term) == 1 and not term.isascii()
+
+
+class InvertedIndex:
+    """문서 단위 증분 갱신을 지원하는 역색인."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = {}   # {term: {doc_id: 빈도}}
+        self._doc_terms = {}  # {doc_id: Counter(term)} (삭제/갱신용)
+        self._char_postings = {}  # {글자: {doc_id: 빈도}} (한 글자 검색어용)
+        self._doc_chars = {}  # {doc_id: Counter(글자)} (삭제/갱신용)
+        self._doc_lengths = {}  # {doc_id: 가중치 포함 용어 수}
+        self._total_length = 0
+
+    def __len__(self):
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._doc_terms
+
+    def add_document(self, doc_id, fields):
+        """
+        문서를 색인합니다. fields는 [(텍스트, 가중치), ...] 형태이며,
+        가중치만큼 해당 필드의 용어 빈도를 늘려 제목 등에 더 높은 점수를 줍니다.
+        """
+        counts = Counter()
+        chars = Counter()
+        for text, weight in fields:
+            for term in tokenize(text):
+                counts[term] += weight
+            for char in char_terms(text):
+                chars[char] += weight
+        with self._lock:
+            self._remove(doc_id)
+            self._doc_terms[doc_id] = counts
+            self._doc_chars[doc_id] = chars
+            self._doc_lengths[doc_id] = sum(counts.values())
+            self._total_length += self._doc_lengths[doc_id]
+            for term, freq in counts.items():
+                self._postings.setdefault(term, {})[doc_id] = freq
+            for char, freq in chars.items():
+                self._char_postings.setdefault(char, {})[doc_id] = freq
+
+    def remove_document(self, doc_id):
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id):
+        counts = self._doc_terms.pop(doc_id, None)
+        if counts is None:
+            return
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        for postings, terms in ((self._postings, counts), (self._char_postings, self._doc_chars.pop(doc_id))):
+            for term in terms:
+                posting = postings.get(term)
+                if posting is not None:
+                    posting.pop(doc_id, None)
+                    if not posting:
+                        del postings[term]
+
+    def search(self, query, limit=20):
+        """검색어와 일치하는 문서를 BM25 점수 순으로 [(doc_id, score), ...] 반환합니다."""
+        query_terms = set(tokenize(query))
+        with self._lock:
+            doc_count = len(self._doc_terms)
+            if not query_terms or not doc_count:
+                return []
+            avg_length = self._total_length / doc_count
+            scores = Counter()
+            for term in query_terms:
+                posting = (self._char_postings if is_char_term(term) else self._postings).get(term)
+                if not posting:
+                    continue
+                idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+                for doc_id, freq in posting.items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_lengths[doc_id] / avg_length)
+                    scores[doc_id] += idf * freq * (BM25_K1 + 1) / (freq + norm)
+        return scores.most_common(limit)
+
+
+class SearchService:
+    """프로그램 색인 하나와 사용자별 리포트 색인을 관리합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.programs = InvertedIndex()
+        self._reports = {}  # {userId: InvertedIndex}
+
+    # 프로그램
+    def index_program(self, program):
+        self.programs.add_document(program['id'], [
+            (program.get('name', ''), 3),
+            (program.get('field', ''), 2),
+            (program.get('description', ''), 1),
+        ])
+
+    def search_programs(self, query, limit=20):
+        return [doc_id for doc_id, _ in self.programs.search(query, limit)]
+
+    # 리포트
+    def _report_fields(self, report):
+        return [
+            (report.get('programName', ''), 3),
+            (report.get('jobField', ''), 2),
+            (report.get('reportContent', ''), 1),
+        ]
+
+    def report_index(self, user_id, load_reports, expected_count=None):
+        """
+        사용자의 리포트 색인을 반환합니다.
+        처음 요청될 때만 load_reports()로 저장소에서 읽어 색인하고, 이후에는 index_report로 증분 갱신됩니다.
+        expected_count(저장소의 리포트 수)보다 색인된 리포트가 적으면 다른 프로세스가 저장한 리포트가 있다는 뜻이므로
+        저장소에서 다시 읽어 색인합니다. (리포트는 삭제되지 않으므로 수만 비교하면 됩니다)
+        """
+        def is_stale(index):
+            return index is None or (expected_count is not None and len(index) < expected_count)
+
+        index = self._reports.get(user_id)
+        if is_stale(index):
+            with self._lock:
+                index = self._reports.get(user_id)
+                if is_stale(index):
+                    index = InvertedIndex()
+                    for report in load_reports():
+                        index.add_document(report['id'], self._report_fields(report))
+                    self._reports[user_id] = index
+        return index
+
+    def index_report(self, user_id, report):
+        # 아직 색인이 만들어지지 않은 사용자는 첫 검색 시 저장소에서 한꺼번에 색인되므로 건너뜁니다.
+        # (색인을 만드는 중이라면 Lock이 풀린 뒤 확인하여 새 리포트가 누락되지 않게 합니다)
+        with self._lock:
+            index = self._reports.get(user_id)
+        if index is not None:
+            index.add_document(report['id'], self._report_fields(report))
+
+    def search_reports(self, user_id, query, load_reports, limit=50, expected_count=None):
+        index = self.report_index(user_id, load_reports, expected_count)
+        return [doc_id for doc_id, _ in index.search(query, limit)]
@@ -0,0 +1,485 @@
+import os
+import json
+import sqlite3
+import bisect
+import threading
+
+from ids import new_report_id
+from records import ReportRecord, ContentStore
+from validation import job_field_key, UNSPECIFIED_JOB_FIELD
+
+# --- 리포트 저장소 (Report Repository) ---
+# 모든 세션이 공유하는 프로세스 단위 저장소입니다.
+# 앱(runtime.py)에서는 `st.cache_resource`로 한 번만 생성하여 모든 브라우저 세션이 같은 인스턴스를 사용합니다.
+# 기본 백엔드는 SQLite(WAL 모드)이며, 환경 변수로 다른 백엔드를 선택할 수 있습니다.
+# 리포트 ID는 createdAt 시각을 담은 ULID(ids.py)라서 ID 순서가 곧 작성 순서이며, 여러 프로세스가 저장해도 충돌하지 않습니다.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB_PATH = os.path.join(BASE_DIR, 'data', 'jobstraveling.db')
+DEFAULT_HEADER_PAGE_SIZE = 20
+# 목록(헤더)에서는 제외하고 상세 조회(get_report) 때만 읽는 큰 필드
+CONTENT_FIELDS = ('reportContent',)
+
+
+def empty_summary():
+    """리포트가 없는 사용자의 활동 요약."""
+    return {'reportCount': 0, 'lastReportDate': None, 'averageRating': None, 'jobFieldCounts': {}}
+
+
+def _summary_from_totals(report_count, rating_sum, last_created_at, job_field_counts):
+    if not report_count:
+        return empty_summary()
+    return {
+        'reportCount': report_count,
+        'lastReportDate': last_created_at[:10] if last_created_at else None,
+        'averageRating': round(rating_sum / report_count, 2),
+        'jobFieldCounts': job_field_counts,
+    }
+
+
+def check_storable_report(report):
+    """
+    모든 저장소 백엔드가 저장 전에 같은 규칙으로 확인합니다. (백엔드마다 받아들이는 값이 달라지지 않게)
+    별점은 정수(bool 제외) 또는 없음(0으로 집계), createdAt은 문자열이어야 합니다.
+    """
+    rating = report.get('rating')
+    if rating is not None and (isinstance(rating, bool) or not isinstance(rating, int)):
+        raise TypeError(f"별점은 정수여야 합니다: {rating!r}")
+    if not isinstance(report.get('createdAt'), str):
+        raise ValueError("createdAt이 없는 리포트는 저장할 수 없습니다.")
+
+
+def report_matches(report, school_name=None, class_number=None, date_from=None, date_to=None):
+    """리포트가 내보내기 필터(학교, 반, 체험 일자 범위)에 맞는지 확인합니다."""
+    if school_name and report.get('schoolName') != school_name:
+        return False
+    if class_number and report.get('classNumber') != class_number:
+        return False
+    experience_date = report.get('experienceDate') or ''
+    if date_from and experience_date < date_from:
+        return False
+    if date_to and experience_date > date_to:
+        return False
+    return True
+
+
+class ReportRepository:
+    """리포트 저장소 인터페이스. 백엔드는 이 메서드들을 구현해야 합니다."""
+
+    def add_report(self, user_id, report_data):
+        """리포트를 저장하고 저장된 리포트(dict)를 반환합니다. ID는 저장소가 부여합니다."""
+        raise NotImplementedError
+
+    def get_report(self, report_id, user_id=None):
+        """
+        ID로 리포트를 O(1)로 찾습니다. user_id를 주면 그 사용자의 리포트일 때만 반환합니다.
+        반환되는 리포트에는 작성자 'userId'가 포함되며, 없으면 None.
+        """
+        raise NotImplementedError
+
+    def add_reports(self, items):
+        """
+        [(user_id, report_data), ...]를 한 번의 트랜잭션(배치)으로 저장하고 저장된 리포트 목록을 반환합니다.
+        기본 구현은 add_report를 반복 호출하므로, 백엔드는 더 효율적인 방식으로 재정의할 수 있습니다.
+        """
+        return [self.add_report(user_id, report_data) for user_id, report_data in items]
+
+    def get_reports(self, report_ids, user_id):
+        """
+        사용자의 리포트 여러 개를 ID로 한 번에 읽어 report_ids 순서대로 반환합니다. (없는 ID는 제외)
+        기본 구현은 get_report를 반복 호출하므로, 백엔드는 배치 읽기로 재정의할 수 있습니다.
+        """
+        reports = (self.get_report(report_id, user_id) for report_id in report_ids)
+        return [report for report in reports if report is not None]
+
+    def list_reports(self, user_id, limit=None, offset=0):
+        """사용자의 리포트를 최신순(ID 역순 = createdAt 역순)으로 반환합니다."""
+        raise NotImplementedError
+
+    def list_report_headers(self, user_id, before=None, limit=DEFAULT_HEADER_PAGE_SIZE):
+        """
+        사용자의 리포트 헤더(CONTENT_FIELDS를 뺀 리포트)를 최신순으로 limit개 반환합니다.
+        before(리포트 ID)를 주면 그보다 오래된 리포트부터 읽는 키셋 페이지네이션입니다.
+        반환값: (headers, next_cursor) - 다음 페이지가 없으면 next_cursor는 None.
+        """
+        raise NotImplementedError
+
+    def load_report_page(self, user_id, before=None, limit=DEFAULT_HEADER_PAGE_SIZE):
+        """
+        리포트 목록 페이지에 필요한 (전체 리포트 수, headers, next_cursor)를 함께 반환합니다.
+        원격 백엔드는 두 조회를 동시에 요청하도록 재정의할 수 있습니다.
+        """
+        headers, next_cursor = self.list_report_headers(user_id, before, limit)
+        return self.count_reports(user_id), headers, next_cursor
+
+    def count_reports(self, user_id):
+        """사용자의 리포트 수를 반환합니다."""
+        raise NotImplementedError
+
+    def iter_reports(self, school_name=None, class_number=None, date_from=None, date_to=None, batch_size=500,
+                     include_content=True):
+        """
+        전체 사용자의 리포트를 저장 순서대로 하나씩 반환하는 제너레이터입니다. (관리자 내보내기용)
+        batch_size 단위로 나누어 읽으므로 전체 리포트를 한 번에 메모리에 올리지 않습니다.
+        반환되는 리포트에는 작성자 'userId'가 포함됩니다.
+        include_content=False면 본문(CONTENT_FIELDS)을 읽지 않습니다. (관리자 통계처럼 본문이 필요 없는 집계용)
+        """
+        raise NotImplementedError
+
+    def data_version(self):
+        """
+        리포트가 저장될 때마다 커지는 값을 반환합니다.
+        전체 리포트를 다시 읽는 캐시(관리자 통계 등)의 무효화 키로 사용합니다.
+        """
+        raise NotImplementedError
+
+    def get_summary(self, user_id):
+        """
+        사용자의 활동 요약(리포트 수, 최근 기록일, 평균 별점, 분야별 리포트 수)을 반환합니다.
+        요약은 add_report에서 증분 갱신되므로 리포트 수와 관계없이 O(1)로 조회됩니다.
+        """
+        raise NotImplementedError
+
+
+class InMemoryReportRepository(ReportRepository):
+    """
+    프로세스 메모리에 리포트를 보관하는 저장소 (테스트/데모용).
+    리포트는 dict 대신 ReportRecord(records.py)로 보관하고, 소감 본문은 ContentStore에 따로 둡니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reports = {}  # {userId: [record1, record2, ...]} (ID 오름차순)
+        self._by_id = {}    # {reportId: (userId, record)}
+        self._contents = ContentStore()
+        self._totals = {}   # {userId: [리포트 수, 별점 합계, 최근 createdAt, {jobField: 수}]}
+        self._version = 0
+
+    def add_report(self, user_id, report_data):
+        return self.add_reports([(user_id, report_data)])[0]
+
+    def add_reports(self, items):
+        with self._lock:
+            # 모든 리포트를 먼저 검사/변환한 뒤 반영하므로, 한 건이라도 실패하면 아무것도 저장되지 않습니다. (SQLite 트랜잭션과 같은 동작)
+            prepared = [(user_id, self._prepare(report_data)) for user_id, report_data in items]
+            return [self._insert(user_id, report) for user_id, report in prepared]
+
+    @staticmethod
+    def _prepare(report_data):
+        check_storable_report(report_data)
+        return {**report_data, 'id': new_report_id(report_data.get('createdAt'))}
+
+    def _insert(self, user_id, report):
+        record = ReportRecord.from_dict(report, self._contents)
+        self._version += 1
+        # 과거 createdAt으로 가져온 리포트도 ID 순서를 유지하도록 정렬 위치에 삽입합니다. (보통은 맨 뒤)
+        bisect.insort(self._reports.setdefault(user_id, []), record, key=lambda r: r.id)
+        self._by_id[record.id] = (user_id, record)
+        totals = self._totals.setdefault(user_id, [0, 0, None, {}])
+        totals[0] += 1
+        totals[1] += report.get('rating') or 0
+        totals[2] = max(totals[2] or '', report['createdAt'])
+        job_field = job_field_key(report)
+        totals[3][job_field] = totals[3].get(job_field, 0) + 1
+        return report
+
+    def get_report(self, report_id, user_id=None):
+        entry = self._by_id.get(report_id)
+        if entry is None or (user_id is not None and entry[0] != user_id):
+            return None
+        return {**entry[1].to_dict(self._contents), 'userId': entry[0]}
+
+    def list_reports(self, user_id, limit=None, offset=0):
+        with self._lock:
+            # ID 순서가 곧 createdAt 순서이므로 정렬 없이 뒤에서부터 잘라냅니다.
+            reports = self._reports.get(user_id, [])
+            newest_first = reports[::-1]
+            end = None if limit is None else offset + limit
+            return [r.to_dict(self._contents) for r in newest_first[offset:end]]
+
+    def list_report_headers(self, user_id, before=None, limit=DEFAULT_HEADER_PAGE_SIZE):
+        with self._lock:
+            reports = self._reports.get(user_id, [])
+            # ID 오름차순 목록에서 before 바로 앞 위치를 이분 탐색으로 찾아 거꾸로 limit개만 읽습니다.
+            end = len(reports) if before is None else bisect.bisect_left(reports, before, key=lambda r: r.id)
+            window = reports[max(0, end - limit):end][::-1]
+            # 본문은 레코드 밖(ContentStore)에 있으므로 헤더는 본문을 건드리지 않고 만듭니다.
+            headers = [r.to_dict() for r in window]
+            has_more = end - limit > 0
+        return headers, (headers[-1]['id'] if has_more and headers else None)
+
+    def count_reports(self, user_id):
+        with self._lock:
+            return len(self._reports.get(user_id, []))
+
+    def iter_reports(self, school_name=None, class_number=None, date_from=None, date_to=None, batch_size=500,
+                     include_content=True):
+        with self._lock:
+            items = [(user_id, record) for user_id, records in self._reports.items() for record in records]
+        items.sort(key=lambda item: item[1].id)
+        contents = self._contents if include_content else None
+        for user_id, record in items:
+            report = record.to_dict(contents)
+            if report_matches(report, school_name, class_number, date_from, date_to):
+                yield {**report, 'userId': user_id}
+
+    def data_version(self):
+        return self._version
+
+    def get_summary(self, user_id):
+        with self._lock:
+            totals = self._totals.get(user_id)
+            if totals is None:
+                return empty_summary()
+            return _summary_from_totals(totals[0], totals[1], totals[2], dict(totals[3]))
+
+
+class SQLiteReportRepository(ReportRepository):
+    """
+    SQLite(WAL) 기반 리포트 저장소.
+    (user_id, report_id) 인덱스를 사용하여 사용자별 목록 조회를 인덱스 범위 스캔으로 처리하고,
+    report_id 고유 인덱스로 ID 조회를 처리합니다. 정수 id는 내부 순번(배치 읽기, data_version)으로만 사용합니다.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # Streamlit은 세션마다 다른 스레드에서 스크립트를 실행하므로 스레드 검사를 끄고 Lock으로 보호합니다.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._create_schema()
+
+    def _create_schema(self):
+        has_summaries = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'report_summaries'"
+        ).fetchone() is not None
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS reports (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                data TEXT NOT NULL,
+                report_id TEXT
+            );
+        """)
+        columns = {row['name'] for row in self._conn.execute('PRAGMA table_info(reports)')}
+        if 'report_id' not in columns:
+            self._conn.execute('ALTER TABLE reports ADD COLUMN report_id TEXT')
+        # 정수 ID만 있던 기존 리포트에는 createdAt 시각으로 ULID를 부여합니다.
+        legacy_rows = self._conn.execute('SELECT id, created_at FROM reports WHERE report_id IS NULL').fetchall()
+        self._conn.executemany(
+            'UPDATE reports SET report_id = ? WHERE id = ?',
+            [(new_report_id(row['created_at']), row['id']) for row in legacy_rows],
+        )
+        self._conn.executescript("""
+            DROP INDEX IF EXISTS idx_reports_user_created;
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_reports_report_id ON reports (report_id);
+            CREATE INDEX IF NOT EXISTS idx_reports_user_report_id
+                ON reports (user_id, report_id);
+            CREATE INDEX IF NOT EXISTS idx_reports_school_class
+                ON reports (json_extract(data, '$.schoolName'), json_extract(data, '$.classNumber'));
+            CREATE TABLE IF NOT EXISTS report_summaries (
+                user_id TEXT PRIMARY KEY,
+                report_count INTEGER NOT NULL,
+                rating_sum INTEGER NOT NULL,
+                last_created_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS report_field_counts (
+                user_id TEXT NOT NULL,
+                job_field TEXT NOT NULL,
+                report_count INTEGER NOT NULL,
+                PRIMARY KEY (user_id, job_field)
+            );
+        """)
+        if not has_summaries:
+            # 요약 테이블이 없던 기존 DB는 한 번만 전체 리포트로부터 요약을 채웁니다.
+            self._conn.executescript(f"""
+                INSERT INTO report_summaries
+                    SELECT user_id, COUNT(*), SUM(COALESCE(json_extract(data, '$.rating'), 0)), MAX(created_at)
+                    FROM reports GROUP BY user_id;
+                INSERT INTO report_field_counts
+                    SELECT user_id, COALESCE(NULLIF(json_extract(data, '$.jobField'), ''), '{UNSPECIFIED_JOB_FIELD}'), COUNT(*)
+                    FROM reports GROUP BY 1, 2;
+            """)
+        # 예전 버전은 분야가 없는 리포트를 빈 문자열('')로 세었으므로 UNSPECIFIED_JOB_FIELD로 합칩니다.
+        self._conn.execute("""
+            INSERT INTO report_field_counts (user_id, job_field, report_count)
+                SELECT user_id, ?, report_count FROM report_field_counts WHERE job_field = ''
+            ON CONFLICT (user_id, job_field) DO UPDATE SET report_count = report_count + excluded.report_count
+        """, (UNSPECIFIED_JOB_FIELD,))
+        self._conn.execute("DELETE FROM report_field_counts WHERE job_field = ''")
+        self._conn.commit()
+
+    @staticmethod
+    def _row_to_report(row):
+        report = json.loads(row['data'])
+        report['id'] = row['report_id']
+        report['createdAt'] = row['created_at']
+        return report
+
+    def add_report(self, user_id, report_data):
+        return self.add_reports([(user_id, report_data)])[0]
+
+    def add_reports(self, items):
+        saved = []
+        with self._lock:
+            try:
+                for user_id, report_data in items:
+                    check_storable_report(report_data)
+                    report = {k: v for k, v in report_data.items() if k != 'id'}
+                    report_id = new_report_id(report['createdAt'])
+                    self._conn.execute(
+                        'INSERT INTO reports (user_id, created_at, data, report_id) VALUES (?, ?, ?, ?)',
+                        (user_id, report['createdAt'], json.dumps(report, ensure_ascii=False), report_id),
+                    )
+                    self._update_summary(user_id, report)
+                    report['id'] = report_id
+                    saved.append(report)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return saved
+
+    def _update_summary(self, user_id, report):
+        # 리포트 INSERT와 같은 트랜잭션에서 요약 행을 UPSERT로 증분 갱신합니다.
+        self._conn.execute(
+            'INSERT INTO report_summaries (user_id, report_count, rating_sum, last_created_at) VALUES (?, 1, ?, ?) '
+            'ON CONFLICT (user_id) DO UPDATE SET report_count = report_count + 1, '
+            'rating_sum = rating_sum + excluded.rating_sum, '
+            'last_created_at = MAX(last_created_at, excluded.last_created_at)',
+            (user_id, report.get('rating') or 0, report['createdAt']),
+        )
+        self._conn.execute(
+            'INSERT INTO report_field_counts (user_id, job_field, report_count) VALUES (?, ?, 1) '
+            'ON CONFLICT (user_id, job_field) DO UPDATE SET report_count = report_count + 1',
+            (user_id, job_field_key(report)),
+        )
+
+    def get_report(self, report_id, user_id=None):
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT report_id, user_id, created_at, data FROM reports WHERE report_id = ?', (report_id,)
+            ).fetchone()
+        if row is None or (user_id is not None and row['user_id'] != user_id):
+            return None
+        report = self._row_to_report(row)
+        report['userId'] = row['user_id']
+        return report
+
+    def get_reports(self, report_ids, user_id):
+        report_ids = list(report_ids)
+        if not report_ids:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT report_id, created_at, data FROM reports '
+                f'WHERE user_id = ? AND report_id IN ({", ".join("?" * len(report_ids))})',
+                (user_id, *report_ids),
+            ).fetchall()
+        found = {row['report_id']: self._row_to_report(row) for row in rows}
+        return [found[report_id] for report_id in report_ids if report_id in found]
+
+    def list_reports(self, user_id, limit=None, offset=0):
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT report_id, created_at, data FROM reports WHERE user_id = ? '
+                'ORDER BY report_id DESC LIMIT ? OFFSET ?',
+                (user_id, -1 if limit is None else limit, offset),
+            ).fetchall()
+        return [self._row_to_report(row) for row in rows]
+
+    def list_report_headers(self, user_id, before=None, limit=DEFAULT_HEADER_PAGE_SIZE):
+        content_paths = ', '.join(f"'$.{field}'" for field in CONTENT_FIELDS)
+        with self._lock:
+            # (user_id, report_id) 인덱스 범위 스캔으로 limit + 1개만 읽고, 본문은 SQLite에서 제거한 뒤 가져옵니다.
+            rows = self._conn.execute(
+                f'SELECT report_id, created_at, json_remove(data, {content_paths}) AS data FROM reports '
+                f'WHERE user_id = ?{" AND report_id < ?" if before else ""} ORDER BY report_id DESC LIMIT ?',
+                (user_id, *([before] if before else []), limit + 1),
+            ).fetchall()
+        headers = [self._row_to_report(row) for row in rows[:limit]]
+        return headers, (headers[-1]['id'] if len(rows) > limit else None)
+
+    def count_reports(self, user_id):
+        # 리포트 행을 세지 않고, 저장과 같은 트랜잭션에서 갱신되는 요약 행의 report_count를 읽습니다. (O(1))
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT report_count FROM report_summaries WHERE user_id = ?', (user_id,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def iter_reports(self, school_name=None, class_number=None, date_from=None, date_to=None, batch_size=500,
+                     include_content=True):
+        conditions, params = [], []
+        if school_name:
+            conditions.append("json_extract(data, '$.schoolName') = ?")
+            params.append(school_name)
+        if class_number:
+            conditions.append("json_extract(data, '$.classNumber') = ?")
+            params.append(class_number)
+        if date_from:
+            conditions.append("json_extract(data, '$.experienceDate') >= ?")
+            params.append(date_from)
+        if date_to:
+            conditions.append("json_extract(data, '$.experienceDate') <= ?")
+            params.append(date_to)
+        where = ''.join(f' AND {condition}' for condition in conditions)
+        # 본문이 필요 없으면 list_report_headers처럼 SQLite에서 본문을 제거한 뒤 가져와 JSON 디코딩 비용을 줄입니다.
+        content_paths = ', '.join(f"'$.{field}'" for field in CONTENT_FIELDS)
+        data_column = 'data' if include_content else f'json_remove(data, {content_paths}) AS data'
+        last_id = 0
+        while True:
+            # id 기준 키셋 방식으로 batch_size씩 읽고, 배치 사이에는 Lock을 풀어 다른 세션의 저장을 막지 않습니다.
+            with self._lock:
+                rows = self._conn.execute(
+                    f'SELECT id, report_id, user_id, created_at, {data_column} FROM reports WHERE id > ?{where} ORDER BY id LIMIT ?',
+                    (last_id, *params, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                report = self._row_to_report(row)
+                report['userId'] = row['user_id']
+                yield report
+            last_id = rows[-1]['id']
+
+    def data_version(self):
+        with self._lock:
+            row = self._conn.execute('SELECT MAX(id) FROM reports').fetchone()
+        return row[0] or 0
+
+    def get_summary(self, user_id):
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT report_count, rating_sum, last_created_at FROM report_summaries WHERE user_id = ?', (user_id,)
+            ).fetchone()
+            if row is None:
+                return empty_summary()
+            field_rows = self._conn.execute(
+                'SELECT job_field, report_count FROM report_field_counts WHERE user_id = ?', (user_id,)
+            ).fetchall()
+        return _summary_from_totals(row[0], row[1], row[2], {r[0]: r[1] for r in field_rows})
+
+
+def create_report_repository(backend=None, db_path=None, firestore_pool=None):
+    """
+    환경 변수에 따라 리포트 저장소를 생성합니다.
+    - JOBSTRAVELING_STORAGE: 'sqlite'(기본값), 'memory' 또는 'firestore'
+    - JOBSTRAVELING_DB_PATH: SQLite 파일 경로 (기본값: htmls 옆의 data/jobstraveling.db)
+    firestore 백엔드는 firestore_pool(FirestoreClientPool)을 공유하며, 없으면 환경 변수로 새로 만듭니다.
+    """
+    backend = backend or os.environ.get('JOBSTRAVELING_STORAGE', 'sqlite')
+    if backend == 'memory':
+        return InMemoryReportRepository()
+    if backend == 'firestore':
+        from firestore_store import FirestoreClientPool, FirestoreReportRepository
+        return FirestoreReportRepository(firestore_pool or FirestoreClientPool.from_env())
+    if backend == 'sqlite':
+        return SQLiteReportRepository(db_path or os.environ.get('JOBSTRAVELING_DB_PATH', DEFAULT_DB_PATH))
+    raise ValueError(f"지원하지 않는 저장소 백엔드입니다: {backend}")
@@ -0,0 +1,165 @@
+import os
+import re
+import threading
+
+# --- HTML 템플릿 캐시 및 렌더러 ---
+# htmls 폴더의 파일을 프로세스당 한 번만 읽고 토큰화(리터럴/플레이스홀더 분리)해 둡니다.
+# 파일 수정 시각(mtime)이 바뀌면 자동으로 다시 읽으므로 개발 중 핫 리로드가 유지됩니다.
+# 렌더링은 `{{PLACEHOLDER}}`마다 str.replace를 반복하는 대신 한 번의 join으로 처리합니다.
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{([A-Z0-9_]+)\}\}')
+
+
+class Template:
+    """미리 토큰화된 HTML 템플릿."""
+
+    __slots__ = ('source', '_literals', '_names')
+
+    def __init__(self, source):
+        self.source = source
+        parts = PLACEHOLDER_PATTERN.split(source)
+        # split 결과는 [리터럴, 이름, 리터럴, 이름, ..., 리터럴] 형태입니다.
+        self._literals = parts[0::2]
+        self._names = parts[1::2]
+
+    @property
+    def placeholders(self):
+        """템플릿에 포함된 플레이스홀더 이름 집합."""
+        return frozenset(self._names)
+
+    def render(self, context=None, **values):
+        """
+        플레이스홀더를 한 번의 패스로 치환합니다.
+        context에 없는 플레이스홀더는 원문(`{{NAME}}`) 그대로 남겨 기존 str.replace 동작과 맞춥니다.
+        """
+        if context:
+            values = {**context, **values}
+        if not self._names:
+            return self.source
+        literals = self._literals
+        out = [literals[0]]
+        for i, name in enumerate(self._names, 1):
+            value = values.get(name)
+            out.append('{{' + name + '}}' if value is None else str(value))
+            out.append(literals[i])
+        return ''.join(out)
+
+
+class TemplateCache:
+    """
+    파일 이름을 키로, mtime이 바뀔 때만 다시 컴파일하는 템플릿 캐시.
+    transform(name, source)를 주면 컴파일 전에 한 번 적용합니다. (CDN 주소를 로컬 에셋으로 바꾸기 등)
+    """
+
+    def __init__(self, template_dir, transform=None):
+        self.template_dir = template_dir
+        self.transform = transform
+        self._lock = threading.Lock()
+        self._files = {}   # {file_name: (mtime_ns, Template)}
+        self._inline = {}  # {name: (원본 source, Template)}
+
+    def _compile(self, name, source):
+        return Template(self.transform(name, source) if self.transform else source)
+
+    def get(self, file_name):
+        """htmls 폴더의 템플릿을 반환합니다. 파일이 없으면 FileNotFoundError가 발생합니다."""
+        file_path = os.path.join(self.template_dir, file_name)
+        mtime = os.stat(file_path).st_mtime_ns
+        entry = self._files.get(file_name)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        with open(file_path, 'r', encoding='utf-8') as f:
+            template = self._compile(file_name, f.read())
+        with self._lock:
+            self._files[file_name] = (mtime, template)
+        return template
+
+    def get_inline(self, name, source):
+        """코드에 내장된 HTML 문자열을 이름 기준으로 한 번만 컴파일합니다."""
+        entry = self._inline.get(name)
+        if entry is None or entry[0] != source:
+            entry = (source, self._compile(name, source))
+            with self._lock:
+                self._inline[name] = entry
+        return entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._files.clear()
+            self._inline.clear()
+
+
+# 앱이 렌더링하는 템플릿 (views/home.py, views/program_list.py의 load_html_template). 에셋 빌드(assets.py)도 이 목록만 처리합니다.
+# htmls 폴더의 login/signup/view_reports.html은 현재 렌더링되지 않습니다. (로그인/가입/기록 보기는 Streamlit 위젯으로 그림)
+RENDERED_TEMPLATES = ('home.html', 'program_list.html')
+
+# 파일을 직접 읽는 대신 사용하는 Mock HTML입니다. (Canvas 환경의 제약사항을 우회하기 위함)
+# 여기에 없는 파일은 htmls 폴더에서 읽습니다.
+MOCK_HTML_TEMPLATES = {
+    'home.html': """
+            <style>
+                .card {
+                    background: white;
+                    border-radius: 12px;
+                    padding: 20px;
+                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+                    margin-bottom: 20px;
+                }
+                .section-title {
+                    font-size: 1.5rem;
+                    color: #1e40af;
+                    border-bottom: 2px solid #bfdbfe;
+                    padding-bottom: 5px;
+                    margin-bottom: 15px;
+                }
+            </style>
+            <div class="card">
+                <h2 class="section-title">👤 사용자 정보</h2>
+                <p><strong>이름:</strong> {{USER_NAME}}</p>
+                <p><strong>학교:</strong> {{USER_SCHOOL}}</p>
+                <p><strong>반 번호:</strong> {{USER_CLASS}}</p>
+                <p><strong>권한:</strong> {{USER_IS_ADMIN}}</p>
+            </div>
+            <div class="card">
+                <h2 class="section-title">📊 나의 활동 요약</h2>
+                <p>총 기록된 리포트 수: <span id="reportCount">{{REPORT_COUNT}}</span>개</p>
+                <p>가장 최근 기록일: <span id="lastReportDate">{{LAST_REPORT_DATE}}</span></p>
+                <p>평균 만족도: <span id="averageRating">{{AVERAGE_RATING}}</span></p>
+                <p>분야별 기록: <span id="jobFieldCounts">{{JOB_FIELD_COUNTS}}</span></p>
+            </div>
+            <div class="card">
+                <h2 class="section-title">🎯 이번 주 추천 진로 분야</h2>
+                <ul style="list-style-type: none; padding: 0;">
+                    <li style="padding: 5px 0; border-bottom: 1px dashed #eee;">⭐ AI와 데이터 사이언스</li>
+                    <li style="padding: 5px 0; border-bottom: 1px dashed #eee;">⭐ 친환경 에너지 기술</li>
+                    <li style="padding: 5px 0;">⭐ 미디어 콘텐츠 기획</li>
+                </ul>
+            </div>
+            """,
+    'program_list.html': """
+            <script src="https://www.gstatic.com/firebasejs/11.6.1/firebase-app.js"></script>
+            <script src="https://www.gstatic.com/firebasejs/11.6.1/firebase-auth.js"></script>
+            <script src="https://www.gstatic.com/firebasejs/11.6.1/firebase-firestore.js"></script>
+            
+            <div id="program-list-app" style="font-family: Arial, sans-serif;">
+                <h2 style="color: #1e40af;">등록된 프로그램 목록</h2>
+                <p style="color: #6b7280;">{{PROGRAM_PAGE_INFO}}</p>
+                <div id="program-container">
+                    <ul style="list-style-type: none; padding: 0;" id="program-list">
+                        <!-- 현재 페이지의 프로그램 목록이 여기에 주입됩니다 -->
+                        {{PROGRAM_LIST_ITEMS}}
+                    </ul>
+                </div>
+            </div>
+            """,
+}
+
+
+def rendered_template_sources(template_dir):
+    """RENDERED_TEMPLATES의 (이름, 원본 HTML)을 반환합니다. 내장 Mock HTML이 있으면 파일 대신 그것을 사용합니다."""
+    for name in RENDERED_TEMPLATES:
+        if name in MOCK_HTML_TEMPLATES:
+            yield name, MOCK_HTML_TEMPLATES[name]
+        else:
+            with open(os.path.join(template_dir, name), 'r', encoding='utf-8') as f:
+                yield name, f.read()
@@ -0,0 +1,198 @@
+import os
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from storage import DEFAULT_DB_PATH
+
+# --- 사용자 계정 저장소 (User Registry) ---
+# 세션마다 하나의 Mock 계정만 덮어쓰던 방식 대신, 모든 세션이 공유하는 계정 저장소입니다.
+# 리포트 저장소와 같은 백엔드(기본값 SQLite 파일)를 사용하며,
+# 이메일(기본 키)과 (schoolName, classNumber) 인덱스로 로그인/반 명단 조회를 처리합니다.
+# 최근 사용된 프로필은 크기가 제한된 LRU 캐시에 보관하여 반복 조회 시 DB에 접근하지 않습니다.
+
+DEFAULT_PROFILE_CACHE_SIZE = 2048
+
+# 데모 계정 (앱과 API 서버가 계정 저장소를 처음 만들 때 없으면 등록됩니다)
+DEMO_ADMIN_ACCOUNT = {
+    'email': 'admin@jobtrekking.com', 
+    'passwordHash': 'pbkdf2_sha256$120000$QDAN75saWndobIIVWzP4Hw==$xu3mS9HrBbAl+NzAyR1UVj77Htg4Wda/vkTf1BZZBBs=',
+    'schoolName': '관리자 학교',
+    'classNumber': '999',
+    'studentName': '관리자',
+    'birthDate': '2000-01-01',
+    'isAdmin': True 
+}
+DEMO_USER_ACCOUNT = {
+    'email': 'user@jobtrekking.com', 
+    'passwordHash': 'pbkdf2_sha256$120000$ayfaA7C8lcAVdF9sDwAGGg==$2xCwB/yQoaTgWw/U1H8D7ZIVPtx4Cvw5FsjVYQVYX4s=',
+    'schoolName': '일반 고등학교',
+    'classNumber': '101',
+    'studentName': '일반사용자',
+    'birthDate': '2007-01-01',
+    'isAdmin': False
+}
+
+
+def normalize_email(email):
+    return (email or '').strip().lower()
+
+
+class DuplicateUserError(ValueError):
+    """이미 가입된 이메일로 계정을 만들려고 할 때 발생합니다."""
+
+
+class UserRepository:
+    """사용자 계정 저장소 인터페이스. 계정(dict)에는 passwordHash가 포함됩니다."""
+
+    def add_user(self, account):
+        """계정을 추가합니다. 이미 있는 이메일이면 DuplicateUserError가 발생합니다."""
+        raise NotImplementedError
+
+    def get_user(self, email):
+        """이메일로 계정을 찾습니다. 없으면 None."""
+        raise NotImplementedError
+
+    def list_class(self, school_name, class_number):
+        """학교/반에 속한 계정 목록을 이메일순으로 반환합니다."""
+        raise NotImplementedError
+
+
+class InMemoryUserRepository(UserRepository):
+    """프로세스 메모리에 계정을 보관하는 저장소 (테스트/데모용)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users = {}     # {email: account}
+        self._by_class = {}  # {(schoolName, classNumber): {email, ...}}
+
+    def add_user(self, account):
+        account = {**account, 'email': normalize_email(account.get('email'))}
+        with self._lock:
+            if account['email'] in self._users:
+                raise DuplicateUserError(account['email'])
+            self._users[account['email']] = account
+            class_key = (account.get('schoolName'), account.get('classNumber'))
+            self._by_class.setdefault(class_key, set()).add(account['email'])
+        return dict(account)
+
+    def get_user(self, email):
+        account = self._users.get(normalize_email(email))
+        return dict(account) if account else None
+
+    def list_class(self, school_name, class_number):
+        with self._lock:
+            emails = sorted(self._by_class.get((school_name, class_number), ()))
+            return [dict(self._users[email]) for email in emails]
+
+
+class SQLiteUserRepository(UserRepository):
+    """SQLite 기반 계정 저장소. 리포트 저장소와 같은 DB 파일을 사용합니다."""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS users (
+                    email TEXT PRIMARY KEY,
+                    school_name TEXT,
+                    class_number TEXT,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_users_school_class
+                    ON users (school_name, class_number);
+            """)
+            self._conn.commit()
+
+    def add_user(self, account):
+        account = {**account, 'email': normalize_email(account.get('email'))}
+        with self._lock:
+            try:
+                self._conn.execute(
+                    'INSERT INTO users (email, school_name, class_number, data) VALUES (?, ?, ?, ?)',
+                    (account['email'], account.get('schoolName'), account.get('classNumber'),
+                     json.dumps(account, ensure_ascii=False)),
+                )
+                self._conn.commit()
+            except sqlite3.IntegrityError:
+                self._conn.rollback()
+                raise DuplicateUserError(account['email'])
+        return account
+
+    def get_user(self, email):
+        with self._lock:
+            row = self._conn.execute('SELECT data FROM users WHERE email = ?', (normalize_email(email),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list_class(self, school_name, class_number):
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT data FROM users WHERE school_name = ? AND class_number = ? ORDER BY email',
+                (school_name, class_number),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+
+class UserRegistry:
+    """계정 저장소 앞에 최근 사용 프로필 LRU 캐시를 둔 사용자 레지스트리."""
+
+    def __init__(self, repository, cache_size=DEFAULT_PROFILE_CACHE_SIZE):
+        self.repository = repository
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()  # {email: account} (최근 사용 순)
+
+    def _remember(self, account):
+        with self._lock:
+            self._cache[account['email']] = account
+            self._cache.move_to_end(account['email'])
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def register(self, account):
+        """새 계정을 저장합니다. 이미 있는 이메일이면 DuplicateUserError가 발생합니다."""
+        saved = self.repository.add_user(account)
+        self._remember(saved)
+        return dict(saved)
+
+    def ensure(self, account):
+        """계정이 없을 때만 저장합니다. (데모 계정 초기화용)"""
+        try:
+            return self.register(account)
+        except DuplicateUserError:
+            return self.get(account['email'])
+
+    def get(self, email):
+        """이메일로 계정을 찾습니다. 최근 사용된 계정은 캐시에서 바로 반환합니다."""
+        email = normalize_email(email)
+        with self._lock:
+            account = self._cache.get(email)
+            if account is not None:
+                self._cache.move_to_end(email)
+                return dict(account)
+        account = self.repository.get_user(email)
+        if account is not None:
+            self._remember(account)
+            return dict(account)
+        return None
+
+    def list_class(self, school_name, class_number):
+        """학교/반 명단을 (schoolName, classNumber) 인덱스로 조회합니다."""
+        return self.repository.list_class(school_name, class_number)
+
+
+def create_user_repository(backend=None, db_path=None):
+    """리포트 저장소와 같은 환경 변수(JOBSTRAVELING_STORAGE / JOBSTRAVELING_DB_PATH)로 계정 저장소를 생성합니다."""
+    backend = backend or os.environ.get('JOBSTRAVELING_STORAGE', 'sqlite')
+    if backend == 'memory':
+        return InMemoryUserRepository()
+    if backend in ('sqlite', 'firestore'):
+        # Firestore 백엔드는 리포트만 담당하므로 계정은 서버의 SQLite 파일에 둡니다.
+        return SQLiteUserRepository(db_path or os.environ.get('JOBSTRAVELING_DB_PATH', DEFAULT_DB_PATH))
+    raise ValueError(f"지원하지 않는 저장소 백엔드입니다: {backend}")
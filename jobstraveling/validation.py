@@ -0,0 +1,97 @@
+from datetime import date, datetime
+
+# --- 입력 데이터 유효성 검사 ---
+# 화면 저장(save_report_to_firestore), API 서버(api.py), 대량 가져오기(importer.py)가 같은 규칙을 사용하도록 한곳에 모아 둡니다.
+# 각 함수는 문제가 없으면 None, 있으면 사용자에게 보여줄 오류 메시지를 반환합니다.
+
+REPORT_REQUIRED_FIELDS_MESSAGE = "체험 프로그램명, 일자, 별점, 소감 내용을 모두 입력해 주세요."
+REPORT_RATING_MESSAGE = "별점은 0~5 사이의 정수여야 합니다."
+REPORT_FIELD_TYPE_MESSAGE = "체험 프로그램명, 일자, 분야, 소감 내용은 문자열이어야 합니다."
+PROGRAM_REQUIRED_FIELDS_MESSAGE = "프로그램명, 분야, 일자, 장소를 모두 입력해 주세요."
+PROGRAM_DATE_FORMAT_MESSAGE = "프로그램 일자는 YYYY-MM-DD 형식의 날짜여야 합니다."
+PROGRAM_DUPLICATE_MESSAGE = "이미 등록된 프로그램입니다. (같은 이름/일자/장소)"
+# 프로그램 저장 시 공백을 정리하는 텍스트 필드
+PROGRAM_TEXT_FIELDS = ('name', 'field', 'description', 'date', 'location')
+
+# 클라이언트(작성 폼, API)가 보낼 수 있는 리포트 필드. 나머지(id, createdAt, 작성자 정보)는 서버가 채웁니다.
+REPORT_INPUT_FIELDS = ('programName', 'experienceDate', 'jobField', 'rating', 'reportContent')
+REPORT_TEXT_FIELDS = ('programName', 'experienceDate', 'jobField', 'reportContent')
+REPORT_CONTENT_MAX_CHARS = 5000
+REPORT_TEXT_MAX_CHARS = 200  # 소감 내용을 제외한 텍스트 필드의 최대 길이
+REPORT_RATING_RANGE = (0, 5)
+
+# 관리자 내보내기(학교/반 필터)를 위해 리포트에 함께 저장하는 작성자 정보
+REPORT_AUTHOR_FIELDS = ('schoolName', 'classNumber', 'studentName')
+# 분야를 입력하지 않은 리포트의 분야 값. 저장(prepare_report, importer)과 모든 저장소의 분야별 요약이 같은 값을 씁니다.
+# (빈 문자열은 Firestore 필드 경로로 쓸 수 없으므로 빈 값 대신 사용합니다)
+UNSPECIFIED_JOB_FIELD = '미입력'
+
+
+def validate_report(report_data):
+    """
+    리포트 필수 필드(programName, experienceDate, rating, reportContent)와 형식을 확인합니다.
+    별점은 0~5 사이의 정수(bool 제외), 텍스트 필드는 문자열이며 길이 제한을 넘지 않아야 합니다.
+    """
+    if (not isinstance(report_data, dict)
+            or not report_data.get('programName')
+            or not report_data.get('experienceDate')
+            or report_data.get('rating') is None
+            or not report_data.get('reportContent')):
+        return REPORT_REQUIRED_FIELDS_MESSAGE
+    if any(report_data.get(key) is not None and not isinstance(report_data[key], str) for key in REPORT_TEXT_FIELDS):
+        return REPORT_FIELD_TYPE_MESSAGE
+    rating = report_data['rating']
+    if type(rating) is not int or not REPORT_RATING_RANGE[0] <= rating <= REPORT_RATING_RANGE[1]:
+        return REPORT_RATING_MESSAGE
+    if len(report_data['reportContent']) > REPORT_CONTENT_MAX_CHARS:
+        return f"소감 내용은 {REPORT_CONTENT_MAX_CHARS}자 이하로 입력해 주세요."
+    if any(len(report_data.get(key) or '') > REPORT_TEXT_MAX_CHARS for key in REPORT_TEXT_FIELDS if key != 'reportContent'):
+        return f"체험 프로그램명, 일자, 분야는 {REPORT_TEXT_MAX_CHARS}자 이하로 입력해 주세요."
+    return None
+
+
+def job_field_key(report):
+    """분야별 요약에서 리포트를 세는 키. 분야가 없거나 비어 있으면 UNSPECIFIED_JOB_FIELD."""
+    return report.get('jobField') or UNSPECIFIED_JOB_FIELD
+
+
+def prepare_report(report_data, profile):
+    """
+    저장 요청을 검사하고 저장할 리포트를 만듭니다. (작성 시각과 작성자 정보를 채웁니다)
+    REPORT_INPUT_FIELDS 밖의 필드가 있으면 저장하지 않습니다.
+    반환값: (리포트, None) 또는 검사에 실패하면 (None, 오류 메시지)
+    """
+    error_message = validate_report(report_data)
+    if error_message:
+        return None, error_message
+    unknown_fields = sorted(key for key in report_data if key not in REPORT_INPUT_FIELDS)
+    if unknown_fields:
+        return None, f"허용되지 않는 항목이 포함되어 있습니다: {', '.join(map(str, unknown_fields))}"
+    report = {key: report_data[key] for key in REPORT_INPUT_FIELDS if key in report_data}
+    report['jobField'] = job_field_key(report)
+    report['createdAt'] = datetime.now().isoformat()
+    # 작성자 정보는 클라이언트가 보낸 값이 아니라 항상 로그인 프로필에서 채웁니다.
+    for key in REPORT_AUTHOR_FIELDS:
+        report[key] = (profile or {}).get(key)
+    return report, None
+
+
+def validate_program(program):
+    """프로그램 필수 필드(name, field, date, location)를 확인합니다."""
+    if not program or not all(program.get(key) for key in ('name', 'field', 'date', 'location')):
+        return PROGRAM_REQUIRED_FIELDS_MESSAGE
+    try:
+        if date.fromisoformat(program['date']).isoformat() != program['date']:
+            return PROGRAM_DATE_FORMAT_MESSAGE
+    except (TypeError, ValueError):
+        return PROGRAM_DATE_FORMAT_MESSAGE
+    return None
+
+
+def normalize_program(program):
+    """프로그램 텍스트 필드의 앞뒤 공백을 지우고, 설명을 제외한 필드는 연속 공백을 하나로 줄입니다."""
+    normalized = dict(program)
+    for key in PROGRAM_TEXT_FIELDS:
+        value = str(program.get(key) or '').strip()
+        normalized[key] = value if key == 'description' else ' '.join(value.split())
+    return normalized
@@ -0,0 +1,39 @@
+import importlib
+from collections import namedtuple
+
+from runtime import (
+    PAGE_LOGIN, PAGE_SIGNUP, PAGE_HOME, PAGE_PROGRAM_LIST, PAGE_ADD_PROGRAM, PAGE_ADD_REPORT,
+    PAGE_VIEW_REPORTS, PAGE_BULK_IMPORT, PAGE_EXPORT_REPORTS, PAGE_ANALYTICS, PAGE_DIAGNOSTICS,
+)
+
+# --- 페이지 레지스트리 ---
+# 페이지 이름 → (모듈, render 함수, 로그인 필요 여부). 각 페이지 모듈은 그 페이지가 처음 요청될 때 import되므로
+# 첫 화면(로그인)을 띄울 때 pandas(통계), pyarrow(내보내기) 같은 무거운 의존성을 읽지 않습니다.
+# 한 번 import된 모듈은 프로세스가 끝날 때까지 재사용됩니다. (rerun마다 다시 실행되지 않음)
+
+PageSpec = namedtuple('PageSpec', ['module', 'function', 'requires_auth'])
+
+PAGE_REGISTRY = {
+    PAGE_LOGIN: PageSpec('views.login', 'render_login_page', False),
+    PAGE_SIGNUP: PageSpec('views.signup', 'render_signup_page', False),
+    PAGE_HOME: PageSpec('views.home', 'render_home_page', True),
+    PAGE_PROGRAM_LIST: PageSpec('views.program_list', 'render_program_list_page', True),
+    PAGE_ADD_PROGRAM: PageSpec('views.add_program', 'render_add_program_page', True),
+    PAGE_ADD_REPORT: PageSpec('views.add_report', 'render_add_report_page', True),
+    PAGE_VIEW_REPORTS: PageSpec('views.view_reports', 'render_view_reports_page', True),
+    PAGE_BULK_IMPORT: PageSpec('views.bulk_import', 'render_bulk_import_page', True),
+    PAGE_EXPORT_REPORTS: PageSpec('views.export_reports', 'render_export_reports_page', True),
+    PAGE_ANALYTICS: PageSpec('views.analytics_dashboard', 'render_analytics_page', True),
+    PAGE_DIAGNOSTICS: PageSpec('views.diagnostics', 'render_diagnostics_page', True),
+}
+
+
+def resolve_page(page, authenticated):
+    """
+    요청한 페이지의 render 함수를 반환합니다.
+    등록되지 않은 페이지이거나 로그인이 필요한데 로그인하지 않았으면 None을 반환합니다.
+    """
+    spec = PAGE_REGISTRY.get(page)
+    if spec is None or (spec.requires_auth and not authenticated):
+        return None
+    return getattr(importlib.import_module(spec.module), spec.function)
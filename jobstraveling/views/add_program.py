@@ -0,0 +1,83 @@
+import streamlit as st
+
+from profiler import PROFILER
+from runtime import PAGE_HOME, PAGE_PROGRAM_LIST, navigate, create_programs
+
+# --- 관리자 프로그램 추가 페이지 ---
+
+# 한 번에 등록할 수 있는 최대 프로그램 수 (표에 행을 추가해 여러 개를 함께 등록)
+MAX_PROGRAMS_PER_SUBMIT = 50
+PROGRAM_EDITOR_COLUMNS = {
+    'name': st.column_config.TextColumn("프로그램명", required=True, max_chars=100),
+    'field': st.column_config.TextColumn("분야", required=True, max_chars=50),
+    'date': st.column_config.TextColumn("일자 (YYYY-MM-DD)", required=True, validate=r"^\d{4}-\d{2}-\d{2}$"),
+    'location': st.column_config.TextColumn("장소", required=True, max_chars=100),
+    'description': st.column_config.TextColumn("설명", max_chars=1000),
+}
+
+def empty_program_rows():
+    return [{key: None for key in PROGRAM_EDITOR_COLUMNS}]
+
+@PROFILER.instrument('render.add_program')
+def render_add_program_page():
+    """
+    관리자가 새 프로그램을 한 번에 여러 개 등록하는 폼을 렌더링합니다.
+    표 편집 내용은 제출할 때만 서버로 전달되며, 서버에서 검사와 중복 확인을 거쳐 공유 프로그램 저장소에 저장합니다.
+    """
+    if not st.session_state.user_data or not st.session_state.user_data.get('isAdmin', False):
+        st.error("접근 권한이 없습니다.")
+        navigate(PAGE_HOME)
+        return
+
+    st.title("새 진로 프로그램 추가 (관리자 전용) ✏️")
+    st.info(
+        "표에 행을 추가해 여러 프로그램을 한 번에 등록할 수 있습니다. 등록된 프로그램은 모든 서버의 프로그램 목록과 검색에 바로 반영됩니다.\n\n"
+        "이름, 일자, 장소가 같은 프로그램(공백/대소문자 차이 무시)은 이미 등록된 것으로 보고 건너뜁니다."
+    )
+
+    # 등록에 성공하면 편집기 키를 바꿔 표를 비웁니다.
+    editor_version = st.session_state.get('add_program_editor_version', 0)
+    with st.form("add_program_form"):
+        rows = st.data_editor(
+            empty_program_rows(),
+            column_config=PROGRAM_EDITOR_COLUMNS,
+            num_rows="dynamic",
+            use_container_width=True,
+            hide_index=True,
+            key=f"add_program_editor_{editor_version}",
+        )
+        submitted = st.form_submit_button("프로그램 등록")
+
+    if submitted:
+        # 모든 칸이 빈 행(편집기가 남긴 기본 행)은 무시하고, 오류 표시는 표의 행 번호로 합니다.
+        filled_rows = [(row_number, row) for row_number, row in enumerate(rows, start=1)
+                       if any(str(value or '').strip() for value in row.values())]
+        programs = [row for _, row in filled_rows]
+        if not programs:
+            st.error("등록할 프로그램을 한 개 이상 입력해 주세요.")
+        elif len(programs) > MAX_PROGRAMS_PER_SUBMIT:
+            st.error(f"한 번에 최대 {MAX_PROGRAMS_PER_SUBMIT}개까지 등록할 수 있습니다. 더 많은 프로그램은 대량 가져오기를 이용해 주세요.")
+        else:
+            saved_programs, rejects = create_programs(programs)
+            rejects = [(filled_rows[index - 1][0], reason) for index, reason in rejects]
+            if saved_programs:
+                st.session_state.add_program_editor_version = editor_version + 1
+                st.session_state.add_program_result = (
+                    [program['name'] for program in saved_programs], rejects
+                )
+                st.rerun()
+            st.error("등록된 프로그램이 없습니다. 입력 내용을 확인해 주세요.")
+            st.dataframe([{'행': row_number, '사유': reason} for row_number, reason in rejects], use_container_width=True, hide_index=True)
+
+    # 직전 등록 결과 (표를 비우기 위해 다시 실행한 뒤 한 번만 표시)
+    result = st.session_state.pop('add_program_result', None)
+    if result:
+        saved_names, rejects = result
+        st.success(f"🎉 프로그램 {len(saved_names)}개를 등록했습니다: {', '.join(saved_names)}")
+        if rejects:
+            st.warning(f"제외된 행 {len(rejects)}개")
+            st.dataframe([{'행': row_number, '사유': reason} for row_number, reason in rejects], use_container_width=True, hide_index=True)
+
+    st.markdown("---")
+    if st.button("프로그램 목록 보기", key="back_to_list_from_add"):
+        navigate(PAGE_PROGRAM_LIST)
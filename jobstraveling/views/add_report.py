@@ -0,0 +1,123 @@
+import streamlit as st
+import streamlit.components.v1 as components
+import os
+import hashlib
+
+from profiler import PROFILER
+from drafts import create_draft_repository, DRAFT_FLUSH_SECONDS
+from runtime import (
+    PAGE_HOME, PAGE_VIEW_REPORTS, STORAGE_BACKEND, API_URL, FRONTEND_DIR,
+    navigate, get_current_user_id, get_search_service, save_report_to_firestore,
+)
+
+# --- 잡스리포트 기록 페이지 ---
+
+@st.cache_resource
+def get_draft_store():
+    """리포트 초안 저장소를 프로세스당 한 번만 생성합니다."""
+    return create_draft_repository(STORAGE_BACKEND)
+
+@st.cache_resource
+def get_report_form_component():
+    """
+    리포트 입력 폼 컴포넌트(frontend/report_form)를 프로세스당 한 번만 등록합니다.
+    API 서버 모드에서는 API 서버가 제공하는 같은 폼을 사용합니다.
+    """
+    if API_URL:
+        return components.declare_component('report_form', url=f"{API_URL}/components/report_form/")
+    return components.declare_component('report_form', path=os.path.join(FRONTEND_DIR, 'report_form'))
+
+@PROFILER.instrument('render.add_report')
+def render_add_report_page():
+    """
+    리포트 입력 폼 컴포넌트를 표시하고, 폼에서 '저장'을 눌렀을 때 한 번 전달되는 값으로 저장을 처리합니다.
+    입력 중인 값은 브라우저(컴포넌트)에만 있으므로 입력할 때마다 스크립트가 다시 실행되지 않습니다.
+    """
+    st.title("잡스리포트 기록하기 📝")
+
+    user_id = get_current_user_id()
+    draft_store = get_draft_store()
+
+    # 1. 폼 컴포넌트 렌더링
+    # - draft: 서버에 보관된 초안 (폼은 브라우저 보관본과 비교해 더 최근 것을 복원합니다)
+    # - draft_key: 브라우저 localStorage 키 (이메일 대신 해시를 사용)
+    # - saved/failed_submission_id: 직전 제출의 처리 결과 (입력을 비우거나 다시 제출할 수 있게 함)
+    # - api_url/api_token: API 서버 모드에서 폼이 리포트를 API에 직접 저장할 때 사용
+    with PROFILER.timed("component.report_form"):
+        form_value = get_report_form_component()(
+            draft=draft_store.get_draft(user_id) if user_id else None,
+            draft_key=hashlib.sha256((user_id or '').encode('utf-8')).hexdigest()[:16],
+            draft_flush_ms=DRAFT_FLUSH_SECONDS * 1000,
+            saved_submission_id=st.session_state.get('saved_report_submission_id'),
+            failed_submission_id=st.session_state.get('failed_report_submission_id'),
+            api_url=API_URL or None,
+            api_token=st.session_state.api_token if API_URL else None,
+            key="add_report_form_component",
+            default=None,
+        )
+
+    # 2-1. 초안 자동 저장: 폼이 주기적으로 보낸 diff를 서버 초안에 합칩니다.
+    # 컴포넌트 값은 다음 rerun에도 남아 있으므로 flushId로 한 번만 반영합니다.
+    # (저장 성공 후 지운 초안이 마지막 diff로 다시 만들어지지 않게 함)
+    draft = form_value.get('draft') if isinstance(form_value, dict) else None
+    if (isinstance(draft, dict) and user_id and draft.get('flushId')
+            and draft['flushId'] != st.session_state.get('applied_draft_flush_id')):
+        st.session_state.applied_draft_flush_id = draft['flushId']
+        st.session_state.current_report_data = draft_store.apply_changes(
+            user_id, draft.get('changes'), int(draft.get('updatedAt') or 0)
+        )
+
+    # 2-2. 새 제출인지 확인합니다. (컴포넌트 값은 다음 rerun에도 남아 있으므로 제출 ID로 한 번만 처리)
+    submission_id = form_value.get('submissionId') if isinstance(form_value, dict) else None
+    is_new_submission = (
+        submission_id is not None
+        and form_value.get('submitted')
+        and submission_id != st.session_state.get('last_report_submission_id')
+    )
+
+    st.markdown("---")
+
+    # A) 제출 처리
+    if is_new_submission:
+        st.session_state.last_report_submission_id = submission_id
+        saved_report = form_value.get('savedReport')
+        if isinstance(saved_report, dict) and saved_report.get('id'):
+            # 폼이 API 서버에 이미 저장했습니다. 이 프로세스의 검색 색인만 갱신합니다.
+            get_search_service().index_report(user_id, saved_report)
+            success, message = True, ""
+        else:
+            success, message = save_report_to_firestore(dict(form_value.get('reportData') or {}))
+        if success:
+            draft_store.delete_draft(user_id)
+            st.session_state.saved_report_submission_id = submission_id
+            st.session_state.report_saved_successfully = True
+            st.session_state.current_report_data = None # 임시 데이터(초안) 초기화
+            st.rerun() # 성공 메시지와 버튼을 표시하고 폼을 비우기 위해 페이지 새로고침
+        else:
+            # 폼이 입력을 유지한 채 다시 제출할 수 있도록 실패한 제출 ID를 전달하며 다시 렌더링합니다.
+            st.session_state.failed_report_submission_id = submission_id
+            st.session_state.report_save_error = message
+            st.rerun()
+
+    save_error = st.session_state.pop('report_save_error', None)
+    if save_error:
+        st.error(f"⚠️ 리포트 저장 실패: {save_error}")
+
+    # B) 저장 성공 후 상태
+    if st.session_state.get('report_saved_successfully', False):
+        st.success("🎉 리포트가 성공적으로 저장되었습니다. 다음 활동을 선택해 주세요.")
+        
+        # NOTE: 다음 렌더링 시 메시지가 다시 뜨지 않게 False로 초기화합니다.
+        st.session_state.report_saved_successfully = False 
+        
+        col_view, col_home = st.columns(2)
+        with col_view:
+            if st.button("📖 나의 기록 보기", key="post_save_view_reports"):
+                navigate(PAGE_VIEW_REPORTS)
+        with col_home:
+            if st.button("메인 화면으로 돌아가기", key="post_save_home"):
+                navigate(PAGE_HOME)
+
+    # C) 기본 상태
+    elif st.button("메인 화면으로 돌아가기", key="back_to_home_from_report_default_v5"):
+        navigate(PAGE_HOME)
@@ -0,0 +1,54 @@
+import streamlit as st
+
+import analytics
+from profiler import PROFILER
+from runtime import PAGE_HOME, navigate, get_report_store
+
+# --- 관리자 통계 대시보드 페이지 (pandas는 이 페이지를 처음 열 때 import됩니다) ---
+
+@st.cache_data(show_spinner="통계를 계산하는 중...", max_entries=2)
+def load_report_analytics(data_version):
+    """
+    전체 리포트 통계를 계산합니다.
+    data_version(저장소에 리포트가 저장될 때마다 증가)이 캐시 키이므로, 새 리포트가 저장된 뒤에만 다시 계산됩니다.
+    (증분 계산이 아니므로 저장이 한 건이라도 있으면 다음 조회 때 전체 리포트를 다시 읽습니다)
+    """
+    return analytics.compute_analytics(get_report_store().iter_reports(include_content=False))
+
+@PROFILER.instrument('render.analytics')
+def render_analytics_page():
+    """관리자가 전체 학생의 리포트 통계를 확인하는 대시보드를 렌더링합니다."""
+    if not st.session_state.user_data or not st.session_state.user_data.get('isAdmin', False):
+        st.error("접근 권한이 없습니다.")
+        navigate(PAGE_HOME)
+        return
+
+    st.title("리포트 통계 대시보드 (관리자 전용) 📈")
+    result = load_report_analytics(get_report_store().data_version())
+
+    col_reports, col_students, col_rating = st.columns(3)
+    col_reports.metric("전체 리포트", f"{result['total_reports']:,}건")
+    col_students.metric("참여 학생", f"{result['total_students']:,}명")
+    col_rating.metric("평균 별점", f"{result['average_rating']:.2f}" if result['average_rating'] is not None else "-")
+
+    if not result['total_reports']:
+        st.info("아직 저장된 리포트가 없습니다.")
+    else:
+        st.subheader("별점 분포")
+        st.bar_chart(result['rating_distribution'])
+
+        st.subheader("프로그램별 리포트 수")
+        st.dataframe(result['reports_per_program'], use_container_width=True)
+
+        st.subheader("분야별 월간 추이")
+        if result['job_field_trend'].empty:
+            st.info("체험 일자가 있는 리포트가 없습니다.")
+        else:
+            st.line_chart(result['job_field_trend'])
+
+        st.subheader("학교/반별 참여 현황")
+        st.dataframe(result['class_participation'], use_container_width=True)
+
+    st.markdown("---")
+    if st.button("메인 화면으로 돌아가기", key="back_to_home_from_analytics"):
+        navigate(PAGE_HOME)
@@ -0,0 +1,49 @@
+import streamlit as st
+
+import importer
+from profiler import PROFILER
+from runtime import PAGE_HOME, navigate, import_programs_batch, save_reports_batch
+
+# --- 관리자 대량 가져오기 페이지 ---
+
+@PROFILER.instrument('render.bulk_import')
+def render_bulk_import_page():
+    """관리자가 CSV/JSONL 파일로 프로그램 또는 과거 리포트를 한꺼번에 가져오는 페이지를 렌더링합니다."""
+    if not st.session_state.user_data or not st.session_state.user_data.get('isAdmin', False):
+        st.error("접근 권한이 없습니다.")
+        navigate(PAGE_HOME)
+        return
+
+    st.title("대량 가져오기 (관리자 전용) 📦")
+    st.info(
+        "CSV 또는 JSONL 파일을 업로드하세요. 파일은 나누어 스트리밍으로 처리되며, 화면 저장과 같은 규칙으로 검사합니다.\n\n"
+        "- 프로그램: name, field, description, date, location (id 선택)\n"
+        "- 리포트: userId(또는 email), programName, experienceDate, jobField, rating, reportContent "
+        "(createdAt, schoolName, classNumber, studentName 선택)"
+    )
+
+    kind = st.radio("가져올 데이터", ["프로그램", "리포트"], horizontal=True, key="bulk_import_kind")
+    uploaded_file = st.file_uploader("파일 선택", type=["csv", "jsonl", "json"], key="bulk_import_file")
+
+    if uploaded_file is not None and st.button("가져오기 시작", key="bulk_import_start"):
+        try:
+            file_format = importer.detect_format(uploaded_file.name)
+        except ValueError as e:
+            st.error(str(e))
+        else:
+            progress = st.empty()
+            run = importer.import_programs if kind == "프로그램" else importer.import_reports
+            save_batch = import_programs_batch if kind == "프로그램" else save_reports_batch
+            result = run(
+                importer.open_text(uploaded_file), file_format, save_batch,
+                on_progress=lambda r: progress.text(f"{r.rows_read:,}행 처리 중... ({r.rows_per_sec:,.0f}행/초)"),
+            )
+            progress.empty()
+            st.success(f"가져오기 완료: {result.summary()}")
+            if result.rejects:
+                st.warning(f"거부된 행 {result.rows_rejected}건 (최대 {importer.MAX_REJECTS_KEPT}건 표시)")
+                st.dataframe([{'행': row_number, '사유': reason} for row_number, reason in result.rejects], use_container_width=True)
+
+    st.markdown("---")
+    if st.button("메인 화면으로 돌아가기", key="back_to_home_from_bulk_import"):
+        navigate(PAGE_HOME)
@@ -0,0 +1,66 @@
+import streamlit as st
+
+from profiler import PROFILER
+from runtime import PAGE_HOME, navigate, get_report_writer, get_result_cache
+
+# --- 관리자 성능 진단 페이지 ---
+
+def render_diagnostics_page():
+    """관리자가 페이지 렌더링/저장소 호출의 지연 시간 백분위수를 확인하는 진단 페이지를 렌더링합니다."""
+    if not st.session_state.user_data or not st.session_state.user_data.get('isAdmin', False):
+        st.error("접근 권한이 없습니다.")
+        navigate(PAGE_HOME)
+        return
+
+    st.title("성능 진단 (관리자 전용) ⏱️")
+
+    if not PROFILER.enabled:
+        st.warning("계측이 꺼져 있습니다. 환경 변수 `JOBSTRAVELING_PROFILE=1`로 서버를 시작하면 측정값이 수집됩니다.")
+    else:
+        rows = PROFILER.snapshot()
+        if rows:
+            st.caption("지표별 최근 측정값으로 계산한 백분위수 (ms)")
+            st.dataframe(rows, use_container_width=True, hide_index=True)
+        else:
+            st.info("아직 수집된 측정값이 없습니다.")
+
+        metrics_text = PROFILER.to_prometheus()
+        with st.expander("Prometheus 텍스트 형식"):
+            st.code(metrics_text, language="text")
+        col_download, col_reset = st.columns(2)
+        with col_download:
+            st.download_button("⬇️ metrics.txt 내려받기", data=metrics_text, file_name="metrics.txt", mime="text/plain", key="diagnostics_download")
+        with col_reset:
+            if st.button("측정값 초기화", key="diagnostics_reset"):
+                PROFILER.reset()
+                st.rerun()
+
+    st.subheader("리포트 쓰기 대기열")
+    st.caption("저장 요청은 배치 트랜잭션으로 묶여 기록됩니다. 지연 시간은 요청부터 커밋까지의 시간입니다.")
+    writer_metrics = get_report_writer().metrics()
+    col_depth, col_batch, col_p50, col_p99 = st.columns(4)
+    col_depth.metric("대기 중", writer_metrics['queue_depth'])
+    col_batch.metric("평균 배치 크기", writer_metrics['avg_batch_size'])
+    col_p50.metric("p50 (ms)", writer_metrics['latency_p50_ms'])
+    col_p99.metric("p99 (ms)", writer_metrics['latency_p99_ms'])
+    st.caption(f"배치 {writer_metrics['batches']}회 · 저장 {writer_metrics['written']}건 · 실패 {writer_metrics['failed']}건")
+
+    st.subheader("결과 캐시")
+    st.caption("목록 페이지 조회 결과 캐시입니다. 적중률이 낮으면 TTL이나 최대 크기(JOBSTRAVELING_RESULT_CACHE_*)를 조정하세요.")
+    cache_stats = get_result_cache().stats()
+    col_rate, col_entries, col_bytes, col_ttl = st.columns(4)
+    col_rate.metric("적중률", f"{cache_stats['hit_rate'] * 100:.1f}%")
+    col_entries.metric("항목 수", f"{cache_stats['entries']} / {cache_stats['max_entries']}")
+    col_bytes.metric("크기 (KB)", f"{cache_stats['bytes'] / 1024:.1f}")
+    col_ttl.metric("TTL (초)", f"{cache_stats['ttl_seconds']:g}")
+    st.caption(
+        f"적중 {cache_stats['hits']}회 · 실패 {cache_stats['misses']}회 · 만료 {cache_stats['expired']}건 · "
+        f"무효화 {cache_stats['invalidated']}건 · 축출 {cache_stats['evicted']}건"
+    )
+    if st.button("결과 캐시 비우기", key="diagnostics_clear_result_cache"):
+        get_result_cache().clear()
+        st.rerun()
+
+    st.markdown("---")
+    if st.button("메인 화면으로 돌아가기", key="back_to_home_from_diagnostics"):
+        navigate(PAGE_HOME)
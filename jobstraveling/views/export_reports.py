@@ -0,0 +1,114 @@
+import streamlit as st
+import os
+import tempfile
+from datetime import date
+
+import exporter
+from api_client import ApiError
+from profiler import PROFILER
+from runtime import PAGE_HOME, navigate, get_report_store, get_user_registry, get_api_client
+
+# --- 관리자 리포트 내보내기 페이지 ---
+# API 서버(JOBSTRAVELING_API_URL)가 있으면 API 서버가 파일을 스트리밍으로 내려보내고, 이 페이지는 링크만 만듭니다.
+# 없으면 이 서버에서 파일을 만들어 st.download_button으로 내려보내는데, 버튼은 파일 전체를 세션이 끝날 때까지
+# 메모리에 보관하므로 EXPORT_MAX_IN_APP_MB까지만 허용합니다.
+
+EXPORT_MAX_IN_APP_MB = int(os.environ.get('JOBSTRAVELING_EXPORT_MAX_MB', '50'))
+
+def render_api_export_link(api_client, export_format, filters):
+    """API 서버에 내보내기 링크를 요청해 표시합니다. 파일은 API 서버가 스트리밍으로 보냅니다."""
+    if not st.session_state.api_token:
+        st.error("API 서버 로그인 정보가 없습니다. 로그아웃한 뒤 다시 로그인해 주세요.")
+        return
+    try:
+        url = api_client.create_report_export(st.session_state.api_token, export_format, **filters)
+    except ApiError as e:
+        st.error(f"⚠️ {e}")
+        return
+    st.success("내려받기 링크를 만들었습니다. 링크는 잠시 뒤 만료되므로 바로 내려받아 주세요.")
+    st.link_button("⬇️ 파일 내려받기", url)
+
+def render_in_app_export(export_format, filters):
+    """이 서버에서 파일을 만들어 내려받기 버튼으로 보냅니다. (EXPORT_MAX_IN_APP_MB 이하만)"""
+    reports = get_report_store().iter_reports(
+        filters['schoolName'], filters['classNumber'], filters['dateFrom'], filters['dateTo'],
+    )
+    # 제너레이터 → 임시 파일로 스트리밍 기록 (크기를 확인한 뒤에만 버튼으로 넘깁니다)
+    with tempfile.TemporaryFile() as export_file:
+        with st.spinner("리포트를 내보내는 중..."):
+            count = exporter.export_reports(reports, export_format, export_file)
+        size_mb = export_file.tell() / (1024 * 1024)
+        if size_mb > EXPORT_MAX_IN_APP_MB:
+            st.error(
+                f"내보낸 파일({size_mb:.1f}MB)이 이 화면에서 내려받을 수 있는 크기({EXPORT_MAX_IN_APP_MB}MB)를 넘습니다. "
+                "조건을 좁히거나 API 서버, 명령줄 도구(exporter.py)를 이용해 주세요."
+            )
+            return
+        export_file.seek(0)
+        data = export_file.read()
+    mime_type, extension = exporter.EXPORT_FORMATS[export_format]
+    st.success(f"{count}건의 리포트를 내보냈습니다. ({size_mb:.1f}MB)")
+    st.download_button(
+        "⬇️ 파일 내려받기",
+        data=data,
+        file_name=f"jobs_reports_{date.today().strftime('%Y%m%d')}.{extension}",
+        mime=mime_type,
+        key="export_download",
+    )
+
+@PROFILER.instrument('render.export_reports')
+def render_export_reports_page():
+    """관리자가 학교/반/체험 일자 범위로 전체 학생의 리포트를 내려받는 페이지를 렌더링합니다."""
+    if not st.session_state.user_data or not st.session_state.user_data.get('isAdmin', False):
+        st.error("접근 권한이 없습니다.")
+        navigate(PAGE_HOME)
+        return
+
+    st.title("리포트 내보내기 (관리자 전용) 📤")
+    api_client = get_api_client()
+    if api_client is not None:
+        st.info("API 서버가 저장소에서 리포트를 조금씩 읽어 바로 내려보내므로, 리포트 수가 많아도 서버 메모리에 파일을 만들지 않습니다.")
+    else:
+        st.info(
+            f"내려받기 파일은 세션이 끝날 때까지 이 서버의 메모리에 보관되므로 {EXPORT_MAX_IN_APP_MB}MB까지만 내려받을 수 있습니다. "
+            "더 큰 파일은 API 서버(JOBSTRAVELING_API_URL)나 명령줄 도구(exporter.py)를 이용해 주세요."
+        )
+
+    with st.form("export_reports_form"):
+        col_school, col_class = st.columns(2)
+        with col_school:
+            school_name = st.text_input("학교 이름 (비우면 전체)", key="export_school").strip()
+        with col_class:
+            class_number = st.text_input("반 번호 (비우면 전체)", key="export_class").strip()
+        col_from, col_to = st.columns(2)
+        with col_from:
+            date_from = st.date_input("체험 일자 시작", value=None, key="export_date_from", format="YYYY.MM.DD")
+        with col_to:
+            date_to = st.date_input("체험 일자 끝", value=None, key="export_date_to", format="YYYY.MM.DD")
+        export_format = st.selectbox("파일 형식", exporter.available_formats(), key="export_format")
+        submitted = st.form_submit_button("내보내기 파일 만들기")
+
+    if submitted:
+        if school_name and class_number:
+            # (schoolName, classNumber) 인덱스로 반 명단을 조회합니다.
+            roster = get_user_registry().list_class(school_name, class_number)
+            with st.expander(f"{school_name} {class_number}반 가입 학생 명단 ({len(roster)}명)"):
+                st.dataframe(
+                    [{'이름': account.get('studentName'), '이메일': account.get('email')} for account in roster],
+                    use_container_width=True, hide_index=True,
+                )
+
+        filters = {
+            'schoolName': school_name or None,
+            'classNumber': class_number or None,
+            'dateFrom': date_from.strftime("%Y-%m-%d") if date_from else None,
+            'dateTo': date_to.strftime("%Y-%m-%d") if date_to else None,
+        }
+        if api_client is not None:
+            render_api_export_link(api_client, export_format, filters)
+        else:
+            render_in_app_export(export_format, filters)
+
+    st.markdown("---")
+    if st.button("메인 화면으로 돌아가기", key="back_to_home_from_export"):
+        navigate(PAGE_HOME)
@@ -0,0 +1,89 @@
+import streamlit as st
+import html
+
+from profiler import PROFILER
+from validation import UNSPECIFIED_JOB_FIELD
+from runtime import (
+    PAGE_ADD_REPORT, PAGE_VIEW_REPORTS, PAGE_PROGRAM_LIST, PAGE_ADD_PROGRAM,
+    PAGE_BULK_IMPORT, PAGE_EXPORT_REPORTS, PAGE_ANALYTICS, PAGE_DIAGNOSTICS,
+    navigate, perform_logout, get_current_user_id, get_report_store,
+    load_html_template, render_html_template, render_html_component,
+)
+
+# --- 홈 페이지 ---
+
+@PROFILER.instrument('render.home')
+def render_home_page():
+    """홈 화면을 렌더링합니다. (HTML 컴포넌트 사용)"""
+    user_info = st.session_state.user_data
+    user_name = user_info.get('studentName', '사용자')
+    is_admin = user_info.get('isAdmin', False)
+    admin_status = "✅ 관리자" if is_admin else "👤 일반 사용자"
+
+    # 1. 제목과 '잡스리포트 기록하기', '나의 기록 보기', '프로그램 목록 보기' 버튼을 나란히 배치 (수정된 부분)
+    col_title, col_button_add, col_button_view, col_button_list = st.columns([2.5, 1, 1, 1])
+
+    with col_title:
+        st.title("🗺️ Job-Trekking 홈 💼")
+    
+    # 버튼을 제목 옆에 세로 중앙에 배치하기 위한 마크다운 공백
+    st.markdown("<div style='height: 25px;'></div>", unsafe_allow_html=True) 
+
+    with col_button_add:
+        if st.button("📝 리포트 기록하기", key="navigate_to_report_from_home"):
+            navigate(PAGE_ADD_REPORT) 
+
+    with col_button_view: 
+        if st.button("📖 나의 기록 보기", key="navigate_to_view_reports_from_home"):
+            navigate(PAGE_VIEW_REPORTS) # 나의 기록 보기 페이지로 이동
+
+    with col_button_list: 
+        if st.button("🔎 프로그램 목록", key="navigate_to_program_list_from_home"):
+            navigate(PAGE_PROGRAM_LIST) # 프로그램 목록 보기 페이지로 이동
+
+    st.write(f"환영합니다, **{user_name}**님! 현재 권한: **{admin_status}**")
+    
+    # 관리자 기능 버튼 추가
+    if is_admin:
+        if st.button("새 프로그램 추가 (관리자 전용)", key="add_program_btn"):
+            navigate(PAGE_ADD_PROGRAM)
+        if st.button("📦 대량 가져오기 (관리자 전용)", key="bulk_import_btn"):
+            navigate(PAGE_BULK_IMPORT)
+        if st.button("📤 리포트 내보내기 (관리자 전용)", key="export_reports_btn"):
+            navigate(PAGE_EXPORT_REPORTS)
+        if st.button("📈 통계 대시보드 (관리자 전용)", key="analytics_btn"):
+            navigate(PAGE_ANALYTICS)
+        if st.button("⏱️ 성능 진단 (관리자 전용)", key="diagnostics_btn"):
+            navigate(PAGE_DIAGNOSTICS)
+
+    # home.html 템플릿 로드 (프로세스 단위로 캐시됨)
+    home_template = load_html_template('home.html')
+    
+    if home_template:
+        # 활동 요약은 저장 시 증분 갱신된 집계값을 읽기만 하므로 기록 수와 관계없이 일정한 시간에 렌더링됩니다.
+        summary = get_report_store().get_summary(get_current_user_id())
+        job_field_counts = sorted(summary['jobFieldCounts'].items(), key=lambda item: item[1], reverse=True)
+
+        # 사용자 이름 등 동적 데이터를 HTML에 한 번에 주입
+        html_content = render_html_template(
+            home_template, 'home.html',
+            USER_NAME=html.escape(user_name),
+            USER_SCHOOL=html.escape(user_info.get('schoolName', '학교 정보 없음')),
+            USER_CLASS=html.escape(user_info.get('classNumber', '반 정보 없음')),
+            USER_IS_ADMIN=admin_status,
+            REPORT_COUNT=summary['reportCount'],
+            LAST_REPORT_DATE=summary['lastReportDate'] or '없음',
+            AVERAGE_RATING=f"★ {summary['averageRating']:.1f}" if summary['averageRating'] is not None else '없음',
+            JOB_FIELD_COUNTS=html.escape(', '.join(f"{field or UNSPECIFIED_JOB_FIELD} {count}건" for field, count in job_field_counts)) or '없음',
+        )
+        
+        render_html_component(
+            'home.html',
+            html_content,
+            height=700,
+            scrolling=True,
+        )
+    
+    st.markdown("---")
+    if st.button("로그아웃", key="logout_btn"):
+        perform_logout()
@@ -0,0 +1,85 @@
+import streamlit as st
+
+from profiler import PROFILER
+from users import DEMO_ADMIN_ACCOUNT, DEMO_USER_ACCOUNT
+from runtime import (
+    PAGE_SIGNUP, DEMO_ADMIN_PASSWORD, DEMO_USER_PASSWORD,
+    navigate, perform_login, perform_mock_login,
+)
+
+# --- 로그인 페이지 ---
+
+@PROFILER.instrument('render.login')
+def render_login_page():
+    """요청에 따라 두 개의 버튼을 사용하는 로그인 페이지를 렌더링합니다."""
+    
+    st.markdown(
+        """
+        <style>
+            /* 버튼 중앙 정렬 및 디자인 */
+            .stButton>button {
+                display: block;
+                margin-left: auto;
+                margin-right: auto;
+                font-size: 1.2rem;
+                padding: 15px 30px;
+                border-radius: 12px;
+                font-weight: bold;
+                transition: all 0.2s;
+            }
+            .stButton:first-child button {
+                background-color: #2563eb; /* Blue for Normal User */
+                color: white;
+            }
+            .stButton:nth-child(2) button {
+                background-color: #f59e0b; /* Amber for Admin */
+                color: white;
+            }
+            .stButton>button:hover {
+                filter: brightness(1.1);
+                transform: translateY(-2px);
+            }
+            .login-container {
+                max-width: 400px;
+                margin: 50px auto;
+                padding: 30px;
+                border: 1px solid #e5e7eb;
+                border-radius: 16px;
+                box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1);
+                background-color: #ffffff;
+            }
+        </style>
+        """, unsafe_allow_html=True
+    )
+    
+    # 중앙 정렬을 위한 컬럼 분할
+    col1, col2, col3 = st.columns([1, 4, 1])
+
+    with col2:
+        st.markdown('<div class="login-container">', unsafe_allow_html=True)
+        st.markdown('<h2 style="text-align: center; color: #1e40af; margin-bottom: 30px;">🗺️ Job-Trekking 로그인 💼</h2>', unsafe_allow_html=True)
+        
+        # 1. 일반 사용자 로그인 버튼
+        if st.button("🚀 일반 사용자 로그인 / 시작하기", key="mock_login_normal", use_container_width=True):
+            perform_mock_login(DEMO_USER_ACCOUNT, DEMO_USER_PASSWORD)
+            
+        st.markdown("<br>", unsafe_allow_html=True) # 공백 추가
+
+        # 2. 관리자 로그인 버튼
+        if st.button("⚙️ 관리자 로그인 (데모)", key="mock_login_admin", use_container_width=True):
+            perform_mock_login(DEMO_ADMIN_ACCOUNT, DEMO_ADMIN_PASSWORD)
+
+        st.markdown("---")
+
+        # 3. 가입한 계정으로 로그인 (이메일/비밀번호)
+        with st.form("login_form"):
+            login_email = st.text_input("이메일 주소", key="login_email")
+            login_password = st.text_input("비밀번호", type="password", key="login_password")
+            if st.form_submit_button("로그인", use_container_width=True):
+                perform_login(login_email.strip(), login_password)
+
+        # 4. 회원가입 버튼 (네이티브 기능 유지)
+        if st.button("회원가입", key="navigate_to_signup", use_container_width=True):
+            navigate(PAGE_SIGNUP)
+            
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,104 @@
+import streamlit as st
+import html
+
+from profiler import PROFILER
+from runtime import (
+    PAGE_HOME, navigate, get_program_catalog, get_search_service, get_result_cache, get_firebase_template_context,
+    load_html_template, render_html_template, render_html_component,
+)
+from result_cache import PROGRAMS_TAG
+
+# --- 프로그램 목록/검색 페이지 ---
+
+PROGRAM_PAGE_SIZE = 10
+PROGRAM_ITEM_HTML = (
+    '<li style="padding: 15px; border: 1px solid #ddd; border-radius: 8px; margin-bottom: 10px; background-color: #f9f9f9;">'
+    '<strong style="color: #333;">{name}</strong> ({field}) - {date} · {location}'
+    '<p style="margin: 5px 0 0; color: #6b7280; font-size: 0.9rem;">{description}</p></li>'
+)
+
+def render_program_items(programs):
+    """한 페이지 분량의 프로그램만 HTML 목록 항목으로 직렬화합니다."""
+    if not programs:
+        return '<li style="padding: 15px; color: #6b7280;">조건에 맞는 프로그램이 없습니다.</li>'
+    return ''.join(
+        PROGRAM_ITEM_HTML.format(**{key: html.escape(str(program.get(key, ''))) for key in ('name', 'field', 'date', 'location', 'description')})
+        for program in programs
+    )
+
+def load_program_page(catalog, search_query, filters, cursor):
+    """필터/검색어에 맞는 프로그램 한 페이지를 조회합니다. 반환값: (programs, next_cursor)"""
+    if search_query:
+        # 검색 결과는 점수 순이므로 필터만 적용하고 상위 결과 한 페이지를 표시합니다.
+        programs = []
+        for program_id in get_search_service().search_programs(search_query, limit=PROGRAM_PAGE_SIZE * 5):
+            program = catalog.get_program(program_id)
+            if program and all(value is None or program.get(key) == value for key, value in zip(('field', 'location'), filters)):
+                programs.append(program)
+                if len(programs) == PROGRAM_PAGE_SIZE:
+                    break
+        return programs, None
+    return catalog.query(field=filters[0], location=filters[1], after=cursor, limit=PROGRAM_PAGE_SIZE)
+
+@PROFILER.instrument('render.program_list')
+def render_program_list_page():
+    """프로그램 카탈로그에서 필터 조건에 맞는 프로그램을 페이지 단위로 조회해 표시합니다."""
+    st.title("진로 프로그램 검색 결과 🔎")
+
+    catalog = get_program_catalog()
+
+    # 프로그램명/설명 검색어 (입력 시 검색 점수 순으로 표시)
+    search_query = st.text_input("🔍 프로그램 검색", key="program_search_query", placeholder="예: 인공지능, 건축").strip()
+
+    # 필터 선택 (분야 / 장소)
+    col_field, col_location = st.columns(2)
+    with col_field:
+        field = st.selectbox("분야", ["전체"] + catalog.fields(), key="program_filter_field")
+    with col_location:
+        location = st.selectbox("장소", ["전체"] + catalog.locations(), key="program_filter_location")
+    filters = (None if field == "전체" else field, None if location == "전체" else location)
+
+    # 키셋 페이지네이션: 지나온 페이지의 커서를 스택으로 보관합니다. (필터가 바뀌면 첫 페이지로)
+    if st.session_state.get('program_list_filters') != filters:
+        st.session_state.program_list_filters = filters
+        st.session_state.program_list_cursors = [None]
+    cursors = st.session_state.program_list_cursors
+
+    # (페이지, 검색어, 필터, 커서) 키로 결과 캐시를 거칩니다. 프로그램이 추가되면 태그로 무효화됩니다.
+    programs, next_cursor = get_result_cache().get_or_compute(
+        ('program_list', search_query, filters, cursors[-1]),
+        lambda: load_program_page(catalog, search_query, filters, cursors[-1]),
+        tags=(PROGRAMS_TAG,),
+    )
+
+    program_list_template = load_html_template('program_list.html')
+    
+    if program_list_template:
+        # Streamlit 컴포넌트 내에서 사용할 Firebase 설정 변수 주입 (현재 Mock이므로 기능하지 않음)
+        program_list_html = render_html_template(
+            program_list_template, 'program_list.html',
+            get_firebase_template_context(),
+            PROGRAM_PAGE_INFO=f"{len(cursors)} 페이지 · 이 페이지 {len(programs)}건",
+            PROGRAM_LIST_ITEMS=render_program_items(programs),
+        )
+        
+        render_html_component(
+            'program_list.html',
+            program_list_html,
+            height=800,
+            scrolling=True,
+        )
+
+    col_prev, col_next = st.columns(2)
+    with col_prev:
+        if len(cursors) > 1 and st.button("◀ 이전 페이지", key="program_list_prev"):
+            cursors.pop()
+            st.rerun()
+    with col_next:
+        if next_cursor and st.button("다음 페이지 ▶", key="program_list_next"):
+            cursors.append(next_cursor)
+            st.rerun()
+
+    st.markdown("---")
+    if st.button("메인 화면으로 돌아가기", key="back_to_home_from_list"):
+        navigate(PAGE_HOME)
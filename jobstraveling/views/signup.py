@@ -0,0 +1,69 @@
+import streamlit as st
+from datetime import date
+
+from profiler import PROFILER
+from auth import hash_password
+from users import DuplicateUserError
+from runtime import PAGE_LOGIN, navigate, get_user_registry
+
+# --- 회원가입 페이지 ---
+
+@PROFILER.instrument('render.signup')
+def render_signup_page():
+    """회원가입 페이지를 Streamlit 네이티브 폼으로 렌더링합니다."""
+    st.title("회원가입")
+
+    today = date.today()
+    min_date = date(2007, 1, 1)
+    default_birth_date = min_date
+
+    with st.form("signup_form"):
+        st.write("사용자 정보를 입력해주세요. (가입 시 일반 사용자 권한이 부여됩니다)")
+        
+        email = st.text_input("이메일 주소", key="signup_email")
+        password = st.text_input("비밀번호 (6자 이상)", type="password", key="signup_password")
+        st.markdown("---")
+        school_name = st.text_input("학교 이름", key="signup_school")
+        class_number = st.text_input("반 번호", key="signup_class")
+        student_name = st.text_input("이름", key="signup_name")
+        
+        birth_date = st.date_input(
+            "생년월일", 
+            value=default_birth_date,
+            min_value=min_date,
+            max_value=today,
+            key="signup_birth",
+            format="YYYY.MM.DD"
+        )
+        
+        submitted = st.form_submit_button("회원가입 완료")
+
+        if submitted:
+            if not all([email, password, school_name, class_number, student_name, birth_date]):
+                st.error("모든 필드를 입력해 주세요.")
+            elif len(password) < 6:
+                st.error("비밀번호는 6자 이상이어야 합니다.")
+            elif birth_date < min_date or birth_date > today:
+                st.error("생년월일은 2007년 1월 1일부터 오늘 날짜까지만 선택 가능합니다.")
+            else:
+                # 공유 계정 저장소에 저장 (비밀번호는 해시만 저장하며, 이 정보로 로그인할 수 있게 됩니다)
+                try:
+                    get_user_registry().register({
+                        'email': email.strip(),
+                        'passwordHash': hash_password(password), 
+                        'schoolName': school_name.strip(),
+                        'classNumber': class_number.strip(),
+                        'studentName': student_name.strip(),
+                        'birthDate': birth_date.strftime("%Y-%m-%d"),
+                        'isAdmin': False # 일반 사용자
+                    })
+                except DuplicateUserError:
+                    st.error("이미 가입된 이메일 주소입니다. 로그인 화면에서 로그인해 주세요.")
+                else:
+                    st.success(f"{student_name}님, 회원가입이 완료되었습니다! 이제 이 정보로 로그인해 주세요.")
+                    
+                    navigate(PAGE_LOGIN)
+
+    st.markdown("---")
+    if st.button("로그인 화면으로 돌아가기", key="back_to_login_btn"):
+        navigate(PAGE_LOGIN)
@@ -0,0 +1,144 @@
+import streamlit as st
+
+from profiler import PROFILER
+from runtime import PAGE_HOME, navigate, get_current_user_id, get_report_store, get_search_service, get_result_cache
+from result_cache import reports_tag
+
+# --- 나의 기록 보기 페이지 ---
+
+REPORT_PAGE_SIZE = 20
+
+def format_report_title(report):
+    """리포트 선택 목록에 표시할 제목."""
+    return f"{report['experienceDate']} - {report['programName']}"
+
+def load_report_list(store, user_id, search_query, cursor):
+    """
+    목록 한 페이지를 조회합니다. 반환값: (total_count, headers, next_cursor, matched_count)
+    검색어가 없으면 최신순(ID 역순) 헤더(본문 제외)를, 있으면 검색 점수 순 결과 안의 위치(cursor)부터 한 페이지를 읽습니다.
+    """
+    if not search_query:
+        total_count, headers, next_cursor = store.load_report_page(user_id, before=cursor, limit=REPORT_PAGE_SIZE)
+        return total_count, headers, next_cursor, None
+
+    total_count = store.count_reports(user_id)
+    if not total_count:
+        return 0, [], None, 0
+    # 다른 서버 프로세스가 저장한 리포트가 있으면(색인 수 < 리포트 수) 색인을 다시 만듭니다.
+    matched_ids = get_search_service().search_reports(
+        user_id, search_query, lambda: store.list_reports(user_id), expected_count=total_count
+    )
+    offset = cursor or 0
+    headers = store.get_reports(matched_ids[offset:offset + REPORT_PAGE_SIZE], user_id)
+    next_cursor = offset + REPORT_PAGE_SIZE if len(matched_ids) > offset + REPORT_PAGE_SIZE else None
+    return total_count, headers, next_cursor, len(matched_ids)
+
+@PROFILER.instrument('render.view_reports')
+def render_view_reports_page():
+    """
+    사용자가 기록한 잡스리포트 목록을 보고 상세 내용을 확인하는 페이지를 렌더링합니다.
+    목록은 현재 페이지(REPORT_PAGE_SIZE건)의 헤더만 읽고, 소감 본문은 선택된 리포트 하나만 ID로 조회합니다.
+    """
+    st.title("나의 진로 체험 기록 📖")
+    st.info("이 페이지에서는 지금까지 작성한 잡스리포트 목록을 볼 수 있습니다. (개인 기록)")
+    
+    user_id = get_current_user_id()
+    if not user_id:
+        st.error("사용자 인증 정보를 찾을 수 없습니다. 로그인 상태를 확인해 주세요.")
+        return
+
+    store = get_report_store()
+
+    # 검색어는 이전 rerun에서 위젯이 남긴 값으로 먼저 정해 두고, 리포트 수와 현재 페이지 목록을 함께 읽습니다.
+    # (Firestore 백엔드는 두 조회를 동시에 요청합니다)
+    search_query = st.session_state.get('report_search_query', '').strip()
+
+    # 키셋 페이지네이션: 지나온 페이지의 커서를 스택으로 보관합니다. (사용자나 검색어가 바뀌면 첫 페이지로)
+    if st.session_state.get('report_list_query') != (user_id, search_query):
+        st.session_state.report_list_query = (user_id, search_query)
+        st.session_state.report_list_cursors = [None]
+    cursors = st.session_state.report_list_cursors
+
+    # (페이지, 사용자, 검색어, 커서) 키로 결과 캐시를 거칩니다. 이 사용자의 리포트가 저장되면 태그로 무효화됩니다.
+    total_count, headers, next_cursor, matched_count = get_result_cache().get_or_compute(
+        ('view_reports', user_id, search_query, cursors[-1]),
+        lambda: load_report_list(store, user_id, search_query, cursors[-1]),
+        tags=(reports_tag(user_id),),
+    )
+    
+    if not total_count:
+        st.markdown("""
+            <div style="text-align: center; color: #6b7280; padding: 40px; border: 2px dashed #d1d5db; border-radius: 12px; margin-top: 20px;">
+                <svg xmlns="http://www.w3.org/2000/svg" class="mx-auto h-12 w-12 text-gray-400" fill="none" viewBox="0 0 24 24" stroke="currentColor" style="display: block; margin: 0 auto 10px auto; width: 48px; height: 48px;"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 12h6m-6 4h6m2 5H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z"/></svg>
+                <h3 style="font-size: 1.25rem; font-weight: 600; color: #1f2937;">작성된 리포트가 없습니다</h3>
+                <p style="margin-top: 5px; font-size: 0.875rem;">지금 바로 잡스리포트를 작성해 보세요!</p>
+            </div>
+        """, unsafe_allow_html=True)
+        
+    else:
+        st.sidebar.header("리포트 목록")
+        st.sidebar.markdown(f"총 **{total_count}**건의 기록이 있습니다.")
+
+        # 프로그램명/소감 내용 검색 (입력 시 검색 점수 순으로 목록을 대체)
+        st.sidebar.text_input("🔍 리포트 검색", key="report_search_query")
+
+        if matched_count is not None:
+            st.sidebar.markdown(f"검색 결과 **{matched_count}**건")
+
+        col_prev, col_next = st.sidebar.columns(2)
+        with col_prev:
+            if len(cursors) > 1 and st.button("◀ 이전", key="report_list_prev"):
+                cursors.pop()
+                st.rerun()
+        with col_next:
+            if next_cursor is not None and st.button("다음 ▶", key="report_list_next"):
+                cursors.append(next_cursor)
+                st.rerun()
+        
+        # 선택 목록이 비어있지 않은 경우에만 selectbox 표시
+        if headers:
+            # 제목이 아니라 리포트 ID로 선택하므로 같은 제목의 리포트가 있어도 구분되고, 페이지를 넘겨도 선택이 유지됩니다.
+            report_titles = {report['id']: format_report_title(report) for report in headers}
+            report_ids = list(report_titles)
+            previous_id = st.session_state.get('selected_report_id')
+            selected_report_id = st.sidebar.selectbox(
+                f"리포트 선택 ({len(cursors)} 페이지)", report_ids,
+                index=report_ids.index(previous_id) if previous_id in report_titles else 0,
+                format_func=report_titles.get,
+            )
+            st.session_state.selected_report_id = selected_report_id
+
+            # 선택된 리포트 하나만 본문까지 읽습니다. (ID 조회 O(1))
+            selected_report = store.get_report(selected_report_id, user_id)
+            if selected_report is None:
+                selected_report = next(report for report in headers if report['id'] == selected_report_id)
+
+            # 5. 별점 렌더링 함수
+            def get_rating_stars(rating):
+                return "<span style='color: #fbbf24;'>★</span>" * rating + "<span style='color: #ccc;'>☆</span>" * (5 - rating)
+
+            # 상세 리포트 뷰 (선택된 리포트 표시)
+            st.markdown("---")
+            st.subheader(f"선택된 리포트: {selected_report['programName']}")
+            
+            col_date, col_field = st.columns(2)
+            with col_date:
+                st.markdown(f"**체험 일자:** `{selected_report['experienceDate']}`")
+            with col_field:
+                st.markdown(f"**분야:** `{selected_report['jobField']}`")
+
+            st.markdown("---")
+            st.markdown("### 체험 만족도")
+            # 별점은 1~5 사이의 정수여야 함
+            rating = selected_report.get('rating', 0)
+            rating = max(0, min(5, rating))
+            st.markdown(f"<p style='font-size: 2rem;'>{get_rating_stars(rating)}</p>", unsafe_allow_html=True)
+            
+            st.markdown("### 소감 및 내용")
+            st.markdown(f'<div style="background-color: #f7f7f7; padding: 15px; border-radius: 8px; white-space: pre-wrap; border-left: 5px solid #10b981;">{selected_report.get("reportContent", "")}</div>', unsafe_allow_html=True)
+        else:
+             st.info("선택할 수 있는 리포트가 없습니다.")
+
+    st.markdown("---")
+    if st.button("메인 화면으로 돌아가기", key="back_to_home_from_view_reports"):
+        navigate(PAGE_HOME)
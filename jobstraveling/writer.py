@@ -0,0 +1,186 @@
+import os
+import time
+import queue
+import atexit
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+
+from validation import validate_report
+
+# --- 리포트 쓰기 대기열 (Write-behind Queue) ---
+# 여러 세션의 리포트 저장 요청을 백그라운드 스레드 하나가 모아서 배치 트랜잭션(add_reports)으로 기록합니다.
+# 저장 요청은 Future를 받아 커밋이 끝날 때까지 기다리므로(최대 flush 주기 + 쓰기 시간),
+# 응답은 항상 디스크에 기록된 뒤에 나가며, 수업 종료 직전처럼 저장이 몰려도 트랜잭션 수는 늘지 않습니다.
+# 배치 트랜잭션이 실패하면(롤백) 같은 배치의 요청을 한 건씩 다시 기록하여, 문제가 된 요청만 실패로 응답합니다.
+#
+# 환경 변수:
+# - JOBSTRAVELING_WRITE_FLUSH_MS: 첫 요청 후 다른 요청을 더 모으는 최대 시간 (기본 20ms)
+# - JOBSTRAVELING_WRITE_QUEUE_SIZE: 대기열 최대 길이 (기본 1000, 가득 차면 저장 요청이 거절됨)
+# - JOBSTRAVELING_WRITE_BATCH_SIZE: 트랜잭션 하나에 담을 최대 리포트 수 (기본 200)
+
+DEFAULT_FLUSH_SECONDS = int(os.environ.get('JOBSTRAVELING_WRITE_FLUSH_MS', '20')) / 1000
+DEFAULT_QUEUE_SIZE = int(os.environ.get('JOBSTRAVELING_WRITE_QUEUE_SIZE', '1000'))
+DEFAULT_BATCH_SIZE = int(os.environ.get('JOBSTRAVELING_WRITE_BATCH_SIZE', '200'))
+ENQUEUE_TIMEOUT_SECONDS = 2.0
+LATENCY_WINDOW = 1000  # 지연 시간 백분위수 계산에 사용할 최근 저장 건수
+
+_STOP = object()
+
+
+class WriteRejectedError(RuntimeError):
+    """대기열이 가득 찼거나 제한 시간 안에 커밋 확인을 받지 못했을 때 발생합니다."""
+
+
+class WriteFailedError(RuntimeError):
+    """저장소 쓰기가 실패(롤백)하여 리포트가 저장되지 않았을 때 발생합니다. (원래 예외는 __cause__)"""
+
+
+class InvalidReportError(ValueError):
+    """검사를 통과하지 못한 리포트를 대기열에 넣으려 할 때 발생합니다."""
+
+
+class ReportWriteQueue:
+    """리포트 저장 요청을 모아 배치로 기록하는 백그라운드 작성기."""
+
+    def __init__(self, save_batch, on_saved=None, flush_seconds=DEFAULT_FLUSH_SECONDS,
+                 queue_size=DEFAULT_QUEUE_SIZE, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        save_batch([(user_id, report), ...]) -> 저장된 리포트 목록 (한 번의 트랜잭션, 실패 시 아무것도 저장되지 않아야 함)
+        on_saved(user_id, saved_report): 커밋 후 후처리 (검색 색인 갱신 등)
+        """
+        self._save_batch = save_batch
+        self._on_saved = on_saved
+        self.flush_seconds = flush_seconds
+        self.batch_size = batch_size
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stats_lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._batches = 0
+        self._written = 0
+        self._failed = 0
+        self._thread = threading.Thread(target=self._run, name='report-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, user_id, report):
+        """
+        저장 요청을 대기열에 넣고 Future를 반환합니다. future.result()는 커밋된 리포트를 돌려줍니다.
+        대기열이 ENQUEUE_TIMEOUT_SECONDS 동안 가득 차 있으면 queue.Full이 발생합니다.
+        검사(validate_report)를 통과하지 못한 리포트는 대기열에 넣지 않고 InvalidReportError를 발생시킵니다.
+        """
+        error_message = validate_report(report)
+        if error_message:
+            raise InvalidReportError(error_message)
+        future = Future()
+        self._queue.put((user_id, report, future, time.perf_counter()), timeout=ENQUEUE_TIMEOUT_SECONDS)
+        return future
+
+    def save(self, user_id, report, timeout=None):
+        """
+        저장 요청 후 커밋될 때까지 기다립니다.
+        대기열이 가득 찼거나 timeout 안에 커밋되지 않으면 WriteRejectedError가 발생합니다.
+        (제한 시간이 지난 요청도 대기열에 남아 있으면 이후에 기록됩니다.)
+        저장소 쓰기 자체가 실패하면(sqlite3.OperationalError, Firestore 오류 등) WriteFailedError가 발생합니다.
+        """
+        try:
+            future = self.submit(user_id, report)
+        except queue.Full:
+            raise WriteRejectedError("저장 대기열이 가득 찼습니다.")
+        try:
+            return future.result(timeout)
+        except FuturesTimeoutError:
+            raise WriteRejectedError("저장 확인 시간이 초과되었습니다.")
+        except Exception as e:
+            raise WriteFailedError(f"저장소에 기록하지 못했습니다. ({type(e).__name__})") from e
+
+    def _collect_batch(self):
+        first = self._queue.get()
+        if first is _STOP:
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.flush_seconds
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)  # 현재 배치를 기록한 뒤 종료합니다.
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            if batch is None:
+                return
+            try:
+                saved_reports = self._save_batch([(user_id, report) for user_id, report, _, _ in batch])
+            except Exception as e:
+                if len(batch) == 1:
+                    self._fail(batch[0], e)
+                else:
+                    # 배치 전체가 롤백되었으므로 한 건씩 다시 기록해 실패 원인이 된 요청만 골라냅니다.
+                    self._retry_one_by_one(batch)
+                continue
+            self._complete(batch, saved_reports)
+
+    def _retry_one_by_one(self, batch):
+        for item in batch:
+            try:
+                saved_reports = self._save_batch([(item[0], item[1])])
+            except Exception as e:
+                self._fail(item, e)
+            else:
+                self._complete([item], saved_reports)
+
+    def _fail(self, item, error):
+        with self._stats_lock:
+            self._failed += 1
+        item[2].set_exception(error)
+
+    def _complete(self, batch, saved_reports):
+        finished = time.perf_counter()
+        with self._stats_lock:
+            self._batches += 1
+            self._written += len(batch)
+            self._latencies.extend(finished - enqueued for _, _, _, enqueued in batch)
+        for (user_id, _, future, _), saved_report in zip(batch, saved_reports):
+            if self._on_saved:
+                try:
+                    self._on_saved(user_id, saved_report)
+                except Exception:
+                    pass  # 후처리 실패가 이미 커밋된 저장의 응답을 막지 않도록 합니다.
+            future.set_result(saved_report)
+
+    def close(self, timeout=5.0):
+        """대기 중인 요청을 모두 기록한 뒤 작성기 스레드를 종료합니다."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def metrics(self):
+        """대기열 길이, 배치/저장 건수, 평균 배치 크기, 요청→커밋 지연 시간(ms) 백분위수."""
+        with self._stats_lock:
+            latencies = sorted(self._latencies)
+            batches, written, failed = self._batches, self._written, self._failed
+
+        def percentile(quantile):
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(round(quantile * (len(latencies) - 1))))] * 1000, 3)
+
+        return {
+            'queue_depth': self._queue.qsize(),
+            'batches': batches,
+            'written': written,
+            'failed': failed,
+            'avg_batch_size': round(written / batches, 2) if batches else 0.0,
+            'latency_p50_ms': percentile(0.5),
+            'latency_p99_ms': percentile(0.99),
+        }
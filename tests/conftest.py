@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 앱 모듈은 jobstraveling/ 폴더 기준으로 import합니다. (streamlit run jobstraveling/app.py와 같은 방식)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'jobstraveling'))
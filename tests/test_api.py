@@ -0,0 +1,69 @@
+import io
+import csv
+
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('httpx')
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import api  # noqa: E402
+from auth import public_profile  # noqa: E402
+from users import DEMO_USER_ACCOUNT, DEMO_ADMIN_ACCOUNT  # noqa: E402
+
+
+@pytest.fixture
+def client(monkeypatch):
+    services = api.ApiServices(storage_backend='memory', token_secret='test-secret')
+    monkeypatch.setattr(api, 'get_services', lambda: services)
+    client = TestClient(api.create_app())
+    token = services.tokens.issue(public_profile(services.users.get(DEMO_USER_ACCOUNT['email'])))
+    client.headers['Authorization'] = f"Bearer {token}"
+    yield client
+    services.writer.close()
+
+
+def _report(**overrides):
+    report = {'programName': '체험', 'experienceDate': '2025-01-10', 'jobField': 'IT', 'rating': 4, 'reportContent': '내용'}
+    report.update(overrides)
+    return report
+
+
+@pytest.mark.parametrize('overrides', [
+    {'rating': '5'},
+    {'rating': 9},
+    {'rating': True},
+    {'reportContent': ['내용']},
+    {'reportContent': '가' * 5001},
+    {'isAdmin': True},
+])
+def test_save_report_rejects_bad_input_with_422(client, overrides):
+    response = client.post('/api/reports', json=_report(**overrides))
+    assert response.status_code == 422
+    assert client.get('/api/reports').json()['count'] == 0
+
+
+def test_save_report_accepts_valid_report(client):
+    response = client.post('/api/reports', json=_report())
+    assert response.status_code == 201
+    assert response.json()['report']['rating'] == 4
+
+
+def test_admin_export_streams_csv_through_short_lived_ticket(client):
+    client.post('/api/reports', json=_report())
+    services = api.get_services()
+    client.headers['Authorization'] = f"Bearer {services.tokens.issue(public_profile(services.users.get(DEMO_ADMIN_ACCOUNT['email'])))}"
+    response = client.post('/api/exports/reports', json={'format': 'csv'})
+    assert response.status_code == 200
+    download = client.get(response.json()['url'])
+    assert download.status_code == 200
+    assert download.headers['content-type'].startswith('text/csv')
+    assert 'attachment' in download.headers['content-disposition']
+    rows = list(csv.DictReader(io.StringIO(download.content.decode('utf-8-sig'))))
+    assert [row['programName'] for row in rows] == ['체험']
+
+
+def test_export_requires_admin_and_valid_ticket(client):
+    assert client.post('/api/exports/reports', json={'format': 'csv'}).status_code == 403
+    assert client.get('/api/exports/reports/not-a-ticket').status_code == 404
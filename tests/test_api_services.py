@@ -0,0 +1,53 @@
+# fastapi 없이도 실행되는 API 서비스 테스트 (엔드포인트 테스트는 test_api.py, fastapi/httpx 필요)
+import threading
+
+import pytest
+
+import api
+from auth import load_token_secret, public_profile
+from users import DEMO_USER_ACCOUNT
+
+
+@pytest.fixture
+def secret_file(tmp_path, monkeypatch):
+    monkeypatch.delenv('JOBSTRAVELING_TOKEN_SECRET', raising=False)
+    path = tmp_path / 'data' / 'api_token_secret'
+    monkeypatch.setenv('JOBSTRAVELING_TOKEN_SECRET_FILE', str(path))
+    return path
+
+
+def test_environment_secret_wins(secret_file, monkeypatch):
+    monkeypatch.setenv('JOBSTRAVELING_TOKEN_SECRET', 'from-env')
+    assert load_token_secret() == 'from-env'
+    assert not secret_file.exists()
+
+
+def test_workers_started_without_a_secret_share_one_key_file(secret_file):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(load_token_secret())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(results)) == 1
+    assert secret_file.read_text(encoding='utf-8') == results[0]
+    assert [path.name for path in secret_file.parent.iterdir()] == ['api_token_secret']
+
+
+def test_empty_secret_file_fails_with_a_clear_message(secret_file):
+    secret_file.parent.mkdir()
+    secret_file.write_text('', encoding='utf-8')
+    with pytest.raises(RuntimeError, match='JOBSTRAVELING_TOKEN_SECRET'):
+        load_token_secret()
+
+
+def test_services_in_separate_workers_accept_each_others_tokens(secret_file):
+    first = api.ApiServices(storage_backend='memory')
+    second = api.ApiServices(storage_backend='memory')
+    try:
+        token = first.tokens.issue(public_profile(first.users.get(DEMO_USER_ACCOUNT['email'])))
+        assert second.tokens.resolve(token)['email'] == DEMO_USER_ACCOUNT['email']
+        assert second.export_tickets.resolve(token) is None  # 로그인 토큰은 내보내기 티켓으로 쓸 수 없습니다.
+    finally:
+        first.writer.close()
+        second.writer.close()
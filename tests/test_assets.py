@@ -0,0 +1,40 @@
+import assets
+import templates
+
+
+TAILWIND_CSS = '.p-4{padding:1rem}.text-blue-800{color:#1e40af}@media (min-width:768px){.md\\:flex{display:flex}}'
+
+
+def test_purge_keeps_only_used_classes():
+    css = assets.purge_css(TAILWIND_CSS, {'p-4', 'md:flex'})
+    assert '.p-4' in css and 'md\\:flex' in css
+    assert 'text-blue-800' not in css
+
+
+def test_missing_tailwind_classes_lists_v3_only_utilities():
+    source = ('<style>.card{padding:1px}</style>'
+              '<div class="p-4 card w-[37px] {{EXTRA_CLASS}}"><span class="md:flex size-4"></span></div>')
+    assert assets.missing_tailwind_classes(source, TAILWIND_CSS) == ['size-4', 'w-[37px]']
+
+
+def test_build_only_fetches_assets_of_rendered_templates(tmp_path, monkeypatch):
+    fetched = []
+
+    def fake_fetch(url, user_agent=None):
+        fetched.append(url)
+        return f"/* {url} */".encode('utf-8')
+
+    monkeypatch.setattr(assets, '_fetch', fake_fetch)
+    manifest = assets.build(str(tmp_path), assets.HTML_DIR)
+    rendered = ''.join(source for _, source in templates.rendered_template_sources(assets.HTML_DIR))
+    assert fetched and all(url in rendered or '11.6.1' in url for url in fetched)
+    assert not any('10.12.2' in url for url in fetched)
+    assert set(manifest['tailwind']) <= set(templates.RENDERED_TEMPLATES)
+    assert (tmp_path / assets.MANIFEST_FILE).exists()
+
+
+def test_rewrite_html_points_cdn_scripts_at_static_prefix():
+    url = assets.VENDOR_SCRIPTS[0]
+    manifest = assets.AssetManifest({'files': {url: 'firebase-app.12345678.js'}}, 'https://api.example.com/static/')
+    html = manifest.rewrite_html('program_list.html', f'<script src="{url}"></script>')
+    assert html == '<script src="https://api.example.com/static/firebase-app.12345678.js"></script>'
@@ -0,0 +1,88 @@
+import pytest
+
+from catalog import ProgramCatalog
+
+
+FIELDS = ['IT', '항공', '식음료']
+LOCATIONS = ['서울', '부산', '온라인']
+
+
+def _programs():
+    # 날짜가 같은 프로그램이 여러 개 있어 (date, id) 순서와 커서 경계를 함께 확인할 수 있습니다.
+    return [
+        {'id': f"p{i:02d}", 'name': f"프로그램 {i}", 'field': FIELDS[i % 3], 'description': '',
+         'date': f"2025-03-{1 + i // 4:02d}", 'location': LOCATIONS[i % 2 if i % 5 else 2]}
+        for i in range(30)
+    ]
+
+
+def _expected(programs, field=None, location=None, date_from=None, date_to=None):
+    matches = [p for p in programs
+               if (not field or p['field'] == field) and (not location or p['location'] == location)
+               and (not date_from or p['date'] >= date_from) and (not date_to or p['date'] <= date_to)]
+    return [p['id'] for p in sorted(matches, key=lambda p: (p['date'], p['id']))]
+
+
+def _all_pages(catalog, limit, **filters):
+    ids, cursor, pages = [], None, 0
+    while True:
+        page, cursor = catalog.query(after=cursor, limit=limit, **filters)
+        assert len(page) <= limit
+        ids.extend(program['id'] for program in page)
+        pages += 1
+        if cursor is None:
+            return ids, pages
+
+
+@pytest.mark.parametrize('field, location, date_from, date_to', [
+    (None, None, None, None),
+    ('IT', None, None, None),
+    (None, '온라인', None, None),
+    ('항공', '서울', None, None),
+    (None, None, '2025-03-03', '2025-03-05'),
+    ('식음료', '부산', '2025-03-02', None),
+    ('IT', None, None, '2025-03-04'),
+    ('없는 분야', None, None, None),
+])
+@pytest.mark.parametrize('limit', [1, 3, 7, 100])
+def test_keyset_pages_cover_every_match_once_in_order(field, location, date_from, date_to, limit):
+    programs = _programs()
+    catalog = ProgramCatalog(programs)
+    filters = {'field': field, 'location': location, 'date_from': date_from, 'date_to': date_to}
+    ids, pages = _all_pages(catalog, limit, **filters)
+    expected = _expected(programs, **filters)
+    assert ids == expected
+    assert pages == max(1, -(-len(expected) // limit))
+
+
+def test_cursor_stays_valid_when_programs_change_between_pages():
+    programs = _programs()
+    catalog = ProgramCatalog(programs)
+    first, cursor = catalog.query(field='IT', limit=4)
+    # 커서 이전 프로그램 삭제, 커서 위치의 프로그램 삭제, 커서 이후에 새 프로그램 추가
+    catalog.remove_program(first[0]['id'])
+    catalog.remove_program(first[-1]['id'])
+    catalog.add_program({'id': 'new', 'name': '새 프로그램', 'field': 'IT', 'description': '',
+                         'date': '2025-03-09', 'location': '서울'})
+    rest, cursor = catalog.query(field='IT', after=cursor, limit=100)
+    remaining = [pid for pid in _expected(programs, field='IT') if pid not in {p['id'] for p in first}]
+    assert [program['id'] for program in rest] == remaining + ['new']
+    assert cursor is None
+
+
+def test_replacing_a_program_moves_it_between_indexes():
+    catalog = ProgramCatalog(_programs())
+    program = catalog.get_program('p00')
+    catalog.add_program({**program, 'field': '새 분야', 'date': '2026-01-01'})
+    assert 'p00' not in _all_pages(catalog, 5, field=program['field'])[0]
+    assert catalog.query(field='새 분야')[0] == [catalog.get_program('p00')]
+    assert [p['id'] for p in catalog.query(date_from='2026-01-01')[0]] == ['p00']
+    assert len(catalog) == 30
+
+
+def test_filter_choices_drop_empty_indexes():
+    catalog = ProgramCatalog(_programs()[:2])
+    assert catalog.fields() == sorted(FIELDS[:2])
+    catalog.remove_program('p01')
+    assert catalog.fields() == [FIELDS[0]]
+    assert catalog.query() == ([catalog.get_program('p00')], None)
@@ -0,0 +1,58 @@
+import io
+import csv
+import json
+
+import pytest
+
+import exporter
+
+
+def _reports(count):
+    for i in range(count):
+        yield {
+            'id': f"r{i:04d}", 'userId': 'u1', 'schoolName': '일반 고등학교', 'classNumber': '101',
+            'studentName': '학생', 'programName': f"체험 {i}", 'experienceDate': '2025-01-10',
+            'jobField': 'IT', 'rating': 4, 'reportContent': '쉼표, "따옴표"\n줄바꿈', 'createdAt': '2025-01-10T00:00:00Z',
+        }
+
+
+def _export(export_format, count):
+    output = io.BytesIO()
+    written = exporter.export_reports(_reports(count), export_format, output)
+    return written, output.getvalue()
+
+
+def test_csv_export_round_trips_with_header():
+    written, data = _export('csv', exporter.ROWS_PER_CHUNK + 3)
+    rows = list(csv.DictReader(io.StringIO(data.decode('utf-8-sig'))))
+    assert written == len(rows) == exporter.ROWS_PER_CHUNK + 3
+    assert list(rows[0]) == exporter.EXPORT_COLUMNS
+    assert rows[-1]['programName'] == f"체험 {exporter.ROWS_PER_CHUNK + 2}"
+    assert rows[0]['reportContent'] == '쉼표, "따옴표"\n줄바꿈'
+
+
+def test_jsonl_export_writes_one_object_per_line():
+    written, data = _export('jsonl', 3)
+    lines = data.decode('utf-8').splitlines()
+    assert written == len(lines) == 3
+    assert [json.loads(line)['id'] for line in lines] == ['r0000', 'r0001', 'r0002']
+
+
+def test_empty_export_still_writes_csv_header():
+    written, data = _export('csv', 0)
+    assert written == 0
+    assert next(csv.reader(io.StringIO(data.decode('utf-8-sig')))) == exporter.EXPORT_COLUMNS
+
+
+def test_parquet_export_round_trips():
+    pq = pytest.importorskip('pyarrow.parquet')
+    written, data = _export('parquet', exporter.ROWS_PER_CHUNK * 2 + 1)
+    table = pq.read_table(io.BytesIO(data))
+    assert written == table.num_rows == exporter.ROWS_PER_CHUNK * 2 + 1
+    assert table.column_names == exporter.EXPORT_COLUMNS
+    assert table.column('rating').to_pylist()[:2] == [4, 4]
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        list(exporter.iter_export(_reports(1), 'xlsx'))
@@ -0,0 +1,107 @@
+import asyncio
+import itertools
+import types
+
+import pytest
+
+import firestore_store
+from firestore_store import FirestoreReportRepository, UNSPECIFIED_JOB_FIELD
+
+
+class FakeTransform:
+    def __init__(self, value):
+        self.value = value
+
+
+class FakeDocument:
+    def __init__(self, path):
+        self.path = path
+
+    def collection(self, name):
+        return FakeCollection(f"{self.path}/{name}")
+
+
+class FakeCollection:
+    def __init__(self, path):
+        self.path = path
+
+    def document(self, name):
+        return FakeDocument(f"{self.path}/{name}")
+
+
+class FakeBatch:
+    def __init__(self, writes):
+        self.writes = writes
+
+    def set(self, document, data, merge=False):
+        self.writes.append((document.path, data))
+
+    async def commit(self):
+        pass
+
+
+class FakeClient:
+    def __init__(self):
+        self.writes = []
+
+    def collection(self, name):
+        return FakeCollection(name)
+
+    def batch(self):
+        return FakeBatch(self.writes)
+
+
+class FakePool:
+    def __init__(self):
+        self.fake_client = FakeClient()
+
+    def client(self):
+        return self.fake_client
+
+    def run(self, coroutine):
+        return asyncio.run(coroutine)
+
+
+def _repository(monkeypatch):
+    monkeypatch.setattr(firestore_store, 'transforms', types.SimpleNamespace(Increment=FakeTransform, Maximum=FakeTransform), raising=False)
+    pool = FakePool()
+    return FirestoreReportRepository(pool, app_id='test-app'), pool.fake_client
+
+
+def _summary_writes(client):
+    return [data for path, data in client.writes if path.endswith('/reportSummary/summary')]
+
+
+def test_empty_job_field_uses_non_empty_summary_key(monkeypatch):
+    repository, client = _repository(monkeypatch)
+    report = {'programName': '체험', 'experienceDate': '2025-01-10', 'jobField': '', 'rating': 3,
+              'reportContent': '내용', 'createdAt': '2025-01-10T09:00:00'}
+    repository.add_reports([('student@example.com', report), ('student@example.com', {**report, 'jobField': None})])
+
+    for summary in _summary_writes(client):
+        assert list(summary['jobFieldCounts']) == [UNSPECIFIED_JOB_FIELD]
+        assert all(key for key in summary['jobFieldCounts'])
+
+
+def test_version_counter_is_sharded(monkeypatch):
+    repository, client = _repository(monkeypatch)
+    # 샤드를 차례대로 고르도록 고정하여 결과가 실행마다 같게 합니다.
+    shards = itertools.count()
+    monkeypatch.setattr(firestore_store.random, 'randrange', lambda n: next(shards) % n)
+    report = {'programName': '체험', 'experienceDate': '2025-01-10', 'jobField': 'IT', 'rating': 3,
+              'reportContent': '내용', 'createdAt': '2025-01-10T09:00:00'}
+    for _ in range(20):
+        repository.add_report('student@example.com', report)
+
+    version_paths = [path for path, _ in client.writes if '/public/' in path]
+    assert version_paths and all('/public/data/reportVersionShards/' in path for path in version_paths)
+    assert len(set(version_paths)) == min(20, firestore_store.VERSION_SHARD_COUNT)
+
+
+def test_non_integer_rating_is_rejected_like_other_backends(monkeypatch):
+    repository, client = _repository(monkeypatch)
+    report = {'programName': '체험', 'experienceDate': '2025-01-10', 'jobField': 'IT', 'rating': '3',
+              'reportContent': '내용', 'createdAt': '2025-01-10T09:00:00'}
+    with pytest.raises(TypeError):
+        repository.add_report('student@example.com', report)
+    assert client.writes == []
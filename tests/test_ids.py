@@ -0,0 +1,49 @@
+import threading
+
+from ids import ULIDGenerator, CROCKFORD_BASE32, ID_LENGTH, RANDOM_BITS, new_report_id
+
+
+def _timestamp_ms(report_id):
+    value = 0
+    for char in report_id:
+        value = value * 32 + CROCKFORD_BASE32.index(char)
+    return value >> RANDOM_BITS
+
+
+def test_ids_are_monotonic_within_the_same_millisecond():
+    generator = ULIDGenerator()
+    generated = [generator.new_id(1_700_000_000_000) for _ in range(1000)]
+    assert generated == sorted(generated) and len(set(generated)) == 1000
+    assert all(len(value) == ID_LENGTH and _timestamp_ms(value) == 1_700_000_000_000 for value in generated)
+
+
+def test_past_timestamps_do_not_break_monotonic_ids():
+    generator = ULIDGenerator()
+    current = [generator.new_id(2_000) for _ in range(3)]
+    imported = generator.new_id(1_000)  # 과거 createdAt으로 가져온 리포트
+    current.append(generator.new_id(2_000))
+    assert imported < current[0]
+    assert current == sorted(current) and len(set(current)) == 4
+    assert [_timestamp_ms(value) for value in [imported] + current] == [1_000] + [2_000] * 4
+
+
+def test_concurrent_ids_do_not_collide():
+    generator = ULIDGenerator()
+    results = [[] for _ in range(8)]
+
+    def worker(out):
+        out.extend(generator.new_id() for _ in range(2000))
+
+    threads = [threading.Thread(target=worker, args=(out,)) for out in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({value for out in results for value in out}) == 8 * 2000
+    assert all(out == sorted(out) for out in results)
+
+
+def test_report_ids_follow_created_at():
+    created = ['2024-12-31T23:59:59.999', '2025-01-01T00:00:00', '2025-01-01T00:00:00.001', '2025-06-01T12:00:00']
+    generated = [new_report_id(value) for value in reversed(created)]
+    assert sorted(generated) == list(reversed(generated))
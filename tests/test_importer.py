@@ -0,0 +1,78 @@
+import io
+import json
+
+import pytest
+
+import importer
+
+
+def _row(**overrides):
+    row = {'userId': 'student@example.com', 'programName': '체험', 'experienceDate': '2025-01-10',
+           'jobField': 'IT', 'rating': '4', 'reportContent': '내용'}
+    row.update(overrides)
+    return row
+
+
+def _import_jsonl(rows, chunk_size=2):
+    batches = []
+    text = '\n'.join(row if isinstance(row, str) else json.dumps(row, ensure_ascii=False) for row in rows)
+    result = importer.import_reports(io.StringIO(text), 'jsonl', batches.append, chunk_size=chunk_size)
+    return result, [item for batch in batches for item in batch]
+
+
+def test_jsonl_numbers_are_read_as_text():
+    user_id, report = importer.parse_report_row(_row(userId=5, programName=123, classNumber=101, rating=5))
+    assert user_id == '5'
+    assert report['programName'] == '123'
+    assert report['classNumber'] == '101'
+    assert report['rating'] == 5
+
+
+@pytest.mark.parametrize('rating', ['4.0', 4.0, '4'])
+def test_integral_ratings_are_accepted(rating):
+    assert importer.parse_report_row(_row(rating=rating))[1]['rating'] == 4
+
+
+@pytest.mark.parametrize('rating', ['4.5', 4.5, 'abc', 9, True])
+def test_non_integral_or_out_of_range_ratings_are_rejected(rating):
+    with pytest.raises(ValueError):
+        importer.parse_report_row(_row(rating=rating))
+
+
+def test_created_at_must_be_iso():
+    assert importer.parse_report_row(_row(createdAt='2024-03-01T09:00:00'))[1]['createdAt'] == '2024-03-01T09:00:00'
+    with pytest.raises(ValueError):
+        importer.parse_report_row(_row(createdAt='어제'))
+
+
+def test_missing_user_is_rejected():
+    with pytest.raises(ValueError):
+        importer.parse_report_row(_row(userId='', email=None))
+
+
+def test_bad_rows_are_counted_and_good_rows_saved():
+    result, saved = _import_jsonl([
+        _row(),
+        '{not json',
+        '[1, 2]',
+        _row(rating='4.5'),
+        _row(createdAt='not-a-date'),
+        _row(programName=''),
+        _row(userId=7),
+    ])
+    assert result.rows_read == 7
+    assert result.rows_imported == len(saved) == 2
+    assert result.rows_rejected == 5
+    assert [row_number for row_number, _ in result.rejects] == [2, 3, 4, 5, 6]
+
+
+def test_csv_rows_are_numbered_after_header():
+    text = "userId,programName,experienceDate,jobField,rating,reportContent\nu1,체험,2025-01-10,IT,4,내용\nu2,체험,2025-01-10,IT,x,내용\n"
+    result = importer.import_reports(io.StringIO(text), 'csv', lambda values: None)
+    assert (result.rows_imported, result.rejects) == (1, [(3, "별점이 숫자가 아닙니다: x")])
+
+
+def test_detect_format_rejects_unknown_extension():
+    assert importer.detect_format('reports.JSON') == 'jsonl'
+    with pytest.raises(ValueError):
+        importer.detect_format('reports.xlsx')
@@ -0,0 +1,56 @@
+import io
+import json
+
+import pytest
+
+import importer
+from catalog import ProgramCatalog
+from programs import InMemoryProgramRepository, SQLiteProgramRepository, ProgramCatalogReplica
+from validation import PROGRAM_DUPLICATE_MESSAGE
+
+
+def _program(**overrides):
+    program = {'name': '드론 조종사 체험', 'field': '항공', 'description': '설명', 'date': '2025-03-01', 'location': '서울'}
+    program.update(overrides)
+    return program
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def repository(request, tmp_path):
+    if request.param == 'memory':
+        return InMemoryProgramRepository()
+    return SQLiteProgramRepository(str(tmp_path / 'programs.db'))
+
+
+def test_insert_new_programs_rejects_normalized_duplicates(repository):
+    saved, duplicates = repository.insert_new_programs([{**_program(), 'id': 'p1'}])
+    assert [program['id'] for program in saved] == ['p1'] and duplicates == []
+    same = {**_program(name='  드론  조종사 체험 ', location='서울'), 'id': 'p2'}
+    other_day = {**_program(date='2025-03-02'), 'id': 'p3'}
+    saved, duplicates = repository.insert_new_programs([same, other_day])
+    assert [program['id'] for program in saved] == ['p3']
+    assert duplicates == [same]
+
+
+def test_duplicates_inside_one_batch_are_rejected(repository):
+    saved, duplicates = repository.insert_new_programs([{**_program(), 'id': 'p1'}, {**_program(), 'id': 'p2'}])
+    assert [program['id'] for program in saved] == ['p1']
+    assert [program['id'] for program in duplicates] == ['p2']
+
+
+def test_reimporting_a_program_file_does_not_duplicate_the_catalog(repository):
+    replica = ProgramCatalogReplica(repository, ProgramCatalog())
+    text = '\n'.join(json.dumps(program, ensure_ascii=False) for program in [
+        _program(), _program(name='바리스타 체험', field='식음료'), _program(name='  드론 조종사   체험'),
+    ])
+    first = importer.import_programs(io.StringIO(text), 'jsonl', replica.add_new_programs)
+    assert (first.rows_imported, first.rejects) == (2, [(3, PROGRAM_DUPLICATE_MESSAGE)])
+    second = importer.import_programs(io.StringIO(text), 'jsonl', replica.add_new_programs)
+    assert (second.rows_imported, second.rows_rejected) == (0, 3)
+    assert len(replica.sync()) == 2
+
+
+def test_imported_programs_are_normalized():
+    program = importer.parse_program_row({**_program(name='  드론   조종사 ', location=' 서울 '), 'id': ' '})
+    assert (program['name'], program['location']) == ('드론 조종사', '서울')
+    assert program['id']
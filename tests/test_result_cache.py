@@ -0,0 +1,100 @@
+import pytest
+
+import result_cache
+from result_cache import ResultCache, TagVersions, SQLiteTagVersions, reports_tag, PROGRAMS_TAG
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingTagVersions(TagVersions):
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def get(self, tags):
+        self.reads += 1
+        return super().get(tags)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(result_cache.time, 'monotonic', clock)
+    return clock
+
+
+def _counting_compute(results):
+    def compute():
+        results.append(len(results))
+        return results[-1]
+    return compute
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = ResultCache(ttl_seconds=10)
+    computed = []
+    assert cache.get_or_compute('k', _counting_compute(computed)) == 0
+    clock.now += 9
+    assert cache.get_or_compute('k', _counting_compute(computed)) == 0
+    clock.now += 2
+    assert cache.get_or_compute('k', _counting_compute(computed)) == 1
+    assert cache.stats()['expired'] == 1
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResultCache(max_entries=2)
+    cache.get_or_compute('a', lambda: 'A')
+    cache.get_or_compute('b', lambda: 'B')
+    cache.get_or_compute('a', lambda: 'A2')  # a를 최근 사용으로
+    cache.get_or_compute('c', lambda: 'C')   # b가 축출됨
+    assert cache.get_or_compute('a', lambda: 'A3') == 'A'
+    assert cache.get_or_compute('b', lambda: 'B2') == 'B2'
+    assert cache.stats()['evicted'] >= 1
+
+
+def test_oversized_result_is_not_kept(clock):
+    cache = ResultCache(max_bytes=100)
+    cache.get_or_compute('big', lambda: 'x' * 1000)
+    assert cache.stats()['entries'] == 0
+
+
+def test_local_invalidation_is_visible_immediately(clock):
+    cache = ResultCache(version_check_seconds=60)
+    computed = []
+    tag = reports_tag('student@example.com')
+    cache.get_or_compute('page', _counting_compute(computed), tags=(tag,))
+    cache.invalidate(tag)
+    assert cache.get_or_compute('page', _counting_compute(computed), tags=(tag,)) == 1
+    assert cache.get_or_compute('other', lambda: 'x', tags=(PROGRAMS_TAG,)) == 'x'
+    cache.invalidate(tag)
+    assert cache.get_or_compute('other', lambda: 'y', tags=(PROGRAMS_TAG,)) == 'x'
+
+
+def test_version_reads_are_throttled_per_tag(clock):
+    tag_versions = CountingTagVersions()
+    cache = ResultCache(tag_versions, version_check_seconds=1.0)
+    for _ in range(5):
+        cache.get_or_compute('page', lambda: 'v', tags=(PROGRAMS_TAG,))
+    assert tag_versions.reads == 1
+    clock.now += 1.5
+    cache.get_or_compute('page', lambda: 'v', tags=(PROGRAMS_TAG,))
+    assert tag_versions.reads == 2
+
+
+def test_writes_in_another_process_are_seen_after_check_interval(clock, tmp_path):
+    db_path = str(tmp_path / 'cache.db')
+    reader = ResultCache(SQLiteTagVersions(db_path), version_check_seconds=1.0)
+    writer = ResultCache(SQLiteTagVersions(db_path))
+    computed = []
+    reader.get_or_compute('programs', _counting_compute(computed), tags=(PROGRAMS_TAG,))
+    writer.invalidate(PROGRAMS_TAG)
+    assert reader.get_or_compute('programs', _counting_compute(computed), tags=(PROGRAMS_TAG,)) == 0
+    clock.now += 1.0
+    assert reader.get_or_compute('programs', _counting_compute(computed), tags=(PROGRAMS_TAG,)) == 1
+    assert reader.stats()['invalidated'] == 1
@@ -0,0 +1,24 @@
+from search import InvertedIndex, SearchService
+
+
+def test_single_hangul_character_query_matches_inside_words():
+    index = InvertedIndex()
+    index.add_document('space', [('우주 과학 체험', 1)])
+    index.add_document('actor', [('배우 직업 체험', 1)])
+    index.add_document('cook', [('요리사 체험', 1)])
+    assert {doc_id for doc_id, _ in index.search('우')} == {'space', 'actor'}
+    assert [doc_id for doc_id, _ in index.search('우주')] == ['space']
+
+
+def test_removed_document_leaves_no_character_postings():
+    index = InvertedIndex()
+    index.add_document('space', [('우주 과학', 1)])
+    index.remove_document('space')
+    assert index.search('우') == []
+    assert index._char_postings == {}
+
+
+def test_search_reports_with_one_character_query():
+    service = SearchService()
+    reports = [{'id': 'r1', 'programName': '우주 체험', 'reportContent': '재미있었다'}]
+    assert service.search_reports('student@example.com', '우', lambda: reports) == ['r1']
@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+pytest.importorskip('streamlit')
+os.environ.setdefault('JOBSTRAVELING_STORAGE', 'memory')
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import runtime  # noqa: E402
+
+APP_PATH = os.path.join(os.path.dirname(runtime.__file__), 'app.py')
+
+pytestmark = pytest.mark.skipif(runtime.STORAGE_BACKEND != 'memory', reason="메모리 백엔드에서만 실행합니다.")
+
+
+def _cookie_scripts(app):
+    return [element.proto.srcdoc for element in app.get('iframe') if runtime.SESSION_COOKIE_NAME in element.proto.srcdoc]
+
+
+def _login():
+    app = AppTest.from_file(APP_PATH, default_timeout=60)
+    app.run()
+    app.button(key='mock_login_normal').click().run()
+    return app
+
+
+def test_login_writes_session_cookie_and_keeps_token_out_of_url():
+    app = _login()
+    token = app.session_state['auth_token']
+    assert app.session_state['current_page'] == 'home'
+    assert token not in str(dict(app.query_params))
+    assert any(f"{runtime.SESSION_COOKIE_NAME}={token};" in script for script in _cookie_scripts(app))
+
+
+def test_new_connection_restores_session_from_cookie(monkeypatch):
+    token = _login().session_state['auth_token']
+    monkeypatch.setattr(runtime, 'read_session_cookie', lambda: token)
+    app = AppTest.from_file(APP_PATH, default_timeout=60)
+    app.run()
+    assert app.session_state['current_page'] == 'home'
+    assert app.session_state['auth_token'] == token
+
+
+def test_logout_clears_cookie_and_does_not_restore_it(monkeypatch):
+    app = _login()
+    token = app.session_state['auth_token']
+    # 이 연결은 로그인 전에 쿠키 없이 열렸지만, 새로고침 뒤라면 연결 요청에 쿠키가 실려 옵니다.
+    monkeypatch.setattr(runtime, 'read_session_cookie', lambda: token)
+    app.button(key='logout_btn').click().run()
+    assert app.session_state['current_page'] == 'login'
+    assert app.session_state['auth_token'] is None
+    assert any('Max-Age=0' in script for script in _cookie_scripts(app))
+    app.run()
+    assert app.session_state['auth_token'] is None
+
+
+def test_revoked_cookie_is_ignored(monkeypatch):
+    monkeypatch.setattr(runtime, 'read_session_cookie', lambda: 'unknown-token')
+    app = AppTest.from_file(APP_PATH, default_timeout=60)
+    app.run()
+    assert app.session_state['current_page'] == 'login'
+    assert any('Max-Age=0' in script for script in _cookie_scripts(app))
@@ -0,0 +1,88 @@
+import pytest
+
+from storage import InMemoryReportRepository, SQLiteReportRepository
+from validation import UNSPECIFIED_JOB_FIELD
+
+
+def _report(created_at, **overrides):
+    report = {'programName': '체험', 'experienceDate': '2025-01-10', 'jobField': 'IT', 'rating': 4,
+              'reportContent': '내용', 'createdAt': created_at}
+    report.update(overrides)
+    return report
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def repository(request, tmp_path):
+    if request.param == 'memory':
+        return InMemoryReportRepository()
+    return SQLiteReportRepository(str(tmp_path / 'reports.db'))
+
+
+def test_sqlite_count_reports_reads_summary(tmp_path):
+    repository = SQLiteReportRepository(str(tmp_path / 'reports.db'))
+    assert repository.count_reports('a@example.com') == 0
+    repository.add_reports([('a@example.com', _report('2025-01-10T09:00:00')),
+                            ('a@example.com', _report('2025-01-11T09:00:00', jobField=None)),
+                            ('b@example.com', _report('2025-01-12T09:00:00'))])
+    assert repository.count_reports('a@example.com') == 2
+    assert repository.count_reports('b@example.com') == 1
+    # 요약 행만 바꿔도 결과가 바뀌면 reports 테이블을 세지 않는다는 뜻입니다.
+    repository._conn.execute("UPDATE report_summaries SET report_count = 7 WHERE user_id = 'a@example.com'")
+    assert repository.count_reports('a@example.com') == 7
+
+
+def test_iter_reports_can_skip_report_content(repository):
+    repository.add_reports([('a@example.com', _report('2025-01-10T09:00:00', schoolName='일반 고등학교')),
+                            ('b@example.com', _report('2025-01-11T09:00:00', schoolName='다른 고등학교'))])
+    full = list(repository.iter_reports())
+    headers = list(repository.iter_reports(include_content=False))
+    assert [report['reportContent'] for report in full] == ['내용', '내용']
+    assert all('reportContent' not in report for report in headers)
+    assert [(report['userId'], report['rating']) for report in headers] == [('a@example.com', 4), ('b@example.com', 4)]
+    assert [report['userId'] for report in repository.iter_reports('다른 고등학교', include_content=False)] == ['b@example.com']
+
+
+def test_missing_job_field_is_counted_under_the_same_key(repository):
+    repository.add_reports([('a@example.com', _report('2025-01-10T09:00:00', jobField='')),
+                            ('a@example.com', _report('2025-01-11T09:00:00', jobField=None)),
+                            ('a@example.com', _report('2025-01-12T09:00:00'))])
+    assert repository.get_summary('a@example.com')['jobFieldCounts'] == {UNSPECIFIED_JOB_FIELD: 2, 'IT': 1}
+
+
+@pytest.mark.parametrize('rating', ['4', 4.5, True])
+def test_non_integer_ratings_are_rejected_by_every_backend(repository, rating):
+    with pytest.raises(TypeError):
+        repository.add_reports([('a@example.com', _report('2025-01-10T09:00:00')),
+                                ('a@example.com', _report('2025-01-11T09:00:00', rating=rating))])
+    assert repository.count_reports('a@example.com') == 0
+
+
+def test_sqlite_merges_legacy_empty_job_field_counts(tmp_path):
+    path = str(tmp_path / 'reports.db')
+    repository = SQLiteReportRepository(path)
+    repository.add_reports([('a@example.com', _report('2025-01-10T09:00:00', jobField=None))])
+    # 예전 버전이 빈 문자열로 센 요약 행
+    repository._conn.execute("INSERT INTO report_field_counts VALUES ('a@example.com', '', 3)")
+    repository._conn.commit()
+    repository._conn.close()
+    assert SQLiteReportRepository(path).get_summary('a@example.com')['jobFieldCounts'] == {UNSPECIFIED_JOB_FIELD: 4}
+
+
+def test_get_report_by_id_checks_the_owner(repository):
+    saved = repository.add_reports([('a@example.com', _report('2025-01-10T09:00:00')),
+                                    ('b@example.com', _report('2025-01-11T09:00:00', jobField='항공'))])
+    report = repository.get_report(saved[1]['id'])
+    assert (report['userId'], report['jobField'], report['reportContent']) == ('b@example.com', '항공', '내용')
+    assert repository.get_report(saved[1]['id'], 'b@example.com') == report
+    assert repository.get_report(saved[1]['id'], 'a@example.com') is None
+    assert repository.get_report('01ARZ3NDEKTSV4RRFFQ69G5FAV') is None
+
+
+def test_report_ids_keep_created_at_order(repository):
+    # 가져오기처럼 과거 createdAt이 나중에 저장되어도 목록은 ID(= createdAt) 순서입니다.
+    created = ['2025-01-12T09:00:00', '2025-01-10T09:00:00', '2025-01-11T09:00:00', '2025-01-11T09:00:00.001']
+    saved = repository.add_reports([('a@example.com', _report(value)) for value in created])
+    assert sorted(report['id'] for report in saved) == [report['id'] for report in sorted(saved, key=lambda r: r['createdAt'])]
+    headers, _ = repository.list_report_headers('a@example.com')
+    assert [report['createdAt'] for report in headers] == sorted(created, reverse=True)
+    assert [report['createdAt'] for report in repository.list_reports('a@example.com')] == sorted(created, reverse=True)
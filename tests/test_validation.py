@@ -0,0 +1,43 @@
+import pytest
+
+from validation import prepare_report, validate_report, REPORT_CONTENT_MAX_CHARS, REPORT_RATING_MESSAGE
+
+
+def _report(**overrides):
+    report = {'programName': '체험', 'experienceDate': '2025-01-10', 'jobField': 'IT', 'rating': 4, 'reportContent': '내용'}
+    report.update(overrides)
+    return report
+
+
+@pytest.mark.parametrize('rating', ['5', 4.5, True, -1, 6, [5]])
+def test_rating_must_be_int_between_0_and_5(rating):
+    assert validate_report(_report(rating=rating)) == REPORT_RATING_MESSAGE
+
+
+@pytest.mark.parametrize('rating', [0, 5])
+def test_rating_bounds_are_inclusive(rating):
+    assert validate_report(_report(rating=rating)) is None
+
+
+def test_text_fields_must_be_strings():
+    assert validate_report(_report(programName=['체험'])) is not None
+    assert validate_report(_report(reportContent={'text': '내용'})) is not None
+
+
+def test_report_content_length_is_capped():
+    assert validate_report(_report(reportContent='가' * REPORT_CONTENT_MAX_CHARS)) is None
+    assert validate_report(_report(reportContent='가' * (REPORT_CONTENT_MAX_CHARS + 1))) is not None
+
+
+def test_prepare_report_rejects_unknown_fields():
+    report, error_message = prepare_report(_report(id='forged', createdAt='2000-01-01T00:00:00'), {})
+    assert report is None and 'createdAt' in error_message and 'id' in error_message
+
+
+def test_prepare_report_takes_author_fields_from_profile():
+    profile = {'schoolName': '한빛중학교', 'classNumber': '3', 'studentName': '홍길동'}
+    report, error_message = prepare_report(_report(), profile)
+    assert error_message is None
+    assert {key: report[key] for key in profile} == profile
+    report, _ = prepare_report(_report(), None)
+    assert report['schoolName'] is None and report['studentName'] is None
@@ -0,0 +1,66 @@
+import sqlite3
+
+import pytest
+
+from storage import InMemoryReportRepository
+from writer import ReportWriteQueue, InvalidReportError, WriteFailedError
+
+
+def _report(**overrides):
+    report = {'programName': '체험', 'experienceDate': '2025-01-10', 'jobField': 'IT', 'rating': 4,
+              'reportContent': '내용', 'createdAt': '2025-01-10T09:00:00'}
+    report.update(overrides)
+    return report
+
+
+def test_failed_batch_only_fails_the_offending_report():
+    repository = InMemoryReportRepository()
+    saved = []
+    # flush 주기를 길게 두어 두 요청이 같은 배치에 담기게 합니다.
+    writer = ReportWriteQueue(repository.add_reports, on_saved=lambda user_id, report: saved.append(report['id']),
+                              flush_seconds=0.5)
+    try:
+        good = writer.submit('student@example.com', _report())
+        bad = writer.submit('student@example.com', _report(createdAt=None))  # 저장소에서 거부되는 리포트
+        good_report = good.result(5)
+        with pytest.raises(ValueError):
+            bad.result(5)
+    finally:
+        writer.close()
+
+    assert repository.count_reports('student@example.com') == 1
+    assert saved == [good_report['id']]
+    metrics = writer.metrics()
+    assert metrics['written'] == 1 and metrics['failed'] == 1
+
+
+def test_storage_error_is_raised_as_write_failed():
+    def locked(items):
+        raise sqlite3.OperationalError('database is locked')
+
+    writer = ReportWriteQueue(locked)
+    try:
+        with pytest.raises(WriteFailedError) as error:
+            writer.save('student@example.com', _report(), timeout=5)
+    finally:
+        writer.close()
+    assert isinstance(error.value.__cause__, sqlite3.OperationalError)
+
+
+def test_invalid_report_is_rejected_before_enqueue():
+    repository = InMemoryReportRepository()
+    writer = ReportWriteQueue(repository.add_reports)
+    try:
+        with pytest.raises(InvalidReportError):
+            writer.submit('student@example.com', _report(reportContent=''))
+    finally:
+        writer.close()
+    assert repository.count_reports('student@example.com') == 0
+
+
+def test_in_memory_add_reports_is_all_or_nothing():
+    repository = InMemoryReportRepository()
+    with pytest.raises(TypeError):
+        repository.add_reports([('a@example.com', _report()), ('a@example.com', _report(rating='5'))])
+    assert repository.count_reports('a@example.com') == 0
+    assert repository.data_version() == 0